@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request, Response
 from datetime import datetime
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
 from app.models.schema import Signal
-from app.models.schemas_api import SignalResponse, SignalUpdate, FilterOptionsResponse, MapDataResponse, MapMarker, HeatmapPoint, ScraperStatusResponse
+from app.models.schemas_api import SignalResponse, SignalUpdate, FilterOptionsResponse, MapDataResponse, MapMarker, HeatmapPoint, ScraperStatusResponse, SyncRunResponse
+from app.services import collector_state
 from app.services.beacon_collector import BeaconCollector
 
 router = APIRouter()
@@ -57,6 +60,8 @@ def get_filter_options(db: Session = Depends(get_db)):
 
 @router.get("/map-data", response_model=MapDataResponse)
 def get_map_data(
+    request: Request,
+    response: Response,
     status: str = None,
     min_priority: float = None,
     db: Session = Depends(get_db)
@@ -65,7 +70,9 @@ def get_map_data(
     Get optimized map data for visualization.
 
     Returns signals with coordinates as markers and heatmap points.
-    Only returns signals that have been successfully geocoded.
+    Only returns signals that have been successfully geocoded; signals still
+    waiting for the geocoding worker appear once it bumps the map-data version.
+    Responses carry an ETag, and a matching If-None-Match gets 304 Not Modified.
 
     Args:
         status: Optional filter by triage_status
@@ -87,6 +94,15 @@ def get_map_data(
     if min_priority is not None:
         query = query.filter(Signal.priority_score >= min_priority)
 
+    # Version covers collector and geocoding-worker writes; count and max(updated_at) cover triage edits
+    version = collector_state.get_state(db, collector_state.MAP_DATA_VERSION_KEY, 0)
+    count, last_updated = query.with_entities(func.count(Signal.id), func.max(Signal.updated_at)).one()
+    fingerprint = f"{version}:{count}:{last_updated}:{status}:{min_priority}"
+    etag = f'W/"{hashlib.md5(fingerprint.encode("utf-8")).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     signals = query.all()
 
     # Build markers
@@ -123,6 +139,27 @@ def get_map_data(
         total_signals=len(signals)
     )
 
+@router.get("/scraper-status", response_model=ScraperStatusResponse)
+def get_scraper_status(db: Session = Depends(get_db)):
+    """Get current scraper status and last sync information, shared by all worker processes"""
+    collector = BeaconCollector(db)
+    status = collector.get_status()
+
+    # Calculate if sync is allowed now
+    can_sync_now = not status['is_active']
+    if status['next_allowed_sync_at']:
+        can_sync_now = can_sync_now and datetime.utcnow() >= status['next_allowed_sync_at']
+
+    return ScraperStatusResponse(
+        **status,
+        can_sync_now=can_sync_now
+    )
+
+@router.get("/sync-runs", response_model=List[SyncRunResponse])
+def get_sync_runs(limit: int = Query(20, ge=1, le=200), db: Session = Depends(get_db)):
+    """Beacon poll history, newest first"""
+    return BeaconCollector(db).get_sync_history(limit)
+
 @router.get("/{signal_id}", response_model=SignalResponse)
 def get_signal(signal_id: str, db: Session = Depends(get_db)):
     signal = db.query(Signal).filter(Signal.id == signal_id).first()
@@ -148,25 +185,10 @@ def triage_signal(signal_id: str, update: SignalUpdate, db: Session = Depends(ge
     db.commit()
     return {"message": f"Signal {signal_id} triaged successfully"}
 
-@router.get("/scraper-status", response_model=ScraperStatusResponse)
-def get_scraper_status(db: Session = Depends(get_db)):
-    """Get current scraper status and last sync information"""
-    collector = BeaconCollector(db)
-    status = collector.get_status()
-
-    # Calculate if sync is allowed now
-    can_sync_now = not status['is_active']
-    if status['next_allowed_sync_at']:
-        can_sync_now = can_sync_now and datetime.utcnow() >= status['next_allowed_sync_at']
-
-    return ScraperStatusResponse(
-        **status,
-        can_sync_now=can_sync_now
-    )
-
 @router.post("/poll-beacon")
-async def poll_beacon(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+def poll_beacon(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """Manually trigger a Beacon poll in the background"""
+    # Plain def: FastAPI runs the status queries in its threadpool; the async poll still runs on the loop
     collector = BeaconCollector(db)
     status = collector.get_status()
 
@@ -181,7 +203,7 @@ async def poll_beacon(background_tasks: BackgroundTasks, db: Session = Depends(g
             detail=f"Rate limited. Try again in {int(remaining)} seconds"
         )
 
-    background_tasks.add_task(collector.fetch_and_process)
+    background_tasks.add_task(collector.fetch_and_process_async)
     return {
         "message": "Beacon sync started in background",
         "status": "started"
@@ -1,11 +1,12 @@
 import asyncio
-import os
-import random
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import Base, SessionLocal, engine
-from app.services.beacon_collector import BeaconCollector
+from app.database import Base, engine
+from app.services.browser_pool import close_browser_pool
+from app.services.scraper_client import close_scraper_client
+from app.workers import geocoding_worker
+from app.workers.poll_scheduler import beacon_poll_loop
 
 # Create tables (for local development, ideally use Alembic for production)
 Base.metadata.create_all(bind=engine)
@@ -22,28 +23,16 @@ app.add_middleware(
 )
 
 
-async def beacon_poll_loop() -> None:
-    enabled = os.getenv("ENABLE_BEACON_POLLING", "1").lower() in {"1", "true", "yes"}
-    if not enabled:
-        return
-
-    interval_minutes = int(os.getenv("BEACON_POLL_INTERVAL_MINUTES", "15"))
-    jitter_seconds = int(os.getenv("BEACON_POLL_JITTER_SECONDS", "30"))
-    while True:
-        db = SessionLocal()
-        try:
-            BeaconCollector(db).fetch_and_process()
-        finally:
-            db.close()
-        sleep_seconds = interval_minutes * 60
-        if jitter_seconds > 0:
-            sleep_seconds += random.randint(0, jitter_seconds)
-        await asyncio.sleep(sleep_seconds)
-
-
 @app.on_event("startup")
 async def start_background_polling() -> None:
     asyncio.create_task(beacon_poll_loop())
+    asyncio.create_task(geocoding_worker.geocoding_worker_loop())
+
+
+@app.on_event("shutdown")
+async def stop_scraper_resources() -> None:
+    await close_browser_pool()
+    await close_scraper_client()
 
 @app.get("/")
 def read_root():
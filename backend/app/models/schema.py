@@ -8,11 +8,13 @@ class Signal(Base):
     __tablename__ = "signals"
     __table_args__ = (
         Index('idx_signals_coords', 'latitude', 'longitude'),
+        Index('ix_signals_country_location', 'country', 'location'),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     beacon_event_id = Column(String(255), unique=True)
     source_url = Column(Text, nullable=False)
+    source_url_hash = Column(String(32), index=True)  # md5(source_url), for batch dedup
     raw_data = Column(JSON, nullable=False)
     
     disease = Column(String(255), nullable=False)
@@ -39,15 +41,16 @@ class Signal(Base):
     saudi_risk_level = Column(String(20))
     
     current_status = Column(String(50), default="New")
+    content_fingerprint = Column(String(32))  # md5 of Beacon-owned fields, detects revised case/death counts
     
     # Geocoding columns
     latitude = Column(Numeric(10, 7))
     longitude = Column(Numeric(10, 7))
     geocoded_at = Column(DateTime(timezone=True))
-    geocode_source = Column(String(50))
+    geocode_source = Column(String(50), index=True)  # 'pending' rows are picked up by the geocoding worker
     location_hash = Column(String(32), index=True)
 
-    created_at = Column(DateTime(timezone=True), default=datetime.datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=datetime.datetime.utcnow, index=True)  # newest IDs sent to the remote scraper
     updated_at = Column(DateTime(timezone=True), default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     last_beacon_sync = Column(DateTime(timezone=True))
 
@@ -186,3 +189,54 @@ class AuditLog(Base):
     __table_args__ = (
         Index('idx_audit_entity', 'entity_type', 'entity_id'),
     )
+
+class CollectorState(Base):
+    """Small key/value store for collector bookkeeping that must survive restarts."""
+    __tablename__ = "collector_state"
+
+    key = Column(String(100), primary_key=True)
+    value = Column(JSON)
+    updated_at = Column(DateTime(timezone=True), default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+class SyncRun(Base):
+    """One Beacon poll: timing, outcome and counts, newest first by started_at."""
+    __tablename__ = "sync_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    started_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    finished_at = Column(DateTime(timezone=True))
+    status = Column(String(20), nullable=False, default="running")  # running, success, failed
+    holder = Column(String(255))  # process that held the poll lease
+    events_seen = Column(Integer, default=0)
+    inserted_count = Column(Integer, default=0)
+    updated_count = Column(Integer, default=0)
+    error = Column(Text)
+    stage_durations = Column(JSON)  # seconds per pipeline stage, e.g. {"fetch": 8.2, "parse": 0.4}
+    counters = Column(JSON)  # e.g. {"candidates_json": 40, "geocode_cache_hits": 12, "render_blocked": 85}
+
+class CollectorLease(Base):
+    """Time-limited lock held by one process at a time, e.g. the right to poll Beacon."""
+    __tablename__ = "collector_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(255), nullable=False)  # hostname:pid:nonce of the owning process
+    acquired_at = Column(DateTime(timezone=True))
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+class GeocodeCache(Base):
+    """Geocoding results keyed by location_hash, independent of signal volume."""
+    __tablename__ = "geocode_cache"
+
+    location_hash = Column(String(32), primary_key=True)
+    country = Column(String(100))
+    location = Column(String(255))
+    latitude = Column(Numeric(10, 7))
+    longitude = Column(Numeric(10, 7))
+    geocode_source = Column(String(50))  # how the entry was resolved: location, country, failed
+    precision = Column(String(20))  # location or country; NULL for failed lookups
+    hit_count = Column(Integer, default=0)
+    failure_count = Column(Integer, default=0)  # consecutive failed lookups of the specific location
+    last_hit_at = Column(DateTime(timezone=True))
+    expires_at = Column(DateTime(timezone=True), index=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime, date
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 
 class SignalBase(BaseModel):
     disease: str
@@ -232,5 +232,24 @@ class ScraperStatusResponse(BaseModel):
     last_sync_at: Optional[datetime] = None
     last_sync_error: Optional[str] = None
     last_sync_count: int = 0
+    last_sync_stage_durations: Optional[Dict[str, float]] = None
+    last_sync_counters: Optional[Dict[str, int]] = None
     next_allowed_sync_at: Optional[datetime] = None
     can_sync_now: bool
+
+
+class SyncRunResponse(BaseModel):
+    """One Beacon poll from the sync history"""
+    id: UUID
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    status: str
+    holder: Optional[str] = None
+    events_seen: int = 0
+    inserted_count: int = 0
+    updated_count: int = 0
+    error: Optional[str] = None
+    stage_durations: Optional[Dict[str, float]] = None
+    counters: Optional[Dict[str, int]] = None
+
+    model_config = ConfigDict(from_attributes=True)
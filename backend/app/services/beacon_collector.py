@@ -1,128 +1,411 @@
+import asyncio
 import datetime
 import hashlib
 import json
 import logging
 import os
 import re
-from typing import Any, Dict, Iterable, List, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
-import httpx
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
-from sqlalchemy import func
+from sqlalchemy import delete, insert, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from app.models.schema import Signal
-from app.services import notification_service
-from app.services.geocoding_service import geocode_signal_location
+from app.models.schema import Signal, SyncRun
+from app.services import collector_state, lease, notification_service
+from app.services.browser_pool import close_browser_pool, get_browser_pool
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.geocoding_service import geocode_locations
+from app.services.poll_metrics import PollMetrics
+from app.services.render_profile import RenderProfile
+from app.services.scraper_client import close_scraper_client, get_scraper_client
 
 logger = logging.getLogger(__name__)
 
 EMAIL_RE = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
 PHONE_RE = re.compile(r"\b(?:\+?\d[\d\s().-]{6,}\d)\b")
 DROP_KEYWORDS = {"name", "email", "phone", "mobile", "contact", "address", "patient", "reporter"}
+CAPTURE_MODES = {"api", "dom"}
+FETCH_MODES = {"local", "remote"}
+# Beacon-owned fields hashed into content_fingerprint; triage and geocoding fields are ours
+FINGERPRINT_FIELDS = (
+    "disease", "country", "location", "date_onset", "cases", "deaths", "description", "outbreak_status",
+)
+# Fields rewritten when Beacon revises an event we already store; covers every FINGERPRINT_FIELDS entry
+REVISABLE_FIELDS = (
+    "disease", "country", "location", "cases", "deaths", "case_fatality_rate", "priority_score", "description",
+    "outbreak_status", "date_onset", "raw_data", "content_fingerprint", "last_beacon_sync",
+)
+# Also rewritten when a revision moves the event to another country or location
+GEOCODE_FIELDS = ("latitude", "longitude", "geocoded_at", "geocode_source", "location_hash")
+PAYLOAD_FINGERPRINT_KEY = "beacon.payload_fingerprint"
+CANDIDATE_FINGERPRINTS_KEY = "beacon.candidate_fingerprints"
+# Only the process holding this lease polls Beacon
+POLL_LEASE_NAME = "beacon.poll"
+# Keeps IN (...) lists under driver parameter limits (SQLite allows 999 by default on older builds)
+IN_CLAUSE_CHUNK_SIZE = 500
+DATA_RESOURCE_TYPES = {"xhr", "fetch"}
+
+T = TypeVar("T")
+
+# Parsing, geocoding and DB writes are blocking; they run here instead of on the API event loop.
+_worker_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("BEACON_WORKER_THREADS", "2")),
+    thread_name_prefix="beacon-worker",
+)
+
+# Fails polls fast while Beacon or the scraper sidecar is down instead of waiting out every render timeout
+beacon_fetch_breaker = CircuitBreaker(
+    "beacon_fetch",
+    failure_threshold=int(os.getenv("BEACON_BREAKER_FAILURES", "3")),
+    reset_timeout_seconds=float(os.getenv("BEACON_BREAKER_RESET_SECONDS", "900")),
+)
+
+
+def calculate_url_hash(url: str) -> str:
+    """MD5 of a source URL; matches Postgres md5(source_url) for the migration backfill."""
+    return hashlib.md5(url.encode("utf-8")).hexdigest()
+
+
+def _chunked(values: List[T], size: int) -> Iterator[List[T]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+@dataclass
+class BeaconPayload:
+    """Raw material from one Beacon fetch: intercepted API JSON and/or rendered HTML."""
+
+    html: str = ""
+    json_payloads: List[Any] = field(default_factory=list)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    request_stats: Dict[str, Any] = field(default_factory=dict)
 
 
 class BeaconCollector:
-    _last_sync_at: Optional[datetime.datetime] = None
-    _sync_in_progress: bool = False
-    _last_sync_error: Optional[str] = None
-    _last_sync_count: int = 0
-
     def __init__(self, db: Session):
         self.db = db
-        self.scraper_base_url = os.getenv("SCRAPER_BASE_URL", "http://localhost:8787").rstrip("/")
+        # "remote" sends rendering to the scraper sidecar at SCRAPER_BASE_URL instead of in-process Chromium
+        fetch_mode = os.getenv("BEACON_FETCH_MODE", "local").lower()
+        self.fetch_mode = fetch_mode if fetch_mode in FETCH_MODES else "local"
+        self.known_id_hint_size = int(os.getenv("BEACON_KNOWN_ID_HINT_SIZE", "200"))
         self.beacon_path = os.getenv("BEACON_EVENTS_PATH", "/en/events")
         self.render = os.getenv("BEACON_RENDER", "1").lower() in {"1", "true", "yes"}
         self.wait = os.getenv("BEACON_WAIT", "networkidle")
         self.timeout_ms = int(os.getenv("BEACON_TIMEOUT_MS", "15000"))
+        # Shortest gap between polls for manual /poll-beacon triggers; the poll scheduler passes its own floor
         self.min_interval_minutes = int(os.getenv("BEACON_MIN_INTERVAL_MINUTES", "15"))
+        # "api" records the page's JSON XHR responses and only serializes the DOM when they hold no events
+        capture_mode = os.getenv("BEACON_CAPTURE_MODE", "api").lower()
+        self.capture_mode = capture_mode if capture_mode in CAPTURE_MODES else "api"
+        self.api_url_pattern = re.compile(os.getenv("BEACON_API_URL_PATTERN", r"."))
+        self.render_profile = RenderProfile.from_env()
+        self.max_scrolls = int(os.getenv("BEACON_MAX_SCROLLS", "10"))
+        self.scroll_settle_ms = int(os.getenv("BEACON_SCROLL_SETTLE_MS", "5000"))
+        # Store signals before slow geocoder lookups; app/workers/geocoding_worker.py fills coordinates later
+        self.defer_geocoding = os.getenv("GEOCODE_DEFERRED", "1").lower() in {"1", "true", "yes"}
+        # Longer than the slowest poll; a crashed poller blocks the others for at most this long
+        self.lease_ttl_seconds = int(os.getenv("BEACON_POLL_LEASE_SECONDS", "900"))
+        # Fresh per poll, so a manual and a scheduled poll in one process do not share the lease
+        self.lease_holder = lease.new_holder()
+        self.sync_run_retention_days = int(os.getenv("SYNC_RUN_RETENTION_DAYS", "90"))
+        # Stage timings and counters of the current poll, written to its sync_runs row
+        self.metrics = PollMetrics()
+        # Why the last fetch_and_process_async() call did not poll: "min_interval", "lease_held" or None
+        self.skip_reason: Optional[str] = None
 
     def fetch_and_process(self) -> int:
-        """Fetch, parse, sanitize, and persist Beacon events."""
-        if self._should_skip_poll():
+        """Blocking entry point for scripts; runs the async pipeline on a private event loop."""
+
+        async def run_once() -> int:
+            try:
+                return await self.fetch_and_process_async()
+            finally:
+                await close_browser_pool()
+                await close_scraper_client()
+
+        return asyncio.run(run_once())
+
+    async def fetch_and_process_async(self, min_interval_minutes: Optional[float] = None) -> int:
+        """Fetch, parse, sanitize, and persist Beacon events without blocking the event loop.
+
+        Rendering uses async Playwright; parsing, geocoding and persistence run in
+        the collector worker pool. Only the process holding the beacon.poll lease
+        polls; every other process skips and returns 0. A skipped call sets
+        skip_reason. min_interval_minutes overrides BEACON_MIN_INTERVAL_MINUTES.
+        """
+        self.skip_reason = None
+        if await self._run_in_worker(self._should_skip_poll, min_interval_minutes):
+            self.skip_reason = "min_interval"
+            return 0
+        self.lease_holder = lease.new_holder()
+        if not await self._run_in_worker(self._acquire_poll_lease):
+            logger.info("Another process is polling Beacon, skipping poll.")
+            self.skip_reason = "lease_held"
+            return 0
+        # Checked again under the lease: another process may have polled since the first check
+        if await self._run_in_worker(self._should_skip_poll, min_interval_minutes):
+            await self._run_in_worker(self._release_poll_lease)
+            self.skip_reason = "min_interval"
             return 0
 
-        BeaconCollector._sync_in_progress = True
+        run_id: Optional[uuid.UUID] = None
         try:
-            logger.info("Polling WHO Beacon via scraper service...")
-            BeaconCollector._last_sync_at = datetime.datetime.utcnow()
-            events = self._scrape_events()
-            normalized = self._normalize_events(events)
-
-            new_count = 0
-            for event in normalized:
-                if not self._is_duplicate(event):
-                    self._create_signal(event)
-                    new_count += 1
-
-            self.db.commit()
+            # Inside the try, so a failure recording the run still releases the lease
+            run_id = await self._run_in_worker(self._start_sync_run)
+            with self.metrics.stage("total"):
+                logger.info("Polling WHO Beacon via scraper service...")
+                with self.metrics.stage("fetch"):
+                    payload = await self._fetch_beacon_payload()
+                self.metrics.merge_counters(payload.request_stats, prefix="render_")
+
+                with self.metrics.stage("parse"):
+                    events = await self._run_in_worker(self._parse_payload, payload)
+
+                if not await self._run_in_worker(self._renew_poll_lease):
+                    raise RuntimeError("Beacon poll lease lost before processing")
+                new_count = await self._run_in_worker(self._process_events, events)
             logger.info("Poll complete. Found %s new signals.", new_count)
+            logger.info(f"Beacon poll metrics: {self.metrics.summary()}")
 
-            BeaconCollector._last_sync_count = new_count
-            BeaconCollector._last_sync_error = None
+            await self._run_in_worker(self._finish_sync_run, run_id, "success", None)
             return new_count
         except Exception as e:
-            BeaconCollector._last_sync_error = str(e)
             logger.error(f"Beacon sync failed: {e}")
+            logger.info(f"Beacon poll metrics: {self.metrics.summary()}")
+            if run_id is not None:
+                await self._run_in_worker(self._finish_sync_run, run_id, "failed", str(e))
             raise
         finally:
-            BeaconCollector._sync_in_progress = False
+            await self._run_in_worker(self._release_poll_lease)
 
-    def _scrape_events(self) -> List[Dict[str, Any]]:
-        html = self._fetch_beacon_html()
-        return self._parse_events(html)
+    async def _run_in_worker(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_worker_executor, func, *args)
 
-    def _fetch_beacon_html(self) -> str:
+    def _process_events(self, events: List[Dict[str, Any]]) -> int:
+        """Normalize, deduplicate and bulk-insert parsed events in one transaction. Runs in a worker thread.
+
+        Candidates unchanged since the previous poll are dropped before normalization,
+        and a payload identical to the previous one ends the poll here.
+        """
+        self.metrics.count("events_seen", len(events))
+        if not events:
+            return 0
+
+        with self.metrics.stage("fingerprint"):
+            payload_fingerprint = self._payload_fingerprint(events)
+            if payload_fingerprint == collector_state.get_state(self.db, PAYLOAD_FINGERPRINT_KEY):
+                logger.info("Beacon payload unchanged since last poll, skipping processing.")
+                self.metrics.count("payload_unchanged")
+                return 0
+
+            seen_fingerprints = set(collector_state.get_state(self.db, CANDIDATE_FINGERPRINTS_KEY, []))
+            candidate_fingerprints = [self._candidate_fingerprint(event) for event in events]
+            changed = [
+                event
+                for event, fingerprint in zip(events, candidate_fingerprints)
+                if fingerprint not in seen_fingerprints
+            ]
+        logger.info(f"{len(changed)} of {len(events)} Beacon candidates changed since last poll")
+        self.metrics.count("candidates_changed", len(changed))
+
+        normalized = self._normalize_events(changed)
+        with self.metrics.stage("dedup"):
+            new_events, changed_events = self._partition_events(normalized)
+
+        with self.metrics.stage("write"):
+            inserted_ids = self._insert_signals(new_events)
+            escalated_ids = self._update_changed_signals(changed_events)
+            self._notify_critical_signals(inserted_ids + escalated_ids)
+            if inserted_ids or changed_events:
+                collector_state.bump_version(self.db, collector_state.MAP_DATA_VERSION_KEY)
+
+            # Stored in the same transaction, so a failed poll is retried in full next time
+            collector_state.set_state(self.db, PAYLOAD_FINGERPRINT_KEY, payload_fingerprint)
+            collector_state.set_state(self.db, CANDIDATE_FINGERPRINTS_KEY, candidate_fingerprints)
+        with self.metrics.stage("commit"):
+            self.db.commit()
+        self.metrics.count("inserted", len(inserted_ids))
+        self.metrics.count("updated", len(changed_events))
+        self.metrics.count("duplicates", len(normalized) - len(new_events) - len(changed_events))
+        if changed_events:
+            logger.info(f"Updated {len(changed_events)} signals revised by Beacon")
+        return len(inserted_ids)
+
+    async def _fetch_beacon_payload(self) -> BeaconPayload:
+        """Fetch through the Beacon circuit breaker; raises CircuitOpenError while it is open."""
+        if not beacon_fetch_breaker.allow():
+            self.metrics.count("fetch_circuit_open")
+            raise CircuitOpenError(
+                f"Beacon fetch circuit open, next attempt in {beacon_fetch_breaker.retry_after():.0f}s"
+            )
+        try:
+            if self.fetch_mode == "remote":
+                payload = await self._fetch_remote_payload()
+            else:
+                payload = await self.render_beacon_page()
+        except Exception:
+            beacon_fetch_breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled (e.g. shutdown or a timeout): says nothing about Beacon, but must free a probe slot
+            beacon_fetch_breaker.release()
+            raise
+        beacon_fetch_breaker.record_success()
+        return payload
+
+    async def _fetch_remote_payload(self) -> BeaconPayload:
+        # The sidecar has no database, so send the newest stored IDs for its early-stop check
+        known_event_ids = await self._run_in_worker(self._recent_event_ids, self.known_id_hint_size)
+        logger.info(f"Requesting Beacon render from scraper service for {self.beacon_path}")
+        try:
+            result = await get_scraper_client().render(self.beacon_path, known_event_ids)
+        except Exception as e:
+            logger.error(f"Remote scraping failed: {e}")
+            raise
+        return BeaconPayload(
+            html=result.get("html") or "",
+            json_payloads=result.get("json_payloads") or [],
+            events=result.get("events") or [],
+            request_stats=result.get("request_stats") or {},
+        )
+
+    async def render_beacon_page(self, known_event_ids: Optional[Set[str]] = None) -> BeaconPayload:
+        """Render the Beacon feed in the pooled browser and capture its events.
+
+        Scrolling stops at the first already-stored event. Known IDs are looked up
+        in the database unless ``known_event_ids`` is given (scraper sidecar).
+        """
         # Direct connection to the target site using Playwright
         base_url = os.getenv("BEACON_BASE_URL", "https://beaconbio.org")
         url = f"{base_url}{self.beacon_path}"
         logger.info(f"Navigating to {url} with Playwright...")
 
-        browser = None
+        captured: List[Any] = []
+        pending: List[asyncio.Task] = []
+
+        async def capture(response: Any) -> None:
+            try:
+                captured.append(await response.json())
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable JSON response from {response.url}: {e}")
+
+        def on_response(response: Any) -> None:
+            if self._is_data_response(response):
+                pending.append(asyncio.ensure_future(capture(response)))
+
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
-                page = context.new_page()
+            async with get_browser_pool().page() as page:
+                request_log = await self.render_profile.apply(page)
+                if self.capture_mode == "api":
+                    page.on("response", on_response)
 
                 # Navigate and wait for network idle to ensure initial load
-                page.goto(url, wait_until=self.wait if self.wait in ["load", "domcontentloaded", "networkidle"] else "networkidle")
-
-                # Scroll to bottom to trigger lazy loading
-                # We'll do a few scrolls to ensure we get a good amount of data
-                # The user's example did one scroll, but real infinite scrolls might need more.
-                # Sticking to the user's example pattern but adding a small loop for robustness if needed.
-                # For now, following the user's explicit example:
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-
-                # Wait for potential new content.
-                # The user's example waited for a specific selector.
-                # Since we don't know the exact selector for new items definitively without seeing the live site,
-                # we'll wait for a generic short timeout or network idle again.
-                # However, to match the user's specific request "Wait for the data to actually appear",
-                # and knowing the structure from _parse_events (looking for article, .event-card, etc),
-                # we can try to wait for one of those if they are loaded dynamically.
-                # But if the page starts empty, we need to wait for at least one.
-                # If the page has initial data, this wait might return immediately.
-                # A safe bet is waiting for a short period for network requests to settle after scroll.
-                try:
-                    page.wait_for_load_state("networkidle", timeout=5000)
-                except Exception:
-                    logger.warning("Network idle timeout after scroll, proceeding with captured content.")
-
-                content = page.content()
-                return content
+                await page.goto(
+                    url,
+                    wait_until=self.wait if self.wait in ["load", "domcontentloaded", "networkidle"] else "networkidle",
+                    timeout=self.timeout_ms,
+                )
+
+                await self._settle_page(page, pending)
+
+                # Scroll until the feed reaches events we already store, stops growing,
+                # or the scroll budget runs out. Beacon lists newest events first.
+                collected: Dict[str, Dict[str, Any]] = {}
+                use_dom = self.capture_mode == "dom"
+                consumed = 0
+                html = ""
+                for step in range(self.max_scrolls + 1):
+                    if not use_dom:
+                        # Snapshot first: responses captured while the worker parses belong to the next step
+                        chunk = captured[consumed:]
+                        consumed += len(chunk)
+                        batch = await self._run_in_worker(self._extract_event_candidates, chunk)
+                        if not batch and not collected:
+                            logger.info("No events in captured Beacon API responses, falling back to DOM parsing")
+                            use_dom = True
+                    if use_dom:
+                        html = await page.content()
+                        batch = await self._run_in_worker(self._parse_events, html)
+
+                    new_events = {}
+                    for event in batch:
+                        event_id = self._candidate_event_id(event)
+                        if event_id not in collected:
+                            new_events[event_id] = event
+                    collected.update(new_events)
+                    if not new_events:
+                        break
+
+                    if known_event_ids is not None:
+                        known = known_event_ids.intersection(new_events)
+                    else:
+                        known = await self._run_in_worker(self._find_known_event_ids, list(new_events))
+                    if known:
+                        logger.info(f"Reached {len(known)} already stored events after {step} scrolls")
+                        break
+                    if step == self.max_scrolls:
+                        logger.warning(f"Scroll budget of {self.max_scrolls} exhausted before reaching known events")
+                        break
+
+                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                    await self._settle_page(page, pending)
+
+                request_stats = request_log.summary()
+                logger.info(
+                    "Beacon page requests: %s loaded, %s blocked, %s failed, %.0f ms total",
+                    request_stats["requests"],
+                    request_stats["blocked"],
+                    request_stats["failed"],
+                    request_stats["total_request_ms"],
+                )
+                logger.debug(f"Slowest Beacon page requests: {request_stats['slowest']}")
+
+                return BeaconPayload(
+                    html=html,
+                    json_payloads=captured,
+                    events=list(collected.values()),
+                    request_stats=request_stats,
+                )
         except Exception as e:
+            # Raised, not swallowed: the sidecar answers 500 (retried by the client) and the breaker counts it
             logger.error(f"Playwright scraping failed: {e}")
-            return ""
-        finally:
-            # Always close browser to prevent resource leak
-            if browser:
-                try:
-                    browser.close()
-                except Exception as close_err:
-                    logger.warning(f"Failed to close browser: {close_err}")
+            raise
+
+    async def _settle_page(self, page: Any, pending: List[asyncio.Task]) -> None:
+        # Give lazy-loaded content a short window to settle, then finish reading captured responses.
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.scroll_settle_ms)
+        except Exception:
+            logger.warning("Network idle timeout after scroll, proceeding with captured content.")
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            pending.clear()
+
+    def _is_data_response(self, response: Any) -> bool:
+        if response.request.resource_type not in DATA_RESOURCE_TYPES:
+            return False
+        content_type = (response.headers.get("content-type") or "").lower()
+        return "json" in content_type and self.api_url_pattern.search(response.url) is not None
+
+    def _parse_payload(self, payload: BeaconPayload) -> List[Dict[str, Any]]:
+        """Prefer events from intercepted API JSON; fall back to parsing the rendered DOM."""
+        if payload.events:
+            self.metrics.count("candidates_render", len(payload.events))
+            return payload.events
+        candidates = self._extract_event_candidates(payload.json_payloads)
+        if candidates:
+            self.metrics.count("candidates_json", len(candidates))
+            return candidates
+        events = self._parse_events(payload.html)
+        self.metrics.count("candidates_dom", len(events))
+        return events
 
     def _parse_events(self, html: str) -> List[Dict[str, Any]]:
         if not html:
@@ -216,20 +499,17 @@ class BeaconCollector:
         return candidates
 
     def _extract_event_candidates(self, data: Any) -> List[Dict[str, Any]]:
-        matches: List[Dict[str, Any]] = []
-
-        def walk(node: Any) -> None:
-            if isinstance(node, dict):
-                if self._looks_like_event(node):
-                    matches.append(node)
-                for value in node.values():
-                    walk(value)
-            elif isinstance(node, list):
-                for item in node:
-                    walk(item)
-
-        walk(data)
-        return matches
+        return list(self._iter_event_candidates(data))
+
+    def _iter_event_candidates(self, node: Any) -> Iterator[Dict[str, Any]]:
+        if isinstance(node, dict):
+            if self._looks_like_event(node):
+                yield node
+            for value in node.values():
+                yield from self._iter_event_candidates(value)
+        elif isinstance(node, list):
+            for item in node:
+                yield from self._iter_event_candidates(item)
 
     def _looks_like_event(self, node: Dict[str, Any]) -> bool:
         keys = {k.lower() for k in node.keys()}
@@ -237,73 +517,90 @@ class BeaconCollector:
 
     def _normalize_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         normalized: List[Dict[str, Any]] = []
-        for event in events:
-            disease = self._clean_text(event.get("disease"))
-            country = self._clean_text(event.get("country"))
-            if not disease or not country:
-                continue
+        # Redaction time is also counted in normalize
+        with self.metrics.stage("normalize"):
+            for event in events:
+                disease = self._clean_text(event.get("disease"))
+                country = self._clean_text(event.get("country"))
+                if not disease or not country:
+                    continue
 
-            location = self._clean_text(event.get("location"))
-            description = self._redact_text(event.get("description"))
-            cases = self._to_int(event.get("cases"))
-            deaths = self._to_int(event.get("deaths"))
-            date_reported = self._parse_date(event.get("date_reported")) or datetime.date.today()
-            date_onset = self._parse_date(event.get("date_onset"))
-            source_url = self._normalize_url(event.get("source_url") or event.get("url"))
-            beacon_event_id = self._derive_event_id(event, source_url, disease, date_reported)
-
-            case_fatality_rate = None
-            if cases > 0 and deaths >= 0:
-                case_fatality_rate = round((deaths / cases) * 100, 2)
-
-            # Geocode location (with cache-first DB lookup)
-            geocode_result = {}
-            try:
-                geocode_result = geocode_signal_location(country, location, db=self.db)
-            except Exception as e:
-                logger.error(f"Geocoding failed for {country}, {location}: {str(e)}")
-                # Fallback: try country-only geocoding
-                try:
-                    geocode_result = geocode_signal_location(country, None, db=self.db)
-                    logger.info(f"Using country-level fallback for {country}")
-                except Exception as fallback_err:
-                    logger.error(f"Country-level geocoding also failed: {fallback_err}")
-                    # Mark for manual review
-                    geocode_result = {
-                        "latitude": None,
-                        "longitude": None,
-                        "geocode_source": "FAILED - manual review needed"
-                    }
-
-            normalized_event = {
-                "beacon_event_id": beacon_event_id,
-                "source_url": source_url or self._fallback_source_url(),
-                "raw_data": self._build_raw_data(event),
-                "disease": disease,
-                "country": country,
-                "location": location,
-                "date_reported": date_reported,
-                "date_onset": date_onset,
-                "cases": cases,
-                "deaths": deaths,
-                "case_fatality_rate": case_fatality_rate,
-                "description": description,
-                "outbreak_status": self._clean_text(event.get("outbreak_status")),
-                "priority_score": self._calculate_priority(cases, case_fatality_rate),
-                "triage_status": "Pending Triage",
-                "current_status": "New",
-                "last_beacon_sync": datetime.datetime.utcnow(),
-                # Geocoding fields
+                location = self._clean_text(event.get("location"))
+                with self.metrics.stage("redact"):
+                    description = self._redact_text(event.get("description"))
+                    raw_data = self._build_raw_data(event)
+                cases = self._to_int(event.get("cases"))
+                deaths = self._to_int(event.get("deaths"))
+                date_reported = self._parse_date(event.get("date_reported")) or datetime.date.today()
+                date_onset = self._parse_date(event.get("date_onset"))
+                source_url = self._normalize_url(event.get("source_url") or event.get("url"))
+                beacon_event_id = self._derive_event_id(event, source_url, disease, date_reported)
+
+                case_fatality_rate = None
+                if cases > 0 and deaths >= 0:
+                    case_fatality_rate = round((deaths / cases) * 100, 2)
+
+                normalized_event = {
+                    "beacon_event_id": beacon_event_id,
+                    "source_url": source_url or self._fallback_source_url(),
+                    # Events without their own URL share the fallback URL, which must not count as a duplicate
+                    "source_url_hash": calculate_url_hash(source_url) if source_url else None,
+                    "raw_data": raw_data,
+                    "disease": disease,
+                    "country": country,
+                    "location": location,
+                    "date_reported": date_reported,
+                    "date_onset": date_onset,
+                    "cases": cases,
+                    "deaths": deaths,
+                    "case_fatality_rate": case_fatality_rate,
+                    "description": description,
+                    "outbreak_status": self._clean_text(event.get("outbreak_status")),
+                    "priority_score": self._calculate_priority(cases, case_fatality_rate),
+                    "triage_status": "Pending Triage",
+                    "current_status": "New",
+                    "last_beacon_sync": datetime.datetime.utcnow(),
+                }
+                normalized_event["content_fingerprint"] = self._content_fingerprint(normalized_event)
+                normalized.append(normalized_event)
+
+        # Geocode each unique (country, location) once, then fan the results back out.
+        # Deferred misses are stored as 'pending' and resolved by the geocoding worker.
+        geocode_stats: Dict[str, int] = {}
+        with self.metrics.stage("geocode"):
+            geocode_results = geocode_locations(
+                [(event["country"], event["location"]) for event in normalized],
+                db=self.db,
+                defer_misses=self.defer_geocoding,
+                stats=geocode_stats,
+            )
+        self.metrics.merge_counters(geocode_stats, prefix="geocode_")
+        for event in normalized:
+            geocode_result = geocode_results[(event["country"], event["location"])]
+            event.update({
                 "latitude": geocode_result.get("latitude"),
                 "longitude": geocode_result.get("longitude"),
                 "geocoded_at": geocode_result.get("geocoded_at"),
                 "geocode_source": geocode_result.get("geocode_source"),
                 "location_hash": geocode_result.get("location_hash"),
-            }
-            normalized.append(normalized_event)
+            })
 
         return normalized
 
+    def _candidate_fingerprint(self, event: Dict[str, Any]) -> str:
+        encoded = json.dumps(event, sort_keys=True, default=str)
+        return hashlib.md5(encoded.encode("utf-8")).hexdigest()
+
+    def _payload_fingerprint(self, events: List[Dict[str, Any]]) -> str:
+        encoded = json.dumps(events, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _content_fingerprint(self, event: Dict[str, Any]) -> str:
+        """Hash of the Beacon-owned fields; a change means Beacon revised the event."""
+        content = {field_name: event.get(field_name) for field_name in FINGERPRINT_FIELDS}
+        encoded = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.md5(encoded.encode("utf-8")).hexdigest()
+
     def _build_raw_data(self, event: Dict[str, Any]) -> Dict[str, Any]:
         sanitized = self._strip_sensitive_keys(event)
         return {
@@ -381,6 +678,13 @@ class BeaconCollector:
         digest = hashlib.sha256(base.encode("utf-8")).hexdigest()[:16]
         return f"beacon-{digest}"
 
+    def _candidate_event_id(self, event: Dict[str, Any]) -> str:
+        """Derive the beacon_event_id a raw candidate will be stored under."""
+        disease = self._clean_text(event.get("disease")) or ""
+        date_reported = self._parse_date(event.get("date_reported")) or datetime.date.today()
+        source_url = self._normalize_url(event.get("source_url") or event.get("url"))
+        return self._derive_event_id(event, source_url, disease, date_reported)
+
     def _fallback_source_url(self) -> str:
         return f"https://beaconbio.org{self.beacon_path}"
 
@@ -392,12 +696,14 @@ class BeaconCollector:
         score = (severity * 0.7) + (volume * 0.3)
         return round(min(100.0, score), 2)
 
-    def _should_skip_poll(self) -> bool:
+    def _should_skip_poll(self, min_interval_minutes: Optional[float] = None) -> bool:
         last_sync = self._get_last_sync_at()
         if not last_sync:
             return False
 
-        min_interval = datetime.timedelta(minutes=self.min_interval_minutes)
+        if min_interval_minutes is None:
+            min_interval_minutes = self.min_interval_minutes
+        min_interval = datetime.timedelta(minutes=min_interval_minutes)
         elapsed = datetime.datetime.utcnow() - last_sync
         if elapsed < min_interval:
             remaining = min_interval - elapsed
@@ -408,53 +714,229 @@ class BeaconCollector:
             return True
         return False
 
+    def _acquire_poll_lease(self) -> bool:
+        return lease.acquire(self.db, POLL_LEASE_NAME, self.lease_holder, self.lease_ttl_seconds)
+
+    def _renew_poll_lease(self) -> bool:
+        return lease.renew(self.db, POLL_LEASE_NAME, self.lease_holder, self.lease_ttl_seconds)
+
+    def _release_poll_lease(self) -> None:
+        # Rolls back first, so a failed transaction cannot keep the lease until it expires
+        self.db.rollback()
+        lease.release(self.db, POLL_LEASE_NAME, self.lease_holder)
+
+    def _start_sync_run(self) -> uuid.UUID:
+        """Record the poll in sync_runs right away, so other processes see when it started."""
+        self.metrics = PollMetrics()
+        run = SyncRun(
+            id=uuid.uuid4(), started_at=datetime.datetime.utcnow(), status="running", holder=self.lease_holder
+        )
+        self.db.add(run)
+        self.db.commit()
+        return run.id
+
+    def _finish_sync_run(self, run_id: uuid.UUID, status: str, error: Optional[str]) -> None:
+        """Store the poll outcome and metrics, and prune runs past retention.
+
+        A failed poll's transaction is rolled back first.
+        """
+        self.db.rollback()
+        now = datetime.datetime.utcnow()
+        counters = dict(self.metrics.counters)
+        self.db.execute(
+            update(SyncRun)
+            .where(SyncRun.id == run_id)
+            .values(
+                finished_at=now,
+                status=status,
+                error=error,
+                events_seen=counters.get("events_seen", 0),
+                inserted_count=counters.get("inserted", 0),
+                updated_count=counters.get("updated", 0),
+                stage_durations=self.metrics.rounded_durations(),
+                counters=counters,
+            )
+        )
+        self.db.execute(
+            delete(SyncRun).where(SyncRun.started_at < now - datetime.timedelta(days=self.sync_run_retention_days))
+        )
+        self.db.commit()
+
+    def _latest_sync_run(self, finished: bool = False) -> Optional[SyncRun]:
+        query = self.db.query(SyncRun)
+        if finished:
+            query = query.filter(SyncRun.finished_at.isnot(None))
+        return query.order_by(SyncRun.started_at.desc()).first()
+
     def _get_last_sync_at(self) -> Optional[datetime.datetime]:
-        last_db = self.db.query(func.max(Signal.last_beacon_sync)).scalar()
-        last_mem = BeaconCollector._last_sync_at
-        if last_db and last_mem:
-            return max(last_db, last_mem)
-        return last_db or last_mem
+        latest = self._latest_sync_run()
+        return latest.started_at.replace(tzinfo=None) if latest else None
+
+    def get_sync_history(self, limit: int = 20) -> List[SyncRun]:
+        """Most recent polls first."""
+        return self.db.query(SyncRun).order_by(SyncRun.started_at.desc()).limit(limit).all()
 
     def get_status(self) -> Dict[str, Any]:
-        """Get current scraper status and last sync information."""
-        last_sync = self._get_last_sync_at()
+        """Get current scraper status and last sync information, as seen by every worker process.
+
+        Reads the newest sync_runs rows through the started_at index.
+        """
+        latest = self._latest_sync_run()
+        last_sync = latest.started_at.replace(tzinfo=None) if latest else None
         next_allowed = None
         if last_sync:
             min_interval = datetime.timedelta(minutes=self.min_interval_minutes)
             next_allowed = last_sync + min_interval
 
+        # Count and error come from the last completed poll, not one still running
+        finished = latest if latest is None or latest.finished_at else self._latest_sync_run(finished=True)
         return {
-            "is_active": BeaconCollector._sync_in_progress,
+            "is_active": lease.current_holder(self.db, POLL_LEASE_NAME) is not None,
             "last_sync_at": last_sync,
-            "last_sync_error": BeaconCollector._last_sync_error,
-            "last_sync_count": BeaconCollector._last_sync_count,
+            "last_sync_error": finished.error if finished else None,
+            "last_sync_count": (finished.inserted_count or 0) if finished else 0,
+            "last_sync_stage_durations": finished.stage_durations if finished else None,
+            "last_sync_counters": finished.counters if finished else None,
             "next_allowed_sync_at": next_allowed,
         }
 
-    def _is_duplicate(self, event: Dict[str, Any]) -> bool:
-        beacon_event_id = event.get("beacon_event_id")
-        if beacon_event_id:
-            existing = (
-                self.db.query(Signal)
-                .filter(Signal.beacon_event_id == beacon_event_id)
-                .first()
+    def _recent_event_ids(self, limit: int) -> List[str]:
+        rows = (
+            self.db.query(Signal.beacon_event_id)
+            .filter(Signal.beacon_event_id.isnot(None))
+            .order_by(Signal.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [row[0] for row in rows]
+
+    def _find_known_event_ids(self, event_ids: List[str]) -> Set[str]:
+        known: Set[str] = set()
+        for chunk in _chunked(event_ids, IN_CLAUSE_CHUNK_SIZE):
+            rows = self.db.query(Signal.beacon_event_id).filter(Signal.beacon_event_id.in_(chunk)).all()
+            known.update(row[0] for row in rows)
+        return known
+
+    def _find_known_url_hashes(self, url_hashes: List[str]) -> Set[str]:
+        known: Set[str] = set()
+        for chunk in _chunked(url_hashes, IN_CLAUSE_CHUNK_SIZE):
+            rows = self.db.query(Signal.source_url_hash).filter(Signal.source_url_hash.in_(chunk)).all()
+            known.update(row[0] for row in rows)
+        return known
+
+    def _find_existing_signals(self, event_ids: List[str]) -> Dict[str, Any]:
+        existing: Dict[str, Any] = {}
+        for chunk in _chunked(event_ids, IN_CLAUSE_CHUNK_SIZE):
+            rows = (
+                self.db.query(
+                    Signal.id, Signal.beacon_event_id, Signal.content_fingerprint, Signal.priority_score,
+                    Signal.country, Signal.location,
+                )
+                .filter(Signal.beacon_event_id.in_(chunk))
+                .all()
             )
-            if existing:
-                return True
-        source_url = event.get("source_url")
-        if source_url:
-            existing = self.db.query(Signal).filter(Signal.source_url == source_url).first()
-            if existing:
-                return True
-        return False
+            existing.update((row.beacon_event_id, row) for row in rows)
+        return existing
+
+    def _partition_events(
+        self, events: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split a batch into new events and stored events whose content Beacon revised.
+
+        Events already stored under their beacon_event_id are "changed" only when their
+        content fingerprint differs. Events matching a stored source URL, or repeated
+        within the batch, are dropped. Uses one indexed IN query per key.
+        """
+        existing = self._find_existing_signals(
+            list({e["beacon_event_id"] for e in events if e.get("beacon_event_id")})
+        )
+        known_hashes = self._find_known_url_hashes(
+            list({e["source_url_hash"] for e in events if e.get("source_url_hash")})
+        )
+
+        new_events: List[Dict[str, Any]] = []
+        changed_events: List[Dict[str, Any]] = []
+        seen_ids: Set[str] = set()
+        for event in events:
+            beacon_event_id = event.get("beacon_event_id")
+            source_url_hash = event.get("source_url_hash")
+            if beacon_event_id in seen_ids:
+                continue
+            if beacon_event_id:
+                seen_ids.add(beacon_event_id)
+
+            stored = existing.get(beacon_event_id)
+            if stored is not None:
+                if stored.content_fingerprint != event["content_fingerprint"]:
+                    relocated = (stored.country, stored.location) != (event["country"], event["location"])
+                    changed_events.append(
+                        dict(event, id=stored.id, previous_priority=stored.priority_score, relocated=relocated)
+                    )
+                continue
+            if source_url_hash in known_hashes:
+                continue
+            new_events.append(event)
+            if source_url_hash:
+                known_hashes.add(source_url_hash)
+        return new_events, changed_events
+
+    def _update_changed_signals(self, events: List[Dict[str, Any]]) -> List[uuid.UUID]:
+        """Rewrite revised Beacon fields with executemany UPDATEs by primary key.
+
+        Relocated events also take the new location's geocode result (possibly
+        'pending'); the others keep their stored coordinates.
+        Returns IDs of signals that became critical with this revision.
+        """
+        if not events:
+            return []
 
-    def _create_signal(self, event_data: Dict[str, Any]) -> None:
-        signal = Signal(**event_data)
-        self.db.add(signal)
-        self.db.flush()  # Ensure signal has an ID
+        now = datetime.datetime.utcnow()
+        # executemany needs the same columns in every row, so relocated events get their own statement
+        for relocated in (False, True):
+            fields = REVISABLE_FIELDS + GEOCODE_FIELDS if relocated else REVISABLE_FIELDS
+            rows = [
+                dict({field_name: event.get(field_name) for field_name in fields}, id=event["id"], updated_at=now)
+                for event in events
+                if bool(event.get("relocated")) == relocated
+            ]
+            if rows:
+                self.db.execute(update(Signal), rows)
+
+        return [
+            event["id"]
+            for event in events
+            if (event.get("priority_score") or 0) >= 85 and (event.get("previous_priority") or 0) < 85
+        ]
+
+    def _insert_signals(self, events: List[Dict[str, Any]]) -> List[uuid.UUID]:
+        """Insert a poll's signals in one executemany statement and return the inserted IDs.
+
+        On Postgres and SQLite this is INSERT ... ON CONFLICT (beacon_event_id) DO NOTHING,
+        so a row added concurrently by another writer is skipped instead of failing the batch.
+        """
+        if not events:
+            return []
 
-        # Notify analysts of critical signals
-        if signal.priority_score and signal.priority_score >= 85:
+        rows = [dict(event, id=uuid.uuid4()) for event in events]
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql_insert(Signal).on_conflict_do_nothing(index_elements=[Signal.beacon_event_id])
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(Signal).on_conflict_do_nothing(index_elements=[Signal.beacon_event_id])
+        else:
+            self.db.execute(insert(Signal), rows)
+            return [row["id"] for row in rows]
+
+        return list(self.db.execute(stmt.returning(Signal.id), rows).scalars())
+
+    def _notify_critical_signals(self, signal_ids: List[uuid.UUID]) -> None:
+        """Notify analysts of newly inserted critical signals."""
+        critical: List[Signal] = []
+        for chunk in _chunked(signal_ids, IN_CLAUSE_CHUNK_SIZE):
+            critical.extend(
+                self.db.query(Signal).filter(Signal.id.in_(chunk), Signal.priority_score >= 85).all()
+            )
+        for signal in critical:
             notification_service.notify_new_critical_signal(signal, self.db)
 
     def _first_text(self, node: Any, selectors: Iterable[str]) -> Optional[str]:
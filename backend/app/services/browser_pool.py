@@ -0,0 +1,144 @@
+"""
+Browser Pool for Beacon rendering
+
+Keeps one headless Chromium browser and context alive across polls instead of
+launching a fresh browser for every fetch.
+
+Usage:
+    from app.services.browser_pool import get_browser_pool
+
+    async with get_browser_pool().page() as page:
+        await page.goto(url)
+
+Features:
+    - Lazy start: Chromium is launched on the first page request
+    - Health checks: a disconnected browser is relaunched transparently
+    - Recycling: browser and context are replaced after N pages to cap memory growth
+    - Bounded concurrency: at most N pages are open at the same time
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    def __init__(self, max_pages: Optional[int] = None, recycle_after_pages: Optional[int] = None):
+        self.max_pages = max_pages or int(os.getenv("BEACON_BROWSER_MAX_PAGES", "2"))
+        self.recycle_after_pages = recycle_after_pages or int(os.getenv("BEACON_BROWSER_RECYCLE_PAGES", "50"))
+        self.loop = asyncio.get_running_loop()
+
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        self._context: Optional["BrowserContext"] = None
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._lock = asyncio.Lock()
+        self._active_pages = 0
+        self._pages_served = 0
+        self._launch_count = 0
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """Open a page in the shared context; the page is closed on exit."""
+        async with self._semaphore:
+            context = await self._acquire_context()
+            try:
+                page = await context.new_page()
+            except BaseException:
+                self._active_pages -= 1
+                raise
+            try:
+                yield page
+            finally:
+                self._active_pages -= 1
+                self._pages_served += 1
+                try:
+                    await page.close()
+                except Exception as close_err:
+                    logger.warning(f"Failed to close page: {close_err}")
+
+    async def _acquire_context(self) -> "BrowserContext":
+        """Return a healthy context and count the caller's page as active.
+
+        Counted under the lock, before new_page() is awaited, so a concurrent
+        caller never recycles the context a page is still being opened in.
+        """
+        async with self._lock:
+            if not self.is_healthy():
+                if self._launch_count:
+                    logger.warning("Pooled browser is not connected, relaunching Chromium")
+                await self._restart()
+            elif self._pages_served >= self.recycle_after_pages and self._active_pages == 0:
+                logger.info(f"Recycling pooled browser after {self._pages_served} pages")
+                await self._restart()
+            self._active_pages += 1
+            return self._context
+
+    def is_healthy(self) -> bool:
+        return self._browser is not None and self._context is not None and self._browser.is_connected()
+
+    async def _restart(self) -> None:
+        await self._close_browser()
+        if self._playwright is None:
+            # Imported lazily so processes using the remote scraper service don't need Playwright
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+        self._context = await self._browser.new_context()
+        self._pages_served = 0
+        self._launch_count += 1
+
+    async def _close_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as close_err:
+                logger.warning(f"Failed to close browser: {close_err}")
+        self._browser = None
+        self._context = None
+
+    async def close(self) -> None:
+        """Close the browser and stop the Playwright driver."""
+        async with self._lock:
+            await self._close_browser()
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception as stop_err:
+                    logger.warning(f"Failed to stop Playwright: {stop_err}")
+                self._playwright = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.is_healthy(),
+            "active_pages": self._active_pages,
+            "pages_served": self._pages_served,
+            "launch_count": self._launch_count,
+            "max_pages": self.max_pages,
+            "recycle_after_pages": self.recycle_after_pages,
+        }
+
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the pool bound to the running event loop, creating it if needed."""
+    global _pool
+    if _pool is None or _pool.loop is not asyncio.get_running_loop():
+        _pool = BrowserPool()
+    return _pool
+
+
+async def close_browser_pool() -> None:
+    global _pool
+    if _pool is not None and _pool.loop is asyncio.get_running_loop():
+        await _pool.close()
+    _pool = None
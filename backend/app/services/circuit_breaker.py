@@ -0,0 +1,171 @@
+"""
+Circuit Breaker and Retry Budget for external dependencies
+
+Stops calling a dependency (Beacon, the scraper sidecar, Nominatim) after
+repeated failures, so an outage costs one fast CircuitOpenError per call
+instead of a full timeout. After reset_timeout_seconds a limited number of
+probe calls are let through (half-open); a successful probe closes the
+circuit, a failed one opens it again.
+
+Usage:
+    from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError, RetryBudget
+
+    breaker = CircuitBreaker("beacon_fetch", failure_threshold=3, reset_timeout_seconds=900)
+    if not breaker.allow():
+        raise CircuitOpenError(breaker.name)
+    try:
+        result = fetch()
+    except Exception:
+        breaker.record_failure()
+        raise
+    except BaseException:
+        breaker.release()  # cancelled: no verdict, but free the half-open probe slot
+        raise
+    breaker.record_success()
+
+    budget = RetryBudget(ratio=0.2)
+    budget.record_request()
+    if budget.try_spend_retry():
+        ...  # retry
+
+Notes:
+    - State is per process; with the poll lease only one process polls Beacon at a time
+    - Thread-safe, so geocoding worker threads can share one breaker
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 60.0,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Args:
+            name: Dependency name used in logs and errors
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout_seconds: Time open before probe calls are allowed
+            half_open_max_calls: Probe calls allowed at once while half-open
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._retry_after() <= 0:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now. A True while half-open claims a probe slot."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if self._retry_after() > 0:
+                    return False
+                self._state = HALF_OPEN
+                self._probes = 0
+                logger.info(f"Circuit {self.name} half-open, probing")
+            if self._probes >= self.half_open_max_calls:
+                return False
+            self._probes += 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit {self.name} closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def release(self) -> None:
+        """Give back a slot claimed by allow() when the call ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        f"Circuit {self.name} open after {self._failures} failures, "
+                        f"retrying in {self.reset_timeout_seconds:.0f}s"
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+    def retry_after(self) -> float:
+        """Seconds until probes are allowed; 0 when closed or ready to probe."""
+        with self._lock:
+            return max(0.0, self._retry_after()) if self._state == OPEN else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"name": self.name, "state": self.state, "failures": self._failures, "retry_after": self.retry_after()}
+
+    def _retry_after(self) -> float:
+        return self._opened_at + self.reset_timeout_seconds - time.monotonic()
+
+
+class RetryBudget:
+    """Caps retries at a fraction of recent requests, so retries cannot multiply load during an outage."""
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 2, window_seconds: float = 3600.0):
+        """
+        Args:
+            ratio: Retries allowed per request within the window
+            min_retries: Retries always allowed within the window, however few the requests
+            window_seconds: Sliding window length
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._requests.append(time.monotonic())
+
+    def try_spend_retry(self) -> bool:
+        """Claim one retry; False when the budget for the window is used up."""
+        with self._lock:
+            now = time.monotonic()
+            for events in (self._requests, self._retries):
+                while events and events[0] < now - self.window_seconds:
+                    events.popleft()
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
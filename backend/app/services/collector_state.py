@@ -0,0 +1,45 @@
+"""
+Collector State
+
+Persistent key/value bookkeeping for background collectors (payload fingerprints,
+cache versions) stored in the collector_state table, so it is shared by every
+worker process and survives restarts.
+
+Usage:
+    from app.services import collector_state
+
+    previous = collector_state.get_state(db, "beacon.payload_fingerprint")
+    collector_state.set_state(db, "beacon.payload_fingerprint", fingerprint)
+    db.commit()
+
+    version = collector_state.bump_version(db, collector_state.MAP_DATA_VERSION_KEY)
+"""
+import datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.models.schema import CollectorState
+
+# Bumped whenever signal rows shown on the map change; /map-data derives its ETag from it
+MAP_DATA_VERSION_KEY = "map.data_version"
+
+
+def get_state(db: Session, key: str, default: Any = None) -> Any:
+    """Return the stored value for key, or default when unset."""
+    row = db.get(CollectorState, key)
+    if row is None or row.value is None:
+        return default
+    return row.value
+
+
+def set_state(db: Session, key: str, value: Any) -> None:
+    """Insert or replace the value for key. The caller commits."""
+    db.merge(CollectorState(key=key, value=value, updated_at=datetime.datetime.utcnow()))
+
+
+def bump_version(db: Session, key: str) -> int:
+    """Increment the integer stored under key and return the new value. The caller commits."""
+    version = int(get_state(db, key, 0)) + 1
+    set_state(db, key, version)
+    return version
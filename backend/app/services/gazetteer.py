@@ -0,0 +1,233 @@
+"""
+Offline Gazetteer for GHI System
+
+Resolves country, admin-1 region and major city names from a bundled place
+list (app/services/data/gazetteer.tsv) without any network call. Country
+names, ISO codes and aliases come from app/services/data/countries.tsv.
+
+Usage:
+    from app.services.gazetteer import get_gazetteer
+
+    place = get_gazetteer().find("Democratic Republic of the Congo", "Goma, North Kivu")
+    # Returns: Place(kind='city', country='Democratic Republic of the Congo', name='Goma', ...)
+
+    get_gazetteer().canonical_country("DRC")  # 'Democratic Republic of the Congo'
+
+Features:
+    - Normalized-name index: case, diacritics, punctuation and apostrophes are ignored
+    - Country index: names, aliases ("Türkiye", "Congo (Kinshasa)") and ISO-2/ISO-3 codes map to one
+      canonical country name; resolved strings are memoized
+    - Alias table: alternative spellings and former names ("Bombay", "Nord-Kivu")
+    - Designators: "Aden Governorate" or "Kasese District" match "Aden" and "Kasese"
+    - Compound locations: "Goma, North Kivu" tries each part, most specific first
+    - Places are matched within the event's country only, so "Punjab" or "Hyderabad" stay unambiguous
+"""
+import logging
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+GAZETTEER_PATH = Path(__file__).parent / "data" / "gazetteer.tsv"
+COUNTRIES_PATH = Path(__file__).parent / "data" / "countries.tsv"
+
+# Raw country strings remembered by canonical_country before the memo is reset
+COUNTRY_MEMO_SIZE = 4096
+
+# Preferred kind when a name matches several places in one country
+KIND_RANK = {"city": 0, "admin1": 1, "country": 2}
+
+# Words that name an administrative unit rather than the place itself
+DESIGNATORS = {
+    "city", "province", "state", "region", "governorate", "district", "county",
+    "prefecture", "department", "municipality", "territory", "of", "the",
+}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_place_name(name: Optional[str]) -> str:
+    """Lowercase, strip diacritics, drop apostrophes and collapse punctuation to single spaces."""
+    if not name:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", name)
+    text = "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    text = text.replace("&", " and ").replace("'", "").replace("’", "")
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def _strip_designators(normalized: str) -> str:
+    return " ".join(word for word in normalized.split() if word not in DESIGNATORS)
+
+
+@dataclass(frozen=True)
+class Place:
+    kind: str
+    country: str
+    name: str
+    latitude: float
+    longitude: float
+
+
+class Gazetteer:
+    def __init__(
+        self,
+        places: Iterable[Place],
+        aliases: Optional[Dict[Place, List[str]]] = None,
+        country_aliases: Optional[Dict[str, List[str]]] = None,
+    ):
+        """
+        Args:
+            places: Countries, admin-1 regions and cities
+            aliases: Alternative names per place
+            country_aliases: Aliases and ISO codes per canonical country name
+        """
+        self.places: List[Place] = []
+        self._countries: Dict[str, Place] = {}
+        self._index: Dict[str, List[Place]] = {}
+        self._country_memo: Dict[str, Optional[Place]] = {}
+        aliases = aliases or {}
+
+        for place in places:
+            self.places.append(place)
+            for name in [place.name, *aliases.get(place, [])]:
+                key = normalize_place_name(name)
+                if not key:
+                    continue
+                if place.kind == "country":
+                    self._countries.setdefault(key, place)
+                self._index.setdefault(key, []).append(place)
+                stripped = _strip_designators(key)
+                if stripped and stripped != key:
+                    self._index.setdefault(stripped, []).append(place)
+
+        for matches in self._index.values():
+            matches.sort(key=lambda p: KIND_RANK.get(p.kind, len(KIND_RANK)))
+
+        # Aliases and codes never override a country's own name or an earlier alias
+        by_name = {place.name: place for place in self.places if place.kind == "country"}
+        for name, names in (country_aliases or {}).items():
+            place = by_name.get(name)
+            if place is None:
+                logger.warning(f"Country aliases given for unknown country: {name}")
+                continue
+            for alias in names:
+                key = normalize_place_name(alias)
+                if key and self._countries.setdefault(key, place) is not place:
+                    logger.warning(f"Country alias {alias!r} already maps to {self._countries[key].name}")
+
+    @classmethod
+    def load(cls, path: Path = GAZETTEER_PATH, countries_path: Optional[Path] = COUNTRIES_PATH) -> "Gazetteer":
+        """
+        Load places and country aliases from tab-separated files.
+
+        Args:
+            path: Places file with columns kind, country, name, latitude, longitude, aliases
+            countries_path: Country file with columns name, iso2, iso3, aliases (optional)
+        """
+        places: List[Place] = []
+        aliases: Dict[Place, List[str]] = {}
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip() or line.startswith("#"):
+                    continue
+                fields = line.rstrip("\n").split("\t")
+                try:
+                    kind, country, name, latitude, longitude = fields[:5]
+                    place = Place(kind, country, name, float(latitude), float(longitude))
+                except ValueError:
+                    logger.warning(f"Skipping malformed gazetteer line {line_number}: {line.strip()}")
+                    continue
+                places.append(place)
+                if len(fields) > 5 and fields[5]:
+                    aliases[place] = fields[5].split("|")
+
+        country_aliases: Dict[str, List[str]] = {}
+        if countries_path is not None:
+            with open(countries_path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip() or line.startswith("#"):
+                        continue
+                    name, *rest = line.rstrip("\n").split("\t")
+                    codes, alias_field = rest[:2], rest[2] if len(rest) > 2 else ""
+                    country_aliases[name] = [*(a for a in alias_field.split("|") if a), *codes]
+
+        gazetteer = cls(places, aliases, country_aliases)
+        logger.info(f"Loaded gazetteer with {len(places)} places from {path}")
+        return gazetteer
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def canonical_country(self, country: Optional[str]) -> Optional[str]:
+        """Map a country name, alias or ISO-2/ISO-3 code to its canonical name, or None if unknown."""
+        place = self.find_country(country)
+        return place.name if place else None
+
+    def find_country(self, country: Optional[str]) -> Optional[Place]:
+        """Return the country entry for a country name, alias or ISO code, or None if unknown."""
+        if not country:
+            return None
+        try:
+            return self._country_memo[country]
+        except KeyError:
+            pass
+        place = self._countries.get(normalize_place_name(country))
+        if len(self._country_memo) >= COUNTRY_MEMO_SIZE:
+            self._country_memo.clear()
+        self._country_memo[country] = place
+        return place
+
+    def find(self, country: Optional[str], location: Optional[str] = None) -> Optional[Place]:
+        """
+        Resolve a location within a country.
+
+        Returns:
+            The best matching Place in that country (city, then admin-1 region),
+            the country itself if location is empty or names the country, or
+            None if the country or location is unknown.
+        """
+        country_place = self.find_country(country)
+        if country_place is None:
+            return None
+        if not location:
+            return country_place
+
+        for key in self._candidate_keys(location):
+            # Before the index, where "Mexico" also matches "Mexico City" with its designator stripped
+            if self._countries.get(key) is country_place:
+                return country_place
+            for place in self._index.get(key, []):
+                if place.country == country_place.country:
+                    return place
+        return None
+
+    @staticmethod
+    def _candidate_keys(location: str) -> Iterator[str]:
+        """Normalized keys to try for a location string, most specific part first."""
+        parts = [location, *location.split(",")] if "," in location else [location]
+        for part in parts:
+            key = normalize_place_name(part)
+            if key:
+                yield key
+                stripped = _strip_designators(key)
+                if stripped and stripped != key:
+                    yield stripped
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """Return the bundled gazetteer, loading it on first use."""
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                _gazetteer = Gazetteer.load()
+    return _gazetteer
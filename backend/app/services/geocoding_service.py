@@ -2,37 +2,75 @@
 Geocoding Service for GHI System
 
 Converts location strings (country + location) to geographic coordinates (latitude, longitude).
-Uses OpenStreetMap Nominatim geocoding service with cache-first database lookup and country-level fallback.
+Uses OpenStreetMap Nominatim geocoding service with cache-first lookup in the geocode_cache table
+and country-level fallback.
 
 Usage:
-    from app.services.geocoding_service import geocode_signal_location
+    from app.services.geocoding_service import geocode_locations, geocode_signal_location
 
     result = geocode_signal_location("Saudi Arabia", "Riyadh", db=db_session)
     # Returns: {'latitude': 24.7136, 'longitude': 46.6753, 'geocode_source': 'location', 'location_hash': '...'}
 
+    results = geocode_locations([("Saudi Arabia", "Riyadh"), ("Kenya", None)], db=db_session)
+    # Returns: {('Saudi Arabia', 'Riyadh'): {...}, ('Kenya', None): {...}}
+
 Features:
-    - Cache-first: Query database for existing coordinates before API call
+    - Offline gazetteer: Bundled countries, admin-1 regions and major cities resolve without any query
+    - Country normalization: Aliases, ISO-2/ISO-3 codes, casing and diacritics map to one canonical
+      country name ("DRC", "COD", "Congo (Kinshasa)" -> "Democratic Republic of the Congo")
+    - Memory cache: Bounded per-process LRU with TTL in front of the geocode_cache table
+    - Cache-first: Query the geocode_cache table for unexpired coordinates before API call
+    - Write-through: New results are stored in geocode_cache with source, precision and expiry
+    - Negative caching: Failed lookups (and locations that only resolved to their country) are
+      cached with a short expiry and retried daily until a retry budget runs out
+    - Batching: geocode_locations resolves each unique location once, with one cache query per batch
+    - Deferred lookups: geocode_locations(..., defer_misses=True) answers from the gazetteer and caches
+      only and marks the rest 'pending' for app/workers/geocoding_worker.py
     - Primary: Geocode "{location}, {country}" for accuracy
     - Fallback: Use country center point if location unavailable
-    - Rate limiting: 1.1 second sleep after Nominatim API call (TOS compliance)
+    - Backends: GEOCODER_BACKENDS selects Nominatim, the offline gazetteer or a chain of both;
+      NOMINATIM_URL points at another Nominatim instance (e.g. scripts/mock_nominatim_server.py)
+    - Rate limiting: Every Nominatim call waits for a slot from a rate limiter shared by all
+      threads and processes on the host (TOS compliance); misses are resolved concurrently
+    - Circuit breaker: After repeated Nominatim timeouts or service errors, calls fail fast
+      until a half-open probe succeeds; meanwhile misses degrade to the country center
+      with source 'pending' (not cached), so the geocoding worker retries them later
     - Error handling: Returns 'failed' source on errors
 
 Geocode Sources:
     - 'location': Successfully geocoded specific location
+    - 'gazetteer': Specific location resolved from the offline gazetteer
     - 'country': Fallback to country center point
-    - 'cache': Coordinates retrieved from database cache
+    - 'cache': Coordinates retrieved from the geocode_cache table
+    - 'pending': Not resolved yet; the geocoding worker will look it up. May carry
+      country-level coordinates when the geocoder was unavailable
     - 'failed': Geocoding failed (invalid country/location)
 """
 import hashlib
 import logging
+import os
+import tempfile
+import threading
 import time
-from typing import Dict, Optional
-from datetime import datetime
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
 
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+from sqlalchemy import event, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
+from app.models.schema import GeocodeCache
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.gazetteer import get_gazetteer
+from app.services.rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 # Country center points fallback (140+ countries)
@@ -97,14 +135,124 @@ COUNTRY_COORDINATES = {
     "Zimbabwe": (-19.0154, 29.1549),
 }
 
-# Initialize Nominatim geocoder
-geolocator = Nominatim(user_agent="ghi-beacon-system/1.0")
+# Max location hashes per IN (...) cache query
+CACHE_LOOKUP_CHUNK_SIZE = 500
+
+# geocode_source of signals stored before their location was looked up
+PENDING_SOURCE = "pending"
+
+# How long a resolved location stays in geocode_cache before it is looked up again
+CACHE_TTL = timedelta(days=int(os.getenv("GEOCODE_CACHE_TTL_DAYS", "180")))
+
+# How long a failed lookup is remembered before Nominatim is asked again
+NEGATIVE_CACHE_TTL = timedelta(hours=float(os.getenv("GEOCODE_NEGATIVE_TTL_HOURS", "24")))
+
+# Failed attempts after which a location is only retried every CACHE_TTL
+MAX_FAILED_ATTEMPTS = int(os.getenv("GEOCODE_MAX_FAILED_ATTEMPTS", "7"))
+
+# Concurrent Nominatim lookups per geocode_locations batch (spacing is enforced by the rate limiter)
+GEOCODE_CONCURRENCY = int(os.getenv("GEOCODE_CONCURRENCY", "2"))
+
+# One Nominatim call per slot across all threads and processes (usage policy: max 1 request/second)
+nominatim_rate_limiter = RateLimiter(
+    interval_seconds=float(os.getenv("NOMINATIM_MIN_INTERVAL_SECONDS", "1.1")),
+    burst=int(os.getenv("NOMINATIM_BURST", "1")),
+    state_path=os.getenv(
+        "NOMINATIM_RATE_LIMIT_FILE", os.path.join(tempfile.gettempdir(), "ghi-nominatim.rate")
+    ),
+)
+
+# Stops Nominatim calls after consecutive timeouts/service errors; "no results" does not count
+nominatim_breaker = CircuitBreaker(
+    "nominatim",
+    failure_threshold=int(os.getenv("GEOCODER_BREAKER_FAILURES", "5")),
+    reset_timeout_seconds=float(os.getenv("GEOCODER_BREAKER_RESET_SECONDS", "120")),
+)
+
+
+class GeocoderUnavailable(Exception):
+    """Raised when a geocoder cannot answer (outage or open circuit), as opposed to finding nothing."""
+
+
+class MemoryCache:
+    """
+    Thread-safe LRU of cache hits, consulted before the geocode_cache table.
+
+    Entries expire after ttl_seconds (or the row's own expiry, if sooner) so
+    writes made by other processes become visible without a restart.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, location_hash: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(location_hash)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[location_hash]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(location_hash)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, location_hash: str, value: Dict, expires_at: Optional[datetime] = None) -> None:
+        if self.max_entries <= 0:
+            return
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, (expires_at.replace(tzinfo=None) - datetime.utcnow()).total_seconds())
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[location_hash] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(location_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, location_hash: str) -> None:
+        with self._lock:
+            self._entries.pop(location_hash, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+memory_cache = MemoryCache(
+    max_entries=int(os.getenv("GEOCODE_MEMORY_CACHE_SIZE", "4096")),
+    ttl_seconds=float(os.getenv("GEOCODE_MEMORY_CACHE_TTL_SECONDS", "3600")),
+)
+# Session.info key for cache entries written in the current transaction, put in memory_cache on commit
+PENDING_MEMORY_CACHE_KEY = "geocode_memory_cache_pending"
 
 
 def calculate_location_hash(country: str, location: Optional[str]) -> str:
     """
     Calculate MD5 hash for location cache lookup.
 
+    Known countries are keyed by their canonical name, so "USA" and
+    "United States" share cache entries.
+
     Args:
         country: Country name
         location: Optional specific location within country
@@ -112,13 +260,14 @@ def calculate_location_hash(country: str, location: Optional[str]) -> str:
     Returns:
         32-character hex MD5 hash
     """
+    country = get_gazetteer().canonical_country(country) or country
     key = f"{country}|{location or ''}".strip().lower()
     return hashlib.md5(key.encode()).hexdigest()
 
 
 def get_cached_coordinates(location_hash: str, db: Session) -> Optional[Dict]:
     """
-    Query database for cached coordinates using location hash.
+    Query the geocode cache for coordinates using location hash.
 
     Args:
         location_hash: MD5 hash of location key
@@ -127,67 +276,406 @@ def get_cached_coordinates(location_hash: str, db: Session) -> Optional[Dict]:
     Returns:
         Dict with coordinates if found, None otherwise
     """
-    from app.models.schema import Signal
+    return get_cached_coordinates_bulk([location_hash], db).get(location_hash)
 
-    try:
-        # Find any signal with this location_hash that has coordinates
-        cached_signal = db.query(Signal).filter(
-            Signal.location_hash == location_hash,
-            Signal.latitude.isnot(None),
-            Signal.longitude.isnot(None)
-        ).first()
-
-        if cached_signal:
-            logger.info(f"Cache HIT for location_hash={location_hash}")
-            return {
-                'latitude': float(cached_signal.latitude),
-                'longitude': float(cached_signal.longitude),
-                'geocode_source': 'cache',
-                'geocoded_at': datetime.utcnow(),
-                'location_hash': location_hash
-            }
 
-        logger.debug(f"Cache MISS for location_hash={location_hash}")
-        return None
+def get_cached_coordinates_bulk(location_hashes: Iterable[str], db: Session) -> Dict[str, Dict]:
+    """
+    Query the geocode cache for coordinates of many location hashes at once.
+
+    The in-process memory cache is checked first; only its misses reach the
+    database. Expired entries count as misses. Unexpired negative entries are
+    returned as 'failed' results so the location is not looked up again. Database hits are loaded into
+    the memory cache and have their hit_count incremented (flushed with the
+    caller's transaction).
 
+    Args:
+        location_hashes: MD5 hashes of location keys
+        db: Database session
+
+    Returns:
+        Dict mapping each cached location_hash to its coordinates dict; misses are absent
+    """
+    cached: Dict[str, Dict] = {}
+    hashes: List[str] = []
+    for location_hash in set(location_hashes):
+        entry = memory_cache.get(location_hash)
+        if entry is not None:
+            cached[location_hash] = entry
+        else:
+            hashes.append(location_hash)
+    memory_hits = len(cached)
+    if not hashes:
+        logger.info(f"Cache lookup: {memory_hits} memory hits, no database query")
+        return cached
+
+    now = datetime.utcnow()
+    try:
+        # Savepoint: on Postgres a failed statement would otherwise abort the caller's whole transaction
+        with db.begin_nested():
+            _load_cached_rows(hashes, db, cached, now)
     except Exception as e:
         logger.error(f"Cache lookup error: {str(e)}")
-        return None
+
+    logger.info(
+        f"Cache lookup: {memory_hits} memory hits, {len(cached) - memory_hits} database hits, "
+        f"{len(hashes) - (len(cached) - memory_hits)} misses"
+    )
+    return cached
+
+
+def _load_cached_rows(hashes: List[str], db: Session, cached: Dict[str, Dict], now: datetime) -> None:
+    """Add unexpired database entries to cached and the memory cache, and count their hits."""
+    for start in range(0, len(hashes), CACHE_LOOKUP_CHUNK_SIZE):
+        chunk = hashes[start:start + CACHE_LOOKUP_CHUNK_SIZE]
+        rows = db.query(GeocodeCache).filter(
+            GeocodeCache.location_hash.in_(chunk),
+            (GeocodeCache.expires_at.is_(None)) | (GeocodeCache.expires_at > now)
+        ).all()
+
+        for row in rows:
+            entry = _cache_entry(row.location_hash, row.latitude, row.longitude, row.precision, now)
+            cached[row.location_hash] = entry
+            memory_cache.put(row.location_hash, entry, row.expires_at)
+
+    hits = [location_hash for location_hash in hashes if location_hash in cached]
+    for start in range(0, len(hits), CACHE_LOOKUP_CHUNK_SIZE):
+        db.execute(
+            update(GeocodeCache)
+            .where(GeocodeCache.location_hash.in_(hits[start:start + CACHE_LOOKUP_CHUNK_SIZE]))
+            .values(hit_count=GeocodeCache.hit_count + 1, last_hit_at=now),
+            execution_options={"synchronize_session": False}
+        )
+
+
+def _cache_entry(location_hash: str, latitude, longitude, precision: Optional[str], now: datetime) -> Dict:
+    """Build the result dict returned for a cache hit (negative entries have no coordinates)."""
+    if latitude is None or longitude is None:
+        return {
+            'latitude': None,
+            'longitude': None,
+            'geocode_source': 'failed',
+            'precision': None,
+            'geocoded_at': now,
+            'location_hash': location_hash
+        }
+    return {
+        'latitude': float(latitude),
+        'longitude': float(longitude),
+        'geocode_source': 'cache',
+        'precision': precision,
+        'geocoded_at': now,
+        'location_hash': location_hash
+    }
 
 
-def geocode_with_nominatim(query: str) -> Optional[tuple]:
+def _is_negative_result(location: Optional[str], result: Dict) -> bool:
+    """A lookup failed, or a specific location only resolved to its country."""
+    if result.get('latitude') is None or result.get('longitude') is None:
+        return True
+    return bool(location) and result.get('precision') == 'country'
+
+
+def store_cached_coordinates_bulk(
+    entries: Iterable[Tuple[str, Optional[str], Dict]],
+    db: Session
+) -> int:
     """
-    Call Nominatim API to geocode a location string.
+    Insert or refresh geocode cache entries (flushed with the caller's transaction).
+
+    Written hashes are invalidated in the memory cache and replaced with the
+    new coordinates once the caller commits, so later lookups skip the database
+    and a rolled-back write never reaches the memory cache.
+
+    Negative results (see _is_negative_result) increment failure_count and
+    expire after NEGATIVE_CACHE_TTL; once MAX_FAILED_ATTEMPTS is reached they
+    keep the full CACHE_TTL. A success resets failure_count.
 
     Args:
-        query: Location query string
+        entries: (country, location, result) tuples, where result is a geocode result dict
+        db: Database session
 
     Returns:
-        (latitude, longitude) tuple if successful, None otherwise
+        Number of entries written
     """
+    now = datetime.utcnow()
+    entries = [
+        (country, location, result) for country, location, result in entries
+        if result.get('location_hash')
+    ]
+    negative_hashes = [
+        result['location_hash'] for country, location, result in entries
+        if _is_negative_result(location, result)
+    ]
+    failure_counts = _get_failure_counts(negative_hashes, db) if negative_hashes else {}
+
+    rows = []
+    for country, location, result in entries:
+        failure_count = 0
+        expires_at = now + CACHE_TTL
+        if _is_negative_result(location, result):
+            failure_count = failure_counts.get(result['location_hash'], 0) + 1
+            if failure_count < MAX_FAILED_ATTEMPTS:
+                expires_at = now + NEGATIVE_CACHE_TTL
+        rows.append({
+            'location_hash': result['location_hash'],
+            'country': country,
+            'location': location,
+            'latitude': result.get('latitude'),
+            'longitude': result.get('longitude'),
+            'geocode_source': result['geocode_source'],
+            'precision': result.get('precision'),
+            'hit_count': 0,
+            'failure_count': failure_count,
+            'expires_at': expires_at,
+            'created_at': now,
+            'updated_at': now,
+        })
+    if not rows:
+        return 0
+
+    for row in rows:
+        memory_cache.invalidate(row['location_hash'])
+
+    refreshed = ('latitude', 'longitude', 'geocode_source', 'precision', 'failure_count', 'expires_at', 'updated_at')
     try:
-        logger.info(f"Calling Nominatim API: {query}")
-        location = geolocator.geocode(query, timeout=5)
+        # Savepoint, so a failed cache write rolls back alone instead of the caller's transaction
+        with db.begin_nested():
+            dialect = db.get_bind().dialect.name
+            if dialect in ('postgresql', 'sqlite'):
+                dialect_insert = postgresql_insert if dialect == 'postgresql' else sqlite_insert
+                stmt = dialect_insert(GeocodeCache)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[GeocodeCache.location_hash],
+                    set_={column: stmt.excluded[column] for column in refreshed}
+                )
+                db.execute(stmt, rows)
+            else:
+                for row in rows:
+                    db.merge(GeocodeCache(**row))
+    except Exception as e:
+        logger.error(f"Cache write error: {str(e)}")
+        return 0
+
+    pending = db.info.setdefault(PENDING_MEMORY_CACHE_KEY, [])
+    for row in rows:
+        pending.append((
+            row['location_hash'],
+            _cache_entry(row['location_hash'], row['latitude'], row['longitude'], row['precision'], now),
+            row['expires_at']
+        ))
+    return len(rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _fill_memory_cache_after_commit(session: Session) -> None:
+    """Load the cache entries written in the committed transaction into the memory cache."""
+    for location_hash, entry, expires_at in session.info.pop(PENDING_MEMORY_CACHE_KEY, []):
+        memory_cache.put(location_hash, entry, expires_at)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_uncommitted_memory_cache(session: Session, transaction) -> None:
+    # after_commit has already taken the entries of a committed transaction; these were rolled back
+    if transaction.parent is None:
+        session.info.pop(PENDING_MEMORY_CACHE_KEY, None)
+
+
+def _get_failure_counts(location_hashes: List[str], db: Session) -> Dict[str, int]:
+    """Look up failure_count for cache entries, including expired ones."""
+    counts: Dict[str, int] = {}
+    try:
+        with db.begin_nested():
+            for start in range(0, len(location_hashes), CACHE_LOOKUP_CHUNK_SIZE):
+                rows = db.query(GeocodeCache.location_hash, GeocodeCache.failure_count).filter(
+                    GeocodeCache.location_hash.in_(location_hashes[start:start + CACHE_LOOKUP_CHUNK_SIZE])
+                ).all()
+                counts.update((location_hash, failure_count or 0) for location_hash, failure_count in rows)
+    except Exception as e:
+        logger.error(f"Cache failure count lookup error: {str(e)}")
+    return counts
+
+
+class GeocoderBackend(ABC):
+    """
+    Resolves a free-form "{location}, {country}" or "{country}" query to (latitude, longitude).
+    Returns None when nothing matches and raises GeocoderUnavailable when it cannot tell.
+    """
+
+    name = "backend"
+
+    @abstractmethod
+    def geocode(self, query: str) -> Optional[Tuple[float, float]]:
+        ...
+
+
+class NominatimBackend(GeocoderBackend):
+    """
+    Nominatim search API. Every call, failed or not, waits for a slot from
+    the rate limiter. base_url points it at another Nominatim instance, such
+    as scripts/mock_nominatim_server.py. Calls go through a circuit breaker
+    (nominatim_breaker by default) and are not made while it is open.
+    """
 
+    name = "nominatim"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout: float = 5,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        url = urlparse(base_url or "https://nominatim.openstreetmap.org")
+        self.base_url = f"{url.scheme}://{url.netloc}"
+        self.rate_limiter = rate_limiter or nominatim_rate_limiter
+        self.breaker = breaker or nominatim_breaker
+        self.timeout = timeout
+        self.geolocator = Nominatim(
+            user_agent="ghi-beacon-system/1.0", domain=url.netloc, scheme=url.scheme
+        )
+
+    def geocode(self, query: str) -> Optional[Tuple[float, float]]:
+        # Checked before the rate limiter, so an open circuit costs no slot
+        if not self.breaker.allow():
+            raise GeocoderUnavailable(f"Nominatim circuit open, skipping: {query}")
+        try:
+            waited = self.rate_limiter.acquire()
+            logger.info(f"Calling Nominatim API: {query} (waited {waited:.2f}s for rate limit)")
+            location = self.geolocator.geocode(query, timeout=self.timeout)
+
+        except GeocoderTimedOut as e:
+            logger.error(f"Geocoding timeout for: {query}")
+            self.breaker.record_failure()
+            raise GeocoderUnavailable(f"Nominatim timeout for: {query}") from e
+        except GeocoderServiceError as e:
+            logger.error(f"Geocoding service error for {query}: {str(e)}")
+            self.breaker.record_failure()
+            raise GeocoderUnavailable(f"Nominatim service error for {query}: {e}") from e
+        except Exception as e:
+            logger.error(f"Unexpected geocoding error for {query}: {str(e)}")
+            self.breaker.record_failure()
+            raise GeocoderUnavailable(f"Nominatim error for {query}: {e}") from e
+        except BaseException:
+            # Interrupted without an answer: free the probe slot so the circuit cannot stay half-open
+            self.breaker.release()
+            raise
+
+        self.breaker.record_success()
         if location:
-            # CRITICAL: Sleep 1.1 seconds for rate limit compliance
-            time.sleep(1.1)
             return (location.latitude, location.longitude)
 
         logger.warning(f"Nominatim returned no results for: {query}")
         return None
 
-    except GeocoderTimedOut:
-        logger.error(f"Geocoding timeout for: {query}")
-        return None
-    except GeocoderServiceError as e:
-        logger.error(f"Geocoding service error for {query}: {str(e)}")
-        return None
-    except Exception as e:
-        logger.error(f"Unexpected geocoding error for {query}: {str(e)}")
+
+class GazetteerBackend(GeocoderBackend):
+    """Offline lookups in the bundled gazetteer; the last comma-separated part is the country."""
+
+    name = "gazetteer"
+
+    def geocode(self, query: str) -> Optional[Tuple[float, float]]:
+        if "," in query:
+            location, country = (part.strip() for part in query.rsplit(",", 1))
+            place = get_gazetteer().find(country, location)
+            if place is None or place.kind == "country":
+                return None
+        else:
+            place = get_gazetteer().find_country(query)
+            if place is None:
+                return None
+        return (place.latitude, place.longitude)
+
+
+class ChainedBackend(GeocoderBackend):
+    """Tries each backend in order and returns the first result; unavailable backends are skipped."""
+
+    name = "chained"
+
+    def __init__(self, backends: List[GeocoderBackend]):
+        self.backends = backends
+        self.name = "+".join(backend.name for backend in backends)
+
+    def geocode(self, query: str) -> Optional[Tuple[float, float]]:
+        unavailable: Optional[GeocoderUnavailable] = None
+        for backend in self.backends:
+            try:
+                coords = backend.geocode(query)
+            except GeocoderUnavailable as e:
+                unavailable = e
+                continue
+            if coords:
+                return coords
+        # "Not found" is only certain when every backend answered
+        if unavailable is not None:
+            raise unavailable
         return None
 
 
+def build_geocoder_backend(spec: Optional[str] = None) -> GeocoderBackend:
+    """
+    Build a backend from a comma-separated list of names, tried in order.
+
+    Args:
+        spec: e.g. "nominatim", "gazetteer" (fully offline) or "gazetteer,nominatim";
+            defaults to GEOCODER_BACKENDS
+
+    Raises:
+        ValueError: If a backend name is unknown
+    """
+    spec = spec if spec is not None else os.getenv("GEOCODER_BACKENDS", "nominatim")
+    backends: List[GeocoderBackend] = []
+    for name in (part.strip().lower() for part in spec.split(",") if part.strip()):
+        if name == "nominatim":
+            backends.append(NominatimBackend(base_url=os.getenv("NOMINATIM_URL")))
+        elif name == "gazetteer":
+            backends.append(GazetteerBackend())
+        else:
+            raise ValueError(f"Unknown geocoder backend: {name}")
+    if not backends:
+        raise ValueError("GEOCODER_BACKENDS names no backend")
+    return backends[0] if len(backends) == 1 else ChainedBackend(backends)
+
+
+_backend: Optional[GeocoderBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_geocoder_backend() -> GeocoderBackend:
+    """Return the configured backend, building it from GEOCODER_BACKENDS on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = build_geocoder_backend()
+                logger.info(f"Geocoder backend: {_backend.name}")
+    return _backend
+
+
+def set_geocoder_backend(backend: Optional[GeocoderBackend]) -> Optional[GeocoderBackend]:
+    """Replace the backend (None rebuilds it from the environment); returns the previous one."""
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, backend
+    return previous
+
+
+def geocode_query(query: str) -> Optional[Tuple[float, float]]:
+    """
+    Geocode a location string with the configured backend.
+
+    Args:
+        query: Location query string
+
+    Returns:
+        (latitude, longitude) tuple if successful, None otherwise
+
+    Raises:
+        GeocoderUnavailable: If the backend could not be reached or its circuit is open
+    """
+    return get_geocoder_backend().geocode(query)
+
+
 def geocode_signal_location(
     country: str,
     location: Optional[str] = None,
@@ -198,37 +686,105 @@ def geocode_signal_location(
 
     Process:
     1. Calculate location_hash for cache key
-    2. If db provided: Check cache for existing coordinates
-    3. If cache miss: Try geocoding "{location}, {country}"
-    4. If specific location fails: Fall back to country center
-    5. If country not in fallback dict: Call Nominatim for country
-    6. If all fails: Return 'failed' source
+    2. Try the offline gazetteer (no cache or network involved)
+    3. If db provided: Check cache for existing coordinates
+    4. If cache miss: Try geocoding "{location}, {country}"
+    5. If specific location fails: Fall back to country center (dictionary, then gazetteer)
+    6. If country unknown offline: Call Nominatim for country
+    7. If all fails: Return 'failed' source
+    If the geocoder is unavailable, a degraded 'pending' result is returned and not cached
 
     Args:
         country: Country name (required)
         location: Specific location within country (optional)
-        db: Database session for cache lookup (optional)
+        db: Database session for cache lookup and write-through (optional)
 
     Returns:
         Dict with keys:
             - latitude: float or None
             - longitude: float or None
-            - geocode_source: 'cache' | 'location' | 'country' | 'failed'
-            - geocoded_at: datetime
+            - geocode_source: 'cache' | 'gazetteer' | 'location' | 'country' | 'pending' | 'failed'
+            - precision: 'location' | 'country' | None
+            - geocoded_at: datetime (None when 'pending')
             - location_hash: str (MD5 hash for caching)
     """
     location_hash = calculate_location_hash(country, location)
 
-    # Step 1: Check database cache
+    # Step 2: Offline gazetteer
+    offline = _geocode_offline(country, location, location_hash)
+    if offline:
+        return offline
+
+    # Step 3: Check database cache
     if db:
         cached = get_cached_coordinates(location_hash, db)
         if cached:
             return cached
 
-    # Step 2: Try geocoding specific location
+    try:
+        result = _geocode_uncached(country, location, location_hash)
+    except GeocoderUnavailable as e:
+        logger.warning(f"Geocoder unavailable for {country}, {location}: {e}")
+        return _degraded_result(country, location_hash)
+    if db:
+        store_cached_coordinates_bulk([(country, location, result)], db)
+    return result
+
+
+def _country_center(country: str) -> Optional[Tuple[float, float]]:
+    """Country center point from COUNTRY_COORDINATES or the gazetteer, without a network call."""
+    place = get_gazetteer().find_country(country)
+    if place is None:
+        return COUNTRY_COORDINATES.get(country)
+    return COUNTRY_COORDINATES.get(place.name, (place.latitude, place.longitude))
+
+
+def _degraded_result(country: str, location_hash: str) -> Dict:
+    """Stand-in while the geocoder is unavailable: country center if known, still 'pending'."""
+    coords = _country_center(country)
+    return {
+        'latitude': coords[0] if coords else None,
+        'longitude': coords[1] if coords else None,
+        'geocode_source': PENDING_SOURCE,
+        'precision': 'country' if coords else None,
+        'geocoded_at': None,
+        'location_hash': location_hash
+    }
+
+
+def _geocode_offline(country: str, location: Optional[str], location_hash: str) -> Optional[Dict]:
+    """Resolve a location from the bundled gazetteer only (step 2 of geocode_signal_location)."""
     if location:
-        query = f"{location}, {country}"
-        coords = geocode_with_nominatim(query)
+        place = get_gazetteer().find(country, location)
+        if place is None:
+            return None
+        coords = (place.latitude, place.longitude)
+        precision = 'country' if place.kind == 'country' else 'location'
+        source = 'country' if place.kind == 'country' else 'gazetteer'
+    else:
+        coords = _country_center(country)
+        if coords is None:
+            return None
+        precision = source = 'country'
+
+    return {
+        'latitude': coords[0],
+        'longitude': coords[1],
+        'geocode_source': source,
+        'precision': precision,
+        'geocoded_at': datetime.utcnow(),
+        'location_hash': location_hash
+    }
+
+
+def _geocode_uncached(country: str, location: Optional[str], location_hash: str) -> Dict:
+    """Resolve a location through Nominatim and the country fallbacks (steps 4-7 of geocode_signal_location)."""
+    country_name = get_gazetteer().canonical_country(country) or country
+
+    # Step 4: Try geocoding specific location
+    if location:
+        query = f"{location}, {country_name}"
+        coords = geocode_query(query)
 
         if coords:
             logger.info(f"Geocoded location: {query} → {coords}")
@@ -236,40 +792,175 @@ def geocode_signal_location(
                 'latitude': coords[0],
                 'longitude': coords[1],
                 'geocode_source': 'location',
+                'precision': 'location',
                 'geocoded_at': datetime.utcnow(),
                 'location_hash': location_hash
             }
 
-    # Step 3: Fall back to country center (from dictionary)
-    if country in COUNTRY_COORDINATES:
-        coords = COUNTRY_COORDINATES[country]
+    # Step 5: Fall back to country center (dictionary, then gazetteer)
+    coords = _country_center(country)
+    if coords:
         logger.info(f"Using country fallback: {country} → {coords}")
         return {
             'latitude': coords[0],
             'longitude': coords[1],
             'geocode_source': 'country',
+            'precision': 'country',
             'geocoded_at': datetime.utcnow(),
             'location_hash': location_hash
         }
 
-    # Step 4: Try geocoding country name via API
-    coords = geocode_with_nominatim(country)
+    # Step 6: Try geocoding country name via API
+    coords = geocode_query(country_name)
     if coords:
         logger.info(f"Geocoded country via API: {country} → {coords}")
         return {
             'latitude': coords[0],
             'longitude': coords[1],
             'geocode_source': 'country',
+            'precision': 'country',
             'geocoded_at': datetime.utcnow(),
             'location_hash': location_hash
         }
 
-    # Step 5: Complete failure
+    # Step 7: Complete failure
     logger.error(f"Geocoding FAILED for: {country}, {location}")
     return {
         'latitude': None,
         'longitude': None,
         'geocode_source': 'failed',
+        'precision': None,
         'geocoded_at': datetime.utcnow(),
         'location_hash': location_hash
     }
+
+
+def geocode_locations(
+    locations: Iterable[Tuple[str, Optional[str]]],
+    db: Optional[Session] = None,
+    defer_misses: bool = False,
+    stats: Optional[Dict[str, int]] = None
+) -> Dict[Tuple[str, Optional[str]], Dict]:
+    """
+    Geocode many (country, location) pairs, resolving each unique pair once.
+
+    Process:
+    1. Deduplicate pairs by location hash, so alias spellings ("USA", "United States") are resolved once
+    2. Resolve what the offline gazetteer knows; only the rest goes further
+    3. If db provided: One bulk cache lookup for the remaining hashes
+    4. Geocode misses concurrently; the shared rate limiter spaces the Nominatim calls
+    5. If a location errors: Fall back to country-only geocoding, then 'failed'; if the
+       geocoder is unavailable: degrade to the country center with source 'pending'
+    6. If db provided: Store the misses' results in one bulk cache write (degraded ones excluded)
+
+    Args:
+        locations: (country, location) pairs; duplicates are resolved once
+        db: Database session for cache lookup (optional)
+        defer_misses: Skip steps 4-6 and return misses with source 'pending' and no coordinates
+        stats: Dict to receive unique/offline/cache_hits/deferred/lookups/degraded counts (optional)
+
+    Returns:
+        Dict mapping each unique (country, location) pair to a geocode_signal_location-style dict;
+        pairs sharing a location hash share one result
+    """
+    pairs: Dict[Tuple[str, Optional[str]], str] = {}
+    for country, location in locations:
+        pairs.setdefault((country, location), calculate_location_hash(country, location))
+    # The first pair seen for each hash stands in for its aliases; one hash must not be written twice
+    # in a single bulk upsert (Postgres rejects ON CONFLICT DO UPDATE touching a row twice)
+    representatives: Dict[str, Tuple[str, Optional[str]]] = {}
+    for key, location_hash in pairs.items():
+        representatives.setdefault(location_hash, key)
+    hashes = {key: location_hash for location_hash, key in representatives.items()}
+
+    results: Dict[Tuple[str, Optional[str]], Dict] = {}
+    pending: Dict[Tuple[str, Optional[str]], str] = {}
+    for key, location_hash in hashes.items():
+        offline = _geocode_offline(key[0], key[1], location_hash)
+        if offline:
+            results[key] = offline
+        else:
+            pending[key] = location_hash
+
+    cached = get_cached_coordinates_bulk(pending.values(), db) if db and pending else {}
+
+    misses: List[Tuple[str, Optional[str]]] = []
+    for key, location_hash in pending.items():
+        if location_hash in cached:
+            results[key] = dict(cached[location_hash])
+        else:
+            misses.append(key)
+
+    if stats is not None:
+        stats.update(
+            unique=len(hashes),
+            offline=len(hashes) - len(pending),
+            cache_hits=len(pending) - len(misses),
+            deferred=len(misses) if defer_misses else 0,
+            lookups=0 if defer_misses else len(misses),
+            degraded=0,
+        )
+
+    if defer_misses:
+        for key in misses:
+            results[key] = {
+                'latitude': None,
+                'longitude': None,
+                'geocode_source': PENDING_SOURCE,
+                'precision': None,
+                'geocoded_at': None,
+                'location_hash': hashes[key]
+            }
+        return _expand_aliases(pairs, representatives, results)
+
+    def resolve(key: Tuple[str, Optional[str]]) -> Dict:
+        country, location = key
+        try:
+            return _geocode_uncached(country, location, hashes[key])
+        except GeocoderUnavailable as e:
+            logger.warning(f"Geocoder unavailable for {country}, {location}: {e}")
+            return _degraded_result(country, hashes[key])
+        except Exception as e:
+            logger.error(f"Geocoding failed for {country}, {location}: {str(e)}")
+            try:
+                fallback = _geocode_uncached(country, None, hashes[key])
+                logger.info(f"Using country-level fallback for {country}")
+                return fallback
+            except Exception as fallback_err:
+                logger.error(f"Country-level geocoding also failed: {fallback_err}")
+                return {
+                    'latitude': None,
+                    'longitude': None,
+                    'geocode_source': 'failed',
+                    'precision': None,
+                    'geocoded_at': datetime.utcnow(),
+                    'location_hash': hashes[key]
+                }
+
+    # Lookups wait on the shared rate limiter, so concurrency overlaps latency without exceeding the limit
+    if len(misses) > 1 and GEOCODE_CONCURRENCY > 1:
+        with ThreadPoolExecutor(max_workers=min(GEOCODE_CONCURRENCY, len(misses))) as executor:
+            results.update(zip(misses, executor.map(resolve, misses)))
+    else:
+        results.update((key, resolve(key)) for key in misses)
+
+    # Degraded results stay out of the cache so the location is looked up again once the geocoder is back
+    resolved = [key for key in misses if results[key]['geocode_source'] != PENDING_SOURCE]
+    if stats is not None:
+        stats['degraded'] = len(misses) - len(resolved)
+    if db and resolved:
+        store_cached_coordinates_bulk(
+            [(country, location, results[(country, location)]) for country, location in resolved], db
+        )
+
+    logger.debug(f"Geocode memory cache: {memory_cache.stats()}")
+    return _expand_aliases(pairs, representatives, results)
+
+
+def _expand_aliases(
+    pairs: Dict[Tuple[str, Optional[str]], str],
+    representatives: Dict[str, Tuple[str, Optional[str]]],
+    results: Dict[Tuple[str, Optional[str]], Dict]
+) -> Dict[Tuple[str, Optional[str]], Dict]:
+    """Give every requested pair the result of the pair that stood in for its location hash."""
+    return {key: results[representatives[location_hash]] for key, location_hash in pairs.items()}
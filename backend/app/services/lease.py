@@ -0,0 +1,111 @@
+"""
+Collector Leases
+
+Expiring locks in the collector_leases table, so that work such as polling
+Beacon runs in exactly one process across every uvicorn/gunicorn worker and
+host sharing the database. Works on Postgres and SQLite. A holder that dies
+without releasing its lease blocks others only until the lease expires.
+
+Usage:
+    from app.services import lease
+
+    holder = lease.new_holder()
+    if lease.acquire(db, "beacon.poll", holder, ttl_seconds=900):
+        try:
+            ...
+            lease.renew(db, "beacon.poll", holder, ttl_seconds=900)
+        finally:
+            lease.release(db, "beacon.poll", holder)
+
+Notes:
+    - Every function commits immediately so other processes see the change;
+      call them before or after the caller's own unit of work, not inside it
+    - Acquiring a lease the caller already holds extends it, so work that can
+      overlap inside one process (a scheduled and a manual poll) needs a
+      holder of its own from new_holder() rather than PROCESS_HOLDER
+"""
+import datetime
+import os
+import socket
+import uuid
+from typing import Optional
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.schema import CollectorLease
+
+# Identifies this process as a lease holder; the nonce tells apart a restarted process reusing a PID
+PROCESS_HOLDER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def new_holder() -> str:
+    """Holder for one unit of work in this process, distinct from every other one."""
+    return f"{PROCESS_HOLDER}:{uuid.uuid4().hex}"
+
+
+def acquire(db: Session, name: str, holder: str, ttl_seconds: float) -> bool:
+    """Take the lease if it is free, expired or already ours. Returns True when held."""
+    now = datetime.datetime.utcnow()
+    expires_at = now + datetime.timedelta(seconds=ttl_seconds)
+    values = {"name": name, "holder": holder, "acquired_at": now, "expires_at": expires_at}
+
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+        # One atomic statement: insert, or take over only when the current lease is expired or ours
+        stmt = insert(CollectorLease).values(values).on_conflict_do_update(
+            index_elements=[CollectorLease.name],
+            set_={"holder": holder, "acquired_at": now, "expires_at": expires_at},
+            where=or_(CollectorLease.expires_at < now, CollectorLease.holder == holder),
+        )
+        acquired = db.execute(stmt).rowcount == 1
+        db.commit()
+        return acquired
+
+    result = db.execute(
+        update(CollectorLease)
+        .where(CollectorLease.name == name, or_(CollectorLease.expires_at < now, CollectorLease.holder == holder))
+        .values(holder=holder, acquired_at=now, expires_at=expires_at)
+    )
+    if result.rowcount == 1:
+        db.commit()
+        return True
+    try:
+        db.add(CollectorLease(**values))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def renew(db: Session, name: str, holder: str, ttl_seconds: float) -> bool:
+    """Extend a lease we hold. Returns False if it expired and another process took it."""
+    expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=ttl_seconds)
+    result = db.execute(
+        update(CollectorLease)
+        .where(CollectorLease.name == name, CollectorLease.holder == holder)
+        .values(expires_at=expires_at)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def release(db: Session, name: str, holder: str) -> None:
+    """Give the lease up early. Does nothing if another process holds it."""
+    db.execute(delete(CollectorLease).where(CollectorLease.name == name, CollectorLease.holder == holder))
+    db.commit()
+
+
+def current_holder(db: Session, name: str) -> Optional[str]:
+    """Holder of the unexpired lease, or None if nobody holds it."""
+    row = (
+        db.query(CollectorLease.holder)
+        .filter(CollectorLease.name == name, CollectorLease.expires_at >= datetime.datetime.utcnow())
+        .first()
+    )
+    return row.holder if row else None
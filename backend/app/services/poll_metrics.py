@@ -0,0 +1,65 @@
+"""
+Poll Metrics
+
+Per-stage wall-clock timings and counters for one Beacon poll. The collector
+stores them on the poll's sync_runs row, logs them when the poll ends and
+exposes them through /scraper-status and /sync-runs.
+
+Usage:
+    from app.services.poll_metrics import PollMetrics
+
+    metrics = PollMetrics()
+    with metrics.stage("parse"):
+        events = parse(payload)
+    metrics.count("events_seen", len(events))
+    logger.info(f"Poll metrics: {metrics.summary()}")
+
+Notes:
+    - Entering a stage name again adds to its total, so a stage can wrap a
+      per-event call (e.g. "redact") and report the time summed over the poll
+    - Stages may nest: "redact" time is also part of "normalize"
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping
+
+
+class PollMetrics:
+    def __init__(self):
+        self.stage_durations: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and add it to the stage's total seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.stage_durations[name] = self.stage_durations.get(name, 0.0) + elapsed
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge_counters(self, values: Mapping[str, object], prefix: str = "") -> None:
+        """Add the numeric entries of values (e.g. render request stats) as counters."""
+        for name, value in values.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.count(f"{prefix}{name}", int(value))
+
+    def rounded_durations(self) -> Dict[str, float]:
+        with self._lock:
+            return {name: round(seconds, 3) for name, seconds in self.stage_durations.items()}
+
+    def summary(self) -> str:
+        """One log line: stages slowest first, then counters."""
+        durations = sorted(self.rounded_durations().items(), key=lambda item: item[1], reverse=True)
+        stages = " ".join(f"{name}={seconds:.3f}s" for name, seconds in durations)
+        with self._lock:
+            counters = " ".join(f"{name}={value}" for name, value in sorted(self.counters.items()))
+        return f"{stages} | {counters}"
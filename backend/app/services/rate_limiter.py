@@ -0,0 +1,97 @@
+"""
+Rate Limiter shared across threads and processes
+
+Token bucket (in GCRA form) that hands every caller its own time slot, so
+concurrent callers queue up behind each other instead of sleeping a fixed
+interval after each call. State is kept in a small file locked with fcntl,
+which makes the limit hold across worker processes and scripts on the same host.
+
+Usage:
+    from app.services.rate_limiter import RateLimiter
+
+    limiter = RateLimiter(interval_seconds=1.1, state_path="/tmp/nominatim.rate")
+    limiter.acquire()              # blocking, for worker threads
+    await limiter.acquire_async()  # non-blocking, for the event loop
+
+Notes:
+    - Slots are reserved when acquire is called; a caller that is cancelled
+      while waiting still uses up its slot
+    - Without fcntl (Windows) or without a state path the limit is per process
+"""
+import asyncio
+import logging
+import os
+import struct
+import threading
+import time
+from typing import Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_STATE_FORMAT = "d"
+
+
+class RateLimiter:
+    def __init__(self, interval_seconds: float, burst: int = 1, state_path: Optional[str] = None):
+        """
+        Args:
+            interval_seconds: Minimum average spacing between calls
+            burst: Calls allowed back to back after an idle period
+            state_path: File shared by every process using this limit (optional)
+        """
+        self.interval_seconds = interval_seconds
+        self.burst = max(1, burst)
+        self.state_path = state_path if state_path and fcntl is not None else None
+        if state_path and fcntl is None:
+            logger.warning("fcntl unavailable, rate limit applies per process only")
+
+        self._lock = threading.Lock()
+        self._tat = 0.0  # theoretical arrival time of the next free slot (epoch seconds)
+
+    def reserve(self) -> float:
+        """Claim the next free slot and return how many seconds to wait for it."""
+        with self._lock:
+            if self.state_path is not None:
+                try:
+                    return self._reserve_shared()
+                except OSError as e:
+                    logger.warning(f"Rate limit state file unusable, limiting per process: {e}")
+                    self.state_path = None
+            self._tat, delay = self._advance(self._tat)
+            return delay
+
+    def acquire(self) -> float:
+        """Block the calling thread until its slot; returns the time waited."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Wait for a slot without blocking the event loop; returns the time waited."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def _advance(self, tat: float) -> Tuple[float, float]:
+        now = time.time()
+        slot = max(tat, now - (self.burst - 1) * self.interval_seconds)
+        return slot + self.interval_seconds, max(0.0, slot - now)
+
+    def _reserve_shared(self) -> float:
+        fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            raw = os.pread(fd, struct.calcsize(_STATE_FORMAT), 0)
+            tat = struct.unpack(_STATE_FORMAT, raw)[0] if len(raw) == struct.calcsize(_STATE_FORMAT) else 0.0
+            tat, delay = self._advance(tat)
+            os.pwrite(fd, struct.pack(_STATE_FORMAT, tat), 0)
+            return delay
+        finally:
+            os.close(fd)  # releases the flock
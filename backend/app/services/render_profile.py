@@ -0,0 +1,133 @@
+"""
+Render Profile for Beacon page fetches
+
+Routes every request a Beacon page makes: resources the parser never looks at
+(images, fonts, stylesheets, analytics, map tiles) are aborted, the rest are
+timed so slow upstream calls show up in the logs.
+
+Usage:
+    from app.services.render_profile import RenderProfile
+
+    profile = RenderProfile.from_env()
+    request_log = await profile.apply(page)
+    await page.goto(url)
+    logger.info(request_log.summary())
+
+Environment:
+    - BEACON_RENDER_PROFILE: 'lean' (default, block resources) or 'full' (load everything)
+    - BEACON_BLOCK_RESOURCE_TYPES: comma-separated Playwright resource types to abort
+    - BEACON_BLOCK_URL_PATTERNS: comma-separated regexes; matching URLs are aborted
+"""
+import logging
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = "image,media,font,stylesheet"
+DEFAULT_BLOCKED_URL_PATTERNS = ",".join([
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+    r"facebook\.(com|net)",
+    r"hotjar\.com",
+    r"sentry\.io",
+    r"tile\.openstreetmap\.org",
+    r"api\.mapbox\.com",
+    r"/tiles?/",
+])
+
+
+def _split_csv(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+class RequestLog:
+    """Per-request timings collected while a page loads."""
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self.blocked = 0
+        self._blocked_requests: Set[int] = set()
+
+    def mark_blocked(self, request: Any) -> None:
+        self.blocked += 1
+        self._blocked_requests.add(id(request))
+
+    def record(self, request: Any, failed: bool = False) -> None:
+        if id(request) in self._blocked_requests:
+            # Aborted by the profile, not a real failure
+            return
+        timing = request.timing or {}
+        response_end = timing.get("responseEnd", -1)
+        self.entries.append({
+            "url": request.url,
+            "resource_type": request.resource_type,
+            "duration_ms": round(response_end, 1) if response_end and response_end > 0 else None,
+            "failed": failed,
+        })
+
+    def summary(self, slowest: int = 5) -> Dict[str, Any]:
+        timed = [e for e in self.entries if e["duration_ms"] is not None]
+        timed.sort(key=lambda e: e["duration_ms"], reverse=True)
+        return {
+            "requests": len(self.entries),
+            "blocked": self.blocked,
+            "failed": sum(1 for e in self.entries if e["failed"]),
+            "total_request_ms": round(sum(e["duration_ms"] for e in timed), 1),
+            "slowest": timed[:slowest],
+        }
+
+
+class RenderProfile:
+    def __init__(
+        self,
+        blocked_resource_types: Iterable[str] = (),
+        blocked_url_patterns: Iterable[str] = (),
+    ):
+        self.blocked_resource_types = {t.lower() for t in blocked_resource_types}
+        patterns = list(blocked_url_patterns)
+        self.blocked_url_re: Optional[re.Pattern] = (
+            re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE) if patterns else None
+        )
+
+    @classmethod
+    def from_env(cls) -> "RenderProfile":
+        if os.getenv("BEACON_RENDER_PROFILE", "lean").lower() == "full":
+            return cls()
+        return cls(
+            blocked_resource_types=_split_csv(
+                os.getenv("BEACON_BLOCK_RESOURCE_TYPES", DEFAULT_BLOCKED_RESOURCE_TYPES)
+            ),
+            blocked_url_patterns=_split_csv(
+                os.getenv("BEACON_BLOCK_URL_PATTERNS", DEFAULT_BLOCKED_URL_PATTERNS)
+            ),
+        )
+
+    @property
+    def blocks_anything(self) -> bool:
+        return bool(self.blocked_resource_types) or self.blocked_url_re is not None
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return True
+        return self.blocked_url_re is not None and self.blocked_url_re.search(url) is not None
+
+    async def apply(self, page: Any) -> RequestLog:
+        """Install routing and timing hooks on a page before it navigates."""
+        request_log = RequestLog()
+
+        async def handle_route(route: Any) -> None:
+            request = route.request
+            if self.should_block(request.resource_type, request.url):
+                request_log.mark_blocked(request)
+                await route.abort()
+            else:
+                await route.continue_()
+
+        if self.blocks_anything:
+            await page.route("**/*", handle_route)
+        page.on("requestfinished", lambda request: request_log.record(request))
+        page.on("requestfailed", lambda request: request_log.record(request, failed=True))
+        return request_log
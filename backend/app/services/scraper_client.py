@@ -0,0 +1,110 @@
+"""
+Scraper Service Client
+
+Sends Beacon rendering to a separate scraper sidecar (see app/workers/scraper_service.py)
+so API and worker processes don't need Chromium or its memory.
+
+Usage:
+    from app.services.scraper_client import get_scraper_client
+
+    result = await get_scraper_client().render("/en/events", known_event_ids=["beacon-..."])
+    # Returns: {'html': '...', 'json_payloads': [...], 'events': [...], 'request_stats': {...}}
+
+Features:
+    - Connection pooling: one keep-alive httpx.AsyncClient per event loop
+    - Timeouts: separate connect and read timeouts (render can take tens of seconds)
+    - Retries: transport errors and 5xx responses retried with exponential backoff
+    - Retry budget: retries shared across calls are capped at a fraction of recent calls,
+      so a down sidecar is not hit max_retries extra times on every poll
+
+Environment:
+    - SCRAPER_BASE_URL: sidecar base URL (default http://localhost:8787)
+    - SCRAPER_TIMEOUT_SECONDS: read timeout for a render call (default 90)
+    - SCRAPER_MAX_RETRIES: retries after the first attempt (default 2)
+    - SCRAPER_RETRY_BUDGET_RATIO: retries allowed per render call over the last hour, beyond a floor of 2 (default 0.2)
+"""
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+
+from app.services.circuit_breaker import RetryBudget
+
+logger = logging.getLogger(__name__)
+
+# Shared by every client instance, since a new client is created per event loop
+retry_budget = RetryBudget(ratio=float(os.getenv("SCRAPER_RETRY_BUDGET_RATIO", "0.2")))
+
+
+class ScraperServiceError(Exception):
+    """Raised when the scraper sidecar cannot produce a render result."""
+
+
+class ScraperClient:
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self.base_url = (base_url or os.getenv("SCRAPER_BASE_URL", "http://localhost:8787")).rstrip("/")
+        self.timeout_seconds = timeout_seconds or float(os.getenv("SCRAPER_TIMEOUT_SECONDS", "90"))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("SCRAPER_MAX_RETRIES", "2"))
+        self.backoff_seconds = 0.5
+        self.loop = asyncio.get_running_loop()
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(self.timeout_seconds, connect=5.0),
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=300),
+        )
+
+    async def render(self, path: str, known_event_ids: Iterable[str] = ()) -> Dict[str, Any]:
+        """Ask the sidecar to render a Beacon page and return its captured payload."""
+        body = {"path": path, "known_event_ids": list(known_event_ids)}
+        last_error: Optional[Exception] = None
+        retry_budget.record_request()
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                if not retry_budget.try_spend_retry():
+                    raise ScraperServiceError(f"Scraper service retry budget exhausted: {last_error}")
+                await asyncio.sleep(self.backoff_seconds * (2 ** (attempt - 1)))
+            try:
+                response = await self._client.post("/render", json=body)
+            except httpx.TransportError as e:
+                last_error = e
+                logger.warning(f"Scraper service unreachable (attempt {attempt + 1}): {e}")
+                continue
+
+            if response.status_code >= 500:
+                last_error = ScraperServiceError(f"HTTP {response.status_code}: {response.text[:200]}")
+                logger.warning(f"Scraper service error (attempt {attempt + 1}): {last_error}")
+                continue
+            if response.status_code >= 400:
+                raise ScraperServiceError(f"HTTP {response.status_code}: {response.text[:200]}")
+            return response.json()
+
+        raise ScraperServiceError(f"Scraper service failed after {self.max_retries + 1} attempts: {last_error}")
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+_client: Optional[ScraperClient] = None
+
+
+def get_scraper_client() -> ScraperClient:
+    """Return the client bound to the running event loop, creating it if needed."""
+    global _client
+    if _client is None or _client.loop is not asyncio.get_running_loop():
+        _client = ScraperClient()
+    return _client
+
+
+async def close_scraper_client() -> None:
+    global _client
+    if _client is not None and _client.loop is asyncio.get_running_loop():
+        await _client.close()
+    _client = None
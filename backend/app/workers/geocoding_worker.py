@@ -0,0 +1,169 @@
+"""
+Geocoding Worker
+
+Resolves coordinates for signals the Beacon collector stored with
+geocode_source='pending' (GEOCODE_DEFERRED=1), so a slow geocoder no longer
+delays new signals reaching the triage list. Runs in the API process next to
+the Beacon poll loop; the geocoding.worker lease lets only one process at a
+time work on a batch, so workers on other processes and hosts never look up
+the same rows.
+
+Usage:
+    from app.workers import geocoding_worker
+
+    geocoding_worker.process_pending_signals(db)                   # one batch, blocking
+    geocoding_worker.run_leased_batch(db)                          # one batch if no other process is busy
+    asyncio.create_task(geocoding_worker.geocoding_worker_loop())  # at startup
+    geocoding_worker.wake()                                        # after a poll
+
+Process:
+    1. Select up to GEOCODE_WORKER_BATCH_SIZE pending signals, those without
+       coordinates first, then oldest first
+    2. Geocode their unique (country, location) pairs with geocode_locations
+    3. Write coordinates back with one executemany UPDATE by primary key,
+       skipping signals a poll moved to another location meanwhile
+    4. Bump the map-data version so /map-data clients refetch
+
+While the geocoder is unavailable (circuit open), signals get country-level
+coordinates but stay 'pending', and are retried on later passes.
+"""
+import asyncio
+import datetime
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.schema import Signal
+from app.services import collector_state, lease
+from app.services.geocoding_service import PENDING_SOURCE, geocode_locations
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = int(os.getenv("GEOCODE_WORKER_BATCH_SIZE", "200"))
+# Idle wait between checks; a poll that stores pending signals wakes the worker early
+INTERVAL_SECONDS = float(os.getenv("GEOCODE_WORKER_INTERVAL_SECONDS", "60"))
+# Only the process holding this lease geocodes a batch; the TTL must outlast the slowest batch
+WORKER_LEASE_NAME = "geocoding.worker"
+LEASE_SECONDS = float(os.getenv("GEOCODE_WORKER_LEASE_SECONDS", "900"))
+
+# Geocoding blocks on the rate limiter; one thread keeps it off the event loop and the collector pool
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="geocoding-worker")
+_wake_event: Optional[asyncio.Event] = None
+
+# A poll may relocate a signal while its batch is being geocoded; only rows still pending at the
+# looked-up location are written, and a relocated signal waits for the next batch
+_signals = Signal.__table__
+_update_stmt = (
+    update(_signals)
+    .where(
+        _signals.c.id == bindparam("b_id"),
+        _signals.c.geocode_source == PENDING_SOURCE,
+        _signals.c.country == bindparam("b_country"),
+        _signals.c.location.is_not_distinct_from(bindparam("b_location")),
+    )
+    .values(
+        latitude=bindparam("b_latitude"),
+        longitude=bindparam("b_longitude"),
+        geocoded_at=bindparam("b_geocoded_at"),
+        geocode_source=bindparam("b_geocode_source"),
+        location_hash=bindparam("b_location_hash"),
+        updated_at=bindparam("b_updated_at"),
+    )
+)
+
+
+def process_pending_signals(db: Session, batch_size: int = BATCH_SIZE) -> int:
+    """Geocode one batch of pending signals and commit. Returns the number of signals resolved."""
+    pending = (
+        db.query(Signal.id, Signal.country, Signal.location, Signal.latitude)
+        .filter(Signal.geocode_source == PENDING_SOURCE)
+        # Signals without coordinates first, so an outage's country-level fallbacks cannot starve new ones
+        .order_by(Signal.latitude.isnot(None), Signal.created_at)
+        .limit(batch_size)
+        .all()
+    )
+    if not pending:
+        return 0
+
+    results = geocode_locations([(row.country, row.location) for row in pending], db=db)
+    now = datetime.datetime.utcnow()
+    rows = []
+    degraded = 0
+    for row in pending:
+        result = results[(row.country, row.location)]
+        if result.get("geocode_source") == PENDING_SOURCE:
+            degraded += 1
+            if row.latitude is not None:
+                continue  # Already shows its country-level fallback
+        rows.append({
+            "b_id": row.id,
+            "b_country": row.country,
+            "b_location": row.location,
+            "b_latitude": result.get("latitude"),
+            "b_longitude": result.get("longitude"),
+            "b_geocoded_at": result.get("geocoded_at"),
+            "b_geocode_source": result.get("geocode_source"),
+            "b_location_hash": result.get("location_hash"),
+            "b_updated_at": now,
+        })
+    if rows:
+        db.execute(_update_stmt, rows)
+        collector_state.bump_version(db, collector_state.MAP_DATA_VERSION_KEY)
+        db.commit()
+
+    resolved = len(pending) - degraded
+    logger.info(f"Geocoded {resolved} pending signals ({len(results)} unique locations)")
+    if degraded:
+        logger.warning(f"Geocoder unavailable: {degraded} signals left pending at country level")
+    # Degraded signals are not counted, so the drain loop stops instead of spinning during an outage
+    return resolved
+
+
+def run_leased_batch(db: Session, holder: str = lease.PROCESS_HOLDER, batch_size: int = BATCH_SIZE) -> int:
+    """Process one batch while holding the worker lease. Returns 0 if another process holds it."""
+    if not lease.acquire(db, WORKER_LEASE_NAME, holder, LEASE_SECONDS):
+        logger.debug("Another process is geocoding pending signals, skipping batch")
+        return 0
+    try:
+        return process_pending_signals(db, batch_size)
+    finally:
+        db.rollback()  # leaves a failed batch's transaction so the release can commit
+        lease.release(db, WORKER_LEASE_NAME, holder)
+
+
+def _run_batch() -> int:
+    db = SessionLocal()
+    try:
+        return run_leased_batch(db)
+    finally:
+        db.close()
+
+
+def wake() -> None:
+    """Start the next batch now instead of after the idle interval."""
+    if _wake_event is not None:
+        _wake_event.set()
+
+
+async def geocoding_worker_loop() -> None:
+    """Drain pending signals batch by batch, then wait for wake() or the idle interval."""
+    global _wake_event
+    _wake_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    while True:
+        _wake_event.clear()
+        try:
+            # A full batch means more may be waiting
+            while await loop.run_in_executor(_executor, _run_batch) >= BATCH_SIZE:
+                pass
+        except Exception as e:
+            logger.error(f"Geocoding worker batch failed: {e}")
+        try:
+            await asyncio.wait_for(_wake_event.wait(), timeout=INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
@@ -0,0 +1,134 @@
+"""
+Adaptive Beacon Poll Scheduler
+
+Runs the Beacon poll loop in the API process. Instead of a fixed interval, the
+wait between polls follows how often Beacon actually changes:
+
+    - A poll that stored new or revised signals halves the interval (down to the minimum)
+    - A poll that found nothing new stretches it by half (up to the maximum)
+    - A failed poll keeps the interval but doubles the wait for each consecutive
+      failure (up to the backoff cap); the loop itself never stops
+    - A poll skipped because another process holds the poll lease leaves the interval unchanged
+
+Usage:
+    from app.workers.poll_scheduler import beacon_poll_loop
+
+    asyncio.create_task(beacon_poll_loop())
+
+Environment:
+    - BEACON_POLL_INTERVAL_MINUTES: starting interval (default 15)
+    - BEACON_POLL_MIN_INTERVAL_MINUTES: shortest interval (default 5); scheduled polls use it instead of
+      the BEACON_MIN_INTERVAL_MINUTES guard on manual polls
+    - BEACON_POLL_MAX_INTERVAL_MINUTES: longest interval while idle (default 60)
+    - BEACON_POLL_MAX_BACKOFF_MINUTES: longest wait after repeated failures (default 120)
+    - BEACON_POLL_JITTER_SECONDS: random extra wait so worker processes do not wake together (default 30)
+"""
+import asyncio
+import logging
+import os
+import random
+from typing import Awaitable, Callable, Optional
+
+from app.database import SessionLocal
+from app.services.beacon_collector import BeaconCollector
+from app.workers import geocoding_worker
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_FACTOR = 0.5
+IDLE_FACTOR = 1.5
+
+
+class PollScheduler:
+    def __init__(
+        self,
+        interval_seconds: float,
+        min_interval_seconds: float,
+        max_interval_seconds: float,
+        max_backoff_seconds: float,
+        jitter_seconds: float = 0.0,
+    ):
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max(max_interval_seconds, min_interval_seconds)
+        self.max_backoff_seconds = max(max_backoff_seconds, self.max_interval_seconds)
+        self.jitter_seconds = jitter_seconds
+        self.interval_seconds = self._clamp(interval_seconds)
+        self.consecutive_errors = 0
+
+    @classmethod
+    def from_env(cls) -> "PollScheduler":
+        return cls(
+            interval_seconds=float(os.getenv("BEACON_POLL_INTERVAL_MINUTES", "15")) * 60,
+            min_interval_seconds=float(os.getenv("BEACON_POLL_MIN_INTERVAL_MINUTES", "5")) * 60,
+            max_interval_seconds=float(os.getenv("BEACON_POLL_MAX_INTERVAL_MINUTES", "60")) * 60,
+            max_backoff_seconds=float(os.getenv("BEACON_POLL_MAX_BACKOFF_MINUTES", "120")) * 60,
+            jitter_seconds=float(os.getenv("BEACON_POLL_JITTER_SECONDS", "30")),
+        )
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.max_interval_seconds, max(self.min_interval_seconds, seconds))
+
+    def record_success(self, changes: Optional[int]) -> None:
+        """Adapt to a finished poll; changes is None when the poll was skipped."""
+        self.consecutive_errors = 0
+        if changes is None:
+            return
+        factor = ACTIVE_FACTOR if changes > 0 else IDLE_FACTOR
+        self.interval_seconds = self._clamp(self.interval_seconds * factor)
+
+    def record_error(self) -> None:
+        self.consecutive_errors += 1
+
+    def next_delay(self) -> float:
+        """Seconds to wait before the next poll, jitter included."""
+        delay = self.interval_seconds
+        if self.consecutive_errors:
+            delay = min(self.max_backoff_seconds, delay * 2 ** self.consecutive_errors)
+        if self.jitter_seconds > 0:
+            delay += random.uniform(0, self.jitter_seconds)
+        return delay
+
+
+async def poll_beacon_once(min_interval_seconds: Optional[float] = None) -> Optional[int]:
+    """Run one poll. Returns new plus revised signals, or None if this process did not poll.
+
+    min_interval_seconds replaces the collector's manual-poll guard, so another
+    process's recent poll still causes a skip.
+    """
+    db = SessionLocal()
+    try:
+        collector = BeaconCollector(db)
+        min_interval_minutes = min_interval_seconds / 60 if min_interval_seconds is not None else None
+        await collector.fetch_and_process_async(min_interval_minutes=min_interval_minutes)
+        if collector.skip_reason is not None:
+            return None
+        counters = collector.metrics.counters
+        return counters.get("inserted", 0) + counters.get("updated", 0)
+    finally:
+        db.close()
+        geocoding_worker.wake()
+
+
+async def run_poll_loop(
+    scheduler: PollScheduler,
+    poll: Callable[[], Awaitable[Optional[int]]] = poll_beacon_once,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> None:
+    """Poll forever; failures are logged and backed off, never raised."""
+    while True:
+        try:
+            scheduler.record_success(await poll())
+        except Exception as e:
+            scheduler.record_error()
+            logger.error(f"Beacon poll failed ({scheduler.consecutive_errors} in a row): {e}")
+        delay = scheduler.next_delay()
+        logger.info(f"Next Beacon poll in {delay / 60:.1f} minutes")
+        await sleep(delay)
+
+
+async def beacon_poll_loop() -> None:
+    enabled = os.getenv("ENABLE_BEACON_POLLING", "1").lower() in {"1", "true", "yes"}
+    if not enabled:
+        return
+    scheduler = PollScheduler.from_env()
+    await run_poll_loop(scheduler, poll=lambda: poll_beacon_once(scheduler.min_interval_seconds))
@@ -0,0 +1,61 @@
+"""
+Beacon Scraper Service
+
+Standalone sidecar that owns Chromium and renders Beacon pages for API and
+worker processes running with BEACON_FETCH_MODE=remote.
+
+Usage:
+    uvicorn app.workers.scraper_service:app --port 8787
+
+Endpoints:
+    - POST /render: render a Beacon page, returns html/json_payloads/events/request_stats
+    - GET /health: browser pool state
+"""
+import os
+from dataclasses import asdict
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+from app.services.beacon_collector import BeaconCollector
+from app.services.browser_pool import close_browser_pool, get_browser_pool
+
+app = FastAPI(title="GHI Beacon Scraper Service")
+
+
+class RenderRequest(BaseModel):
+    path: Optional[str] = None
+    known_event_ids: List[str] = []
+
+
+def _check_beacon_path(path: str) -> None:
+    """Reject paths that would send the browser off the Beacon host (e.g. "@evil.example/")."""
+    base_url = os.getenv("BEACON_BASE_URL", "https://beaconbio.org")
+    if not path.startswith("/") or path.startswith("//") or "\\" in path:
+        raise HTTPException(status_code=400, detail="path must be a single-slash absolute path")
+    if urlsplit(f"{base_url}{path}").netloc != urlsplit(base_url).netloc:
+        raise HTTPException(status_code=400, detail="path must stay on the Beacon host")
+
+
+@app.post("/render")
+async def render(request: RenderRequest):
+    # The sidecar has no database; early stop relies on the IDs sent by the caller
+    collector = BeaconCollector(db=None)
+    collector.fetch_mode = "local"
+    if request.path:
+        _check_beacon_path(request.path)
+        collector.beacon_path = request.path
+    payload = await collector.render_beacon_page(known_event_ids=set(request.known_event_ids))
+    return asdict(payload)
+
+
+@app.get("/health")
+async def health():
+    return {"status": "healthy", "browser_pool": get_browser_pool().stats(), "pid": os.getpid()}
+
+
+@app.on_event("shutdown")
+async def stop_browser_pool() -> None:
+    await close_browser_pool()
@@ -0,0 +1,12 @@
+-- Migration: Add source_url_hash to signals
+-- Created: 2026-10-17
+-- Description: Indexed MD5 of source_url so Beacon polls can deduplicate a whole batch with one IN query
+
+ALTER TABLE signals ADD COLUMN IF NOT EXISTS source_url_hash VARCHAR(32);
+
+-- Backfill existing rows (md5() matches the collector's hashlib.md5 of the UTF-8 URL)
+UPDATE signals SET source_url_hash = md5(source_url) WHERE source_url_hash IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_signals_source_url_hash ON signals(source_url_hash);
+
+COMMENT ON COLUMN signals.source_url_hash IS 'MD5 hex digest of source_url, used for batch deduplication';
@@ -0,0 +1,9 @@
+-- Migration: Add source_url_hash to signals (SQLite version)
+-- Created: 2026-10-17
+-- Description: Indexed MD5 of source_url so Beacon polls can deduplicate a whole batch with one IN query
+-- SQLite has no md5(); backfill existing rows afterwards with:
+--     python backend/scripts/backfill_source_url_hash.py
+
+ALTER TABLE signals ADD COLUMN source_url_hash VARCHAR(32);
+
+CREATE INDEX IF NOT EXISTS ix_signals_source_url_hash ON signals(source_url_hash);
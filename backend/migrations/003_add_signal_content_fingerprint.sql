@@ -0,0 +1,8 @@
+-- Migration: Add content_fingerprint to signals
+-- Created: 2026-10-17
+-- Description: Hash of Beacon-owned fields so revised case/death counts can be detected and rewritten
+-- Existing rows start NULL and are rewritten once, the next time Beacon lists them.
+
+ALTER TABLE signals ADD COLUMN IF NOT EXISTS content_fingerprint VARCHAR(32);
+
+COMMENT ON COLUMN signals.content_fingerprint IS 'MD5 of disease, location, onset, cases, deaths, description and outbreak status as last seen on Beacon';
@@ -0,0 +1,6 @@
+-- Migration: Add content_fingerprint to signals (SQLite version)
+-- Created: 2026-10-17
+-- Description: Hash of Beacon-owned fields so revised case/death counts can be detected and rewritten
+-- Existing rows start NULL and are rewritten once, the next time Beacon lists them.
+
+ALTER TABLE signals ADD COLUMN content_fingerprint VARCHAR(32);
@@ -0,0 +1,11 @@
+-- Migration: Add collector_state table
+-- Created: 2026-10-17
+-- Description: Key/value bookkeeping shared by all collector processes (payload and candidate fingerprints)
+
+CREATE TABLE IF NOT EXISTS collector_state (
+    key VARCHAR(100) PRIMARY KEY,
+    value JSON,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE collector_state IS 'Persistent bookkeeping for background collectors, e.g. beacon.payload_fingerprint';
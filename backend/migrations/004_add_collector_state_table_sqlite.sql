@@ -0,0 +1,9 @@
+-- Migration: Add collector_state table (SQLite version)
+-- Created: 2026-10-17
+-- Description: Key/value bookkeeping shared by all collector processes (payload and candidate fingerprints)
+
+CREATE TABLE IF NOT EXISTS collector_state (
+    key VARCHAR(100) PRIMARY KEY,
+    value TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
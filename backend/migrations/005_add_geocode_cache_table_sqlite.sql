@@ -0,0 +1,46 @@
+-- Migration: Add geocode_cache table (SQLite version)
+-- Created: 2026-10-17
+-- Description: Dedicated geocoding cache keyed by location_hash, seeded from already geocoded signals
+
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    location_hash VARCHAR(32) PRIMARY KEY,
+    country VARCHAR(100),
+    location VARCHAR(255),
+    latitude NUMERIC(10, 7),
+    longitude NUMERIC(10, 7),
+    geocode_source VARCHAR(50),
+    precision VARCHAR(20),
+    hit_count INTEGER DEFAULT 0,
+    last_hit_at TIMESTAMP,
+    expires_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_geocode_cache_expires_at ON geocode_cache(expires_at);
+
+-- Seed from signals that already carry coordinates (one row per location_hash).
+-- Source and precision come from the signal's geocode_source; a signal that only knows 'cache'
+-- leaves them NULL (unless it has no location, which is always country precision)
+INSERT OR IGNORE INTO geocode_cache (location_hash, country, location, latitude, longitude, geocode_source, precision, expires_at)
+SELECT
+    location_hash, country, location, latitude, longitude,
+    CASE WHEN geocode_source IN ('location', 'country') THEN geocode_source END,
+    CASE
+        WHEN location IS NULL OR geocode_source = 'country' THEN 'country'
+        WHEN geocode_source = 'location' THEN 'location'
+    END,
+    datetime('now', '+180 days')
+FROM (
+    SELECT
+        location_hash, country, location, latitude, longitude, geocode_source,
+        ROW_NUMBER() OVER (
+            PARTITION BY location_hash
+            ORDER BY geocode_source IN ('location', 'country') DESC, geocoded_at DESC
+        ) AS row_number
+    FROM signals
+    WHERE location_hash IS NOT NULL
+      AND latitude IS NOT NULL
+      AND longitude IS NOT NULL
+)
+WHERE row_number = 1;
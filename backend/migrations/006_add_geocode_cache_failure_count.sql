@@ -0,0 +1,7 @@
+-- Migration: Add failure_count to geocode_cache
+-- Created: 2026-10-17
+-- Description: Negative caching - failed lookups are stored with a short expiry and a retry budget
+
+ALTER TABLE geocode_cache ADD COLUMN IF NOT EXISTS failure_count INTEGER DEFAULT 0;
+
+COMMENT ON COLUMN geocode_cache.failure_count IS 'Consecutive failed lookups of the specific location; reset on success';
@@ -0,0 +1,5 @@
+-- Migration: Add failure_count to geocode_cache (SQLite version)
+-- Created: 2026-10-17
+-- Description: Negative caching - failed lookups are stored with a short expiry and a retry budget
+
+ALTER TABLE geocode_cache ADD COLUMN failure_count INTEGER DEFAULT 0;
@@ -0,0 +1,7 @@
+-- Migration: Index signals.geocode_source
+-- Created: 2026-10-17
+-- Description: Deferred geocoding - the geocoding worker selects signals with geocode_source = 'pending'
+
+CREATE INDEX IF NOT EXISTS ix_signals_geocode_source ON signals(geocode_source);
+
+COMMENT ON COLUMN signals.geocode_source IS 'location, gazetteer, country, cache, failed, or pending until the geocoding worker resolves it';
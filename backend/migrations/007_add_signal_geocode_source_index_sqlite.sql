@@ -0,0 +1,5 @@
+-- Migration: Index signals.geocode_source (SQLite version)
+-- Created: 2026-10-17
+-- Description: Deferred geocoding - the geocoding worker selects signals with geocode_source = 'pending'
+
+CREATE INDEX IF NOT EXISTS ix_signals_geocode_source ON signals(geocode_source);
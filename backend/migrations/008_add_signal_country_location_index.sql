@@ -0,0 +1,5 @@
+-- Migration: Index signals by (country, location)
+-- Created: 2026-10-17
+-- Description: Geocoding backfill groups ungeocoded signals by location and updates each group with one indexed UPDATE
+
+CREATE INDEX IF NOT EXISTS ix_signals_country_location ON signals(country, location);
@@ -0,0 +1,13 @@
+-- Migration: Add collector_leases table
+-- Created: 2026-10-17
+-- Description: Cluster-wide poll coordination - only the process holding the beacon.poll lease scrapes Beacon
+
+CREATE TABLE IF NOT EXISTS collector_leases (
+    name VARCHAR(100) PRIMARY KEY,
+    holder VARCHAR(255) NOT NULL,
+    acquired_at TIMESTAMP WITH TIME ZONE,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+COMMENT ON TABLE collector_leases IS 'Expiring locks taken by background collectors; an expired lease can be taken over by any process';
+COMMENT ON COLUMN collector_leases.holder IS 'hostname:pid:nonce of the process holding the lease';
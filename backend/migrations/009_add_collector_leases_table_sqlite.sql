@@ -0,0 +1,10 @@
+-- Migration: Add collector_leases table (SQLite version)
+-- Created: 2026-10-17
+-- Description: Cluster-wide poll coordination - only the process holding the beacon.poll lease scrapes Beacon
+
+CREATE TABLE IF NOT EXISTS collector_leases (
+    name VARCHAR(100) PRIMARY KEY,
+    holder VARCHAR(255) NOT NULL,
+    acquired_at TIMESTAMP,
+    expires_at TIMESTAMP NOT NULL
+);
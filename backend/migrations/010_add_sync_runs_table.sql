@@ -0,0 +1,27 @@
+-- Migration: Add sync_runs table
+-- Created: 2026-10-17
+-- Description: One row per Beacon poll; scraper status reads the newest run instead of scanning max(signals.last_beacon_sync)
+
+CREATE TABLE IF NOT EXISTS sync_runs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    started_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    finished_at TIMESTAMP WITH TIME ZONE,
+    status VARCHAR(20) NOT NULL DEFAULT 'running',
+    holder VARCHAR(255),
+    events_seen INTEGER DEFAULT 0,
+    inserted_count INTEGER DEFAULT 0,
+    updated_count INTEGER DEFAULT 0,
+    error TEXT,
+    stage_durations JSON
+);
+
+CREATE INDEX IF NOT EXISTS ix_sync_runs_started_at ON sync_runs(started_at);
+
+-- Seed with the last sync recorded on signals, so the poll interval still holds right after the upgrade
+INSERT INTO sync_runs (started_at, finished_at, status)
+SELECT MAX(last_beacon_sync), MAX(last_beacon_sync), 'success'
+FROM signals
+HAVING MAX(last_beacon_sync) IS NOT NULL;
+
+COMMENT ON TABLE sync_runs IS 'Beacon poll history: timing, outcome, counts and per-stage durations';
+COMMENT ON COLUMN sync_runs.status IS 'running, success or failed';
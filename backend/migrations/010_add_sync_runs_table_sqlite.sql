@@ -0,0 +1,24 @@
+-- Migration: Add sync_runs table (SQLite version)
+-- Created: 2026-10-17
+-- Description: One row per Beacon poll; scraper status reads the newest run instead of scanning max(signals.last_beacon_sync)
+
+CREATE TABLE IF NOT EXISTS sync_runs (
+    id TEXT PRIMARY KEY,
+    started_at TIMESTAMP NOT NULL,
+    finished_at TIMESTAMP,
+    status VARCHAR(20) NOT NULL DEFAULT 'running',
+    holder VARCHAR(255),
+    events_seen INTEGER DEFAULT 0,
+    inserted_count INTEGER DEFAULT 0,
+    updated_count INTEGER DEFAULT 0,
+    error TEXT,
+    stage_durations TEXT
+);
+
+CREATE INDEX IF NOT EXISTS ix_sync_runs_started_at ON sync_runs(started_at);
+
+-- Seed with the last sync recorded on signals, so the poll interval still holds right after the upgrade
+INSERT INTO sync_runs (id, started_at, finished_at, status)
+SELECT lower(hex(randomblob(16))), last_sync, last_sync, 'success'
+FROM (SELECT MAX(last_beacon_sync) AS last_sync FROM signals)
+WHERE last_sync IS NOT NULL;
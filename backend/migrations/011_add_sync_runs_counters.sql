@@ -0,0 +1,8 @@
+-- Migration: Add counters to sync_runs
+-- Created: 2026-10-17
+-- Description: Per-poll counters (candidates per parse strategy, geocode cache hits, render requests) next to stage durations
+
+ALTER TABLE sync_runs ADD COLUMN IF NOT EXISTS counters JSON;
+
+COMMENT ON COLUMN sync_runs.stage_durations IS 'Seconds per collector stage: total, fetch, parse, fingerprint, normalize, redact (within normalize), geocode, dedup, write, commit';
+COMMENT ON COLUMN sync_runs.counters IS 'Per-poll counters, e.g. events_seen, candidates_json, geocode_cache_hits, geocode_lookups, inserted, render_blocked';
@@ -0,0 +1,5 @@
+-- Migration: Add counters to sync_runs (SQLite version)
+-- Created: 2026-10-17
+-- Description: Per-poll counters (candidates per parse strategy, geocode cache hits, render requests) next to stage durations
+
+ALTER TABLE sync_runs ADD COLUMN counters TEXT;
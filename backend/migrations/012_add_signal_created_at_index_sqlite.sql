@@ -0,0 +1,5 @@
+-- Migration: Index signals.created_at (SQLite version)
+-- Created: 2026-10-17
+-- Description: Remote fetch mode (BEACON_FETCH_MODE=remote) sends the scraper service the newest stored Beacon event IDs (ORDER BY created_at DESC LIMIT n) for its early-stop check
+
+CREATE INDEX IF NOT EXISTS ix_signals_created_at ON signals(created_at);
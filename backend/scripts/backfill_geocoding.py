@@ -1,78 +1,154 @@
 """
 Backfill Geocoding Script
 
-Geocodes all existing signals that don't have coordinates.
-Processes in batches to respect Nominatim rate limit (1 req/sec).
+Geocodes all existing signals that don't have coordinates, one unique
+(country, location) at a time rather than one signal at a time.
+
+Process:
+    1. Page through the distinct (country, location) pairs of ungeocoded signals, in key order
+    2. Geocode each page with geocode_locations: gazetteer and cache first, then
+       concurrent Nominatim lookups spaced by the shared rate limiter
+    3. Write each pair's result to all of its signals with one executemany UPDATE
+    4. Commit and record the last pair in a checkpoint file, so an interrupted run resumes there
+
+Memory stays bounded by the page size, whatever the number of signals.
 
 Usage:
     python backend/scripts/backfill_geocoding.py
+    python backend/scripts/backfill_geocoding.py --page-size 200 --concurrency 4
+    python backend/scripts/backfill_geocoding.py --restart   # ignore an existing checkpoint
 """
+import argparse
+import json
 import sys
 import os
+import tempfile
+from collections import Counter
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from sqlalchemy import and_, bindparam, func, or_, update
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models.schema import Signal
-from app.services.geocoding_service import geocode_signal_location
+from app.services import collector_state, geocoding_service
+from app.services.geocoding_service import geocode_locations
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = 50  # Process 50 signals at a time
+PAGE_SIZE = 500  # Unique (country, location) pairs per page
+CHECKPOINT_PATH = os.path.join(tempfile.gettempdir(), "ghi-backfill-geocoding.json")
 
 
-def backfill_geocoding():
+def load_checkpoint(path: str):
+    """Return the saved progress dict, or None when there is nothing to resume."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path: str, checkpoint: dict) -> None:
+    # Write-then-rename, so a crash mid-write never leaves a truncated checkpoint
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def fetch_location_page(db: Session, after, page_size: int):
+    """Next page of (country, location, signal count) for ungeocoded signals, after the given key."""
+    # NULL locations sort as '' so the key order is the same on Postgres and SQLite
+    location_key = func.coalesce(Signal.location, "")
+    query = db.query(Signal.country, location_key, func.count(Signal.id)).filter(Signal.latitude.is_(None))
+    if after is not None:
+        country, location = after
+        query = query.filter(or_(Signal.country > country, and_(Signal.country == country, location_key > location)))
+    return query.group_by(Signal.country, location_key).order_by(Signal.country, location_key).limit(page_size).all()
+
+
+def backfill_geocoding(
+    page_size: int = PAGE_SIZE,
+    checkpoint_path: str = CHECKPOINT_PATH,
+    restart: bool = False,
+    session_factory=SessionLocal,
+):
     """Backfill geocoding for all signals missing coordinates."""
-    db: Session = SessionLocal()
+    db: Session = session_factory()
+
+    checkpoint = None if restart else load_checkpoint(checkpoint_path)
+    if checkpoint:
+        logger.info(
+            f"Resuming after {checkpoint['after']} "
+            f"({checkpoint['locations']} locations, {checkpoint['signals']} signals done)"
+        )
+    else:
+        checkpoint = {"after": None, "locations": 0, "signals": 0}
+
+    # Only the rows still missing coordinates are touched; anything geocoded meanwhile is left alone
+    signals = Signal.__table__
+    stmt = (
+        update(signals)
+        .where(
+            signals.c.country == bindparam("b_country"),
+            # The pager's own key, so '' and NULL locations both match their ('', country) group
+            func.coalesce(signals.c.location, "") == bindparam("b_location"),
+            signals.c.latitude.is_(None),
+        )
+        .values(
+            latitude=bindparam("b_latitude"),
+            longitude=bindparam("b_longitude"),
+            geocoded_at=bindparam("b_geocoded_at"),
+            geocode_source=bindparam("b_geocode_source"),
+            location_hash=bindparam("b_location_hash"),
+        )
+    )
 
     try:
-        # Query signals without coordinates
-        signals_to_geocode = db.query(Signal).filter(
-            Signal.latitude.is_(None)
-        ).all()
-
-        total = len(signals_to_geocode)
-        logger.info(f"Found {total} signals without coordinates")
-
-        if total == 0:
-            logger.info("All signals already geocoded!")
-            return
-
-        # Process in batches
-        for i in range(0, total, BATCH_SIZE):
-            batch = signals_to_geocode[i:i + BATCH_SIZE]
-            logger.info(f"Processing batch {i // BATCH_SIZE + 1} ({i + 1}-{min(i + BATCH_SIZE, total)} of {total})")
-
-            for signal in batch:
-                try:
-                    # Use country-only geocoding for backfill (faster, always succeeds)
-                    # Cache-first lookup will check DB first
-                    result = geocode_signal_location(signal.country, signal.location, db=db)
-
-                    # Update signal
-                    signal.latitude = result.get('latitude')
-                    signal.longitude = result.get('longitude')
-                    signal.geocoded_at = result.get('geocoded_at')
-                    signal.geocode_source = result.get('geocode_source')
-                    signal.location_hash = result.get('location_hash')
-
-                    logger.info(
-                        f"  ✓ {signal.country} {f'({signal.location})' if signal.location else ''}: "
-                        f"{result.get('geocode_source')} → {result.get('latitude'):.4f}, {result.get('longitude'):.4f}"
-                    )
-
-                except Exception as e:
-                    logger.error(f"  ✗ Failed to geocode {signal.country}: {str(e)}")
-
-            # Commit batch
+        sources = Counter()
+        while True:
+            page = fetch_location_page(db, checkpoint["after"], page_size)
+            if not page:
+                break
+
+            keys = [(country, location or None) for country, location, _ in page]
+            results = geocode_locations(keys, db=db)
+            db.execute(stmt, [
+                {
+                    "b_country": country,
+                    "b_location": location,
+                    "b_latitude": results[key].get("latitude"),
+                    "b_longitude": results[key].get("longitude"),
+                    "b_geocoded_at": results[key].get("geocoded_at"),
+                    "b_geocode_source": results[key].get("geocode_source"),
+                    "b_location_hash": results[key].get("location_hash"),
+                }
+                for (country, location, _), key in zip(page, keys)
+            ])
+            collector_state.bump_version(db, collector_state.MAP_DATA_VERSION_KEY)
             db.commit()
-            logger.info(f"Batch {i // BATCH_SIZE + 1} committed")
 
-        logger.info(f"\n✓ Backfill complete! Geocoded {total} signals")
+            page_sources = Counter(results[key].get("geocode_source") for key in keys)
+            sources.update(page_sources)
+            checkpoint["after"] = [page[-1][0], page[-1][1]]
+            checkpoint["locations"] += len(page)
+            checkpoint["signals"] += sum(count for _, _, count in page)
+            save_checkpoint(checkpoint_path, checkpoint)
+            logger.info(
+                f"Geocoded {checkpoint['locations']} locations / {checkpoint['signals']} signals "
+                f"(page: {dict(page_sources)})"
+            )
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        logger.info(
+            f"✓ Backfill complete! Geocoded {checkpoint['signals']} signals "
+            f"at {checkpoint['locations']} locations {dict(sources)}"
+        )
 
     except Exception as e:
         logger.error(f"Backfill failed: {str(e)}")
@@ -84,4 +160,13 @@ def backfill_geocoding():
 
 
 if __name__ == "__main__":
-    backfill_geocoding()
+    parser = argparse.ArgumentParser(description="Geocode signals that have no coordinates")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE, help="Unique locations per page")
+    parser.add_argument("--concurrency", type=int, default=None, help="Override GEOCODE_CONCURRENCY")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH, help="Progress file for resuming")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    args = parser.parse_args()
+
+    if args.concurrency is not None:
+        geocoding_service.GEOCODE_CONCURRENCY = args.concurrency
+    backfill_geocoding(page_size=args.page_size, checkpoint_path=args.checkpoint, restart=args.restart)
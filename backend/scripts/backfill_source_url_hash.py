@@ -0,0 +1,62 @@
+"""
+Backfill Source URL Hash Script
+
+Fills signals.source_url_hash for rows created before migration 002.
+Needed on SQLite, which has no md5() for the SQL backfill.
+
+Usage:
+    python backend/scripts/backfill_source_url_hash.py
+"""
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.models.schema import Signal
+from app.services.beacon_collector import calculate_url_hash
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def backfill_source_url_hash():
+    """Hash source_url for every signal missing source_url_hash."""
+    db: Session = SessionLocal()
+
+    try:
+        total = 0
+        while True:
+            rows = db.query(Signal.id, Signal.source_url).filter(
+                Signal.source_url_hash.is_(None)
+            ).limit(BATCH_SIZE).all()
+            if not rows:
+                break
+
+            db.execute(
+                update(Signal),
+                [{"id": row.id, "source_url_hash": calculate_url_hash(row.source_url)} for row in rows],
+            )
+            db.commit()
+            total += len(rows)
+            logger.info(f"Hashed {total} source URLs")
+
+        logger.info(f"✓ Backfill complete! Hashed {total} source URLs")
+
+    except Exception as e:
+        logger.error(f"Backfill failed: {str(e)}")
+        db.rollback()
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_source_url_hash()
@@ -0,0 +1,120 @@
+"""
+Geocoding Benchmark Script
+
+Measures geocode_locations throughput against the mock Nominatim server (or
+any Nominatim instance) for different rate-limit and concurrency settings.
+Each run uses a fresh in-memory database: a cold pass that geocodes every
+unique location, then a warm pass served from the caches.
+
+Usage:
+    python backend/scripts/benchmark_geocoding.py --events 2000 --unique 100 \\
+        --latency-ms 300 --interval 0.1 --concurrency 1,2,4
+
+    # Against a running Nominatim instance instead of the built-in mock:
+    python backend/scripts/benchmark_geocoding.py --nominatim-url http://localhost:8080 --interval 1.1
+"""
+import argparse
+import logging
+import random
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.services import geocoding_service
+from app.services.rate_limiter import RateLimiter
+from scripts.mock_nominatim_server import serve_in_thread
+
+
+def make_events(count: int, unique: int, offline_share: float, seed: int):
+    """(country, location) pairs; offline_share of the unique locations are gazetteer cities."""
+    rng = random.Random(seed)
+    countries = sorted(geocoding_service.COUNTRY_COORDINATES)
+    cities = [p for p in geocoding_service.get_gazetteer().places if p.kind == "city"]
+    locations = []
+    for i in range(unique):
+        if rng.random() < offline_share:
+            city = rng.choice(cities)
+            locations.append((city.country, city.name))
+        else:
+            locations.append((rng.choice(countries), f"Benchtown {i}"))
+    return [rng.choice(locations) for _ in range(count)]
+
+
+def make_session():
+    """Fresh in-memory database; StaticPool shares its one connection with the geocoding threads."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def run(events, concurrency: int, base_url: str, interval: float):
+    geocoding_service.GEOCODE_CONCURRENCY = concurrency
+    geocoding_service.memory_cache.clear()
+    geocoding_service.set_geocoder_backend(geocoding_service.NominatimBackend(
+        base_url=base_url, rate_limiter=RateLimiter(interval_seconds=interval)
+    ))
+    db = make_session()
+    timings = []
+    for _ in ("cold", "warm"):
+        started = time.perf_counter()
+        results = geocoding_service.geocode_locations(events, db=db)
+        db.commit()
+        timings.append(time.perf_counter() - started)
+    sources = {}
+    for result in results.values():
+        sources[result["geocode_source"]] = sources.get(result["geocode_source"], 0) + 1
+    db.close()
+    return timings, sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark geocode_locations")
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--unique", type=int, default=50, help="Distinct (country, location) pairs")
+    parser.add_argument("--offline-share", type=float, default=0.5, help="Share of locations in the gazetteer")
+    parser.add_argument("--concurrency", default="1,2,4", help="Comma-separated GEOCODE_CONCURRENCY values")
+    parser.add_argument("--interval", type=float, default=0.05, help="Rate limiter interval in seconds")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="Mock server latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Mock server HTTP 503 rate")
+    parser.add_argument("--not-found-rate", type=float, default=0.1, help="Mock server empty-result rate")
+    parser.add_argument("--nominatim-url", default=None, help="Use this Nominatim instead of the mock")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--verbose", action="store_true", help="Show geocoding log output")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    server = None
+    base_url = args.nominatim_url
+    if base_url is None:
+        server, base_url = serve_in_thread(
+            latency_ms=args.latency_ms,
+            error_rate=args.error_rate,
+            not_found_rate=args.not_found_rate,
+            seed=args.seed,
+        )
+
+    events = make_events(args.events, args.unique, args.offline_share, args.seed)
+    print(f"{len(events)} events, {len(set(events))} unique locations, rate limit interval {args.interval}s")
+    print(f"{'concurrency':>11} {'cold s':>8} {'warm s':>8} {'requests':>9} {'req/s':>7}  sources")
+    try:
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            requests_before = len(server.queries) if server else 0
+            (cold, warm), sources = run(events, concurrency, base_url, args.interval)
+            requests = (len(server.queries) - requests_before) if server else None
+            rate = f"{requests / cold:7.2f}" if requests else f"{'-':>7}"
+            print(f"{concurrency:>11} {cold:8.2f} {warm:8.3f} {requests if requests is not None else '-':>9} {rate}  {sources}")
+    finally:
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Mock Nominatim Server
+
+Local stand-in for the Nominatim /search API with configurable latency and
+error rates, so geocoding throughput can be benchmarked without calling the
+public service. Coordinates are derived from a hash of the query, so the same
+query always resolves to the same point.
+
+Usage:
+    python backend/scripts/mock_nominatim_server.py --port 8788 --latency-ms 200 --error-rate 0.05
+    NOMINATIM_URL=http://127.0.0.1:8788 uvicorn app.main:app
+
+    # From tests and benchmarks:
+    server, base_url = serve_in_thread(latency_ms=50, not_found_rate=0.1)
+    ...
+    server.shutdown()
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+class MockNominatimServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        not_found_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(address, MockNominatimHandler)
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.not_found_rate = not_found_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.queries: List[str] = []
+        self.request_times: List[float] = []
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.random.random()
+
+
+class MockNominatimHandler(BaseHTTPRequestHandler):
+    server: MockNominatimServer
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/status":
+            self._send_json(200, {"status": 0, "message": "OK"})
+            return
+        if url.path != "/search":
+            self._send_json(404, {"error": "Not Found"})
+            return
+
+        query = (parse_qs(url.query).get("q") or [""])[0]
+        with self.server.lock:
+            self.server.queries.append(query)
+            self.server.request_times.append(time.monotonic())
+
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+
+        roll = self.server.roll()
+        if roll < self.server.error_rate:
+            self._send_json(503, {"error": "Simulated Nominatim failure"})
+        elif roll < self.server.error_rate + self.server.not_found_rate:
+            self._send_json(200, [])
+        else:
+            self._send_json(200, [self._place(query)])
+
+    @staticmethod
+    def _place(query: str) -> dict:
+        digest = hashlib.md5(query.lower().encode()).digest()
+        latitude = int.from_bytes(digest[:4], "big") / 2**32 * 140 - 60
+        longitude = int.from_bytes(digest[4:8], "big") / 2**32 * 360 - 180
+        return {
+            "place_id": int.from_bytes(digest[8:12], "big"),
+            "lat": f"{latitude:.7f}",
+            "lon": f"{longitude:.7f}",
+            "display_name": query,
+            "class": "place",
+            "type": "city",
+            "importance": 0.5,
+        }
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_in_thread(port: int = 0, **kwargs) -> Tuple[MockNominatimServer, str]:
+    """Start the mock server on a background thread. Port 0 picks a free port."""
+    server = MockNominatimServer(("127.0.0.1", port), **kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock Nominatim geocoding service")
+    parser.add_argument("--port", type=int, default=8788)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every search")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of searches answered with HTTP 503")
+    parser.add_argument("--not-found-rate", type=float, default=0.0, help="Fraction of searches with no result")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = MockNominatimServer(
+        ("127.0.0.1", args.port),
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        not_found_rate=args.not_found_rate,
+        seed=args.seed,
+    )
+    print(f"Mock Nominatim listening on http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,98 @@
+"""
+Mock Scraper Service
+
+Local stand-in for the Beacon scraper sidecar. Serves a canned render result
+so the remote fetch mode can be exercised without Chromium or network access.
+
+Usage:
+    python backend/scripts/mock_scraper_server.py --port 8787 --fail-first 1
+
+    # From tests:
+    server, base_url = serve_in_thread(fail_first=1)
+    ...
+    server.shutdown()
+"""
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_EVENTS = [
+    {"id": "mock-1", "disease": "Cholera", "country": "Yemen", "cases": 120, "deaths": 3},
+    {"id": "mock-2", "disease": "Mpox", "country": "Kenya", "location": "Nairobi", "cases": 14},
+]
+
+
+class MockScraperServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], events: Optional[List[Dict[str, Any]]] = None, fail_first: int = 0):
+        super().__init__(address, MockScraperHandler)
+        self.events = events if events is not None else DEFAULT_EVENTS
+        self.fail_remaining = fail_first
+        self.requests: List[Dict[str, Any]] = []
+
+
+class MockScraperHandler(BaseHTTPRequestHandler):
+    server: MockScraperServer
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "healthy"})
+        else:
+            self._send_json(404, {"detail": "Not Found"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_json(404, {"detail": "Not Found"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self.server.requests.append(body)
+
+        if self.server.fail_remaining > 0:
+            self.server.fail_remaining -= 1
+            self._send_json(503, {"detail": "Simulated scraper failure"})
+            return
+
+        self._send_json(200, {
+            "html": "",
+            "json_payloads": [{"events": self.server.events}],
+            "events": self.server.events,
+            "request_stats": {"requests": 1, "blocked": 0, "failed": 0, "total_request_ms": 1.0, "slowest": []},
+        })
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_in_thread(port: int = 0, **kwargs) -> Tuple[MockScraperServer, str]:
+    """Start the mock server on a background thread. Port 0 picks a free port."""
+    server = MockScraperServer(("127.0.0.1", port), **kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock Beacon scraper service")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--fail-first", type=int, default=0, help="Answer the first N renders with HTTP 503")
+    args = parser.parse_args()
+
+    server = MockScraperServer(("127.0.0.1", args.port), fail_first=args.fail_first)
+    print(f"Mock scraper service listening on http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
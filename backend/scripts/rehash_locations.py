@@ -0,0 +1,113 @@
+"""
+Rehash Locations Script
+
+Recomputes location hashes written before countries were canonicalized
+(e.g. "USA" and "United States" hashed apart). Without it those
+geocode_cache rows are never hit again and signals keep the old hash.
+
+    - signals.location_hash is rewritten per (country, location) group
+    - geocode_cache rows move to their new hash; a row whose new hash
+      already exists is dropped, since the canonical entry supersedes it
+
+Usage:
+    python backend/scripts/rehash_locations.py
+"""
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import bindparam, delete, update
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.models.schema import GeocodeCache, Signal
+from app.services.geocoding_service import calculate_location_hash, memory_cache
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rehash_signals(db: Session) -> int:
+    """Rewrite stale signals.location_hash values. Returns the number of groups rewritten."""
+    groups = (
+        db.query(Signal.country, Signal.location, Signal.location_hash)
+        .filter(Signal.location_hash.is_not(None))
+        .distinct()
+        .all()
+    )
+    params = [
+        {"b_country": row.country, "b_location": row.location, "b_old": row.location_hash,
+         "b_new": calculate_location_hash(row.country, row.location)}
+        for row in groups
+    ]
+    params = [p for p in params if p["b_new"] != p["b_old"]]
+    if params:
+        table = Signal.__table__
+        db.execute(
+            update(table)
+            .where(
+                table.c.country == bindparam("b_country"),
+                table.c.location.is_not_distinct_from(bindparam("b_location")),
+                table.c.location_hash == bindparam("b_old"),
+            )
+            .values(location_hash=bindparam("b_new")),
+            params,
+        )
+    return len(params)
+
+
+def rehash_cache(db: Session) -> int:
+    """Move geocode_cache rows to their canonical hash. Returns the number of rows moved or dropped."""
+    rows = db.query(GeocodeCache.location_hash, GeocodeCache.country, GeocodeCache.location).all()
+    taken = {row.location_hash for row in rows}
+    moves = []
+    drops = []
+    for row in rows:
+        new_hash = calculate_location_hash(row.country or "", row.location)
+        if new_hash == row.location_hash:
+            continue
+        if new_hash in taken:
+            drops.append(row.location_hash)
+        else:
+            moves.append({"b_old": row.location_hash, "b_new": new_hash})
+            taken.add(new_hash)
+        taken.discard(row.location_hash)
+
+    table = GeocodeCache.__table__
+    if moves:
+        db.execute(
+            update(table)
+            .where(table.c.location_hash == bindparam("b_old"))
+            .values(location_hash=bindparam("b_new")),
+            moves,
+        )
+    if drops:
+        db.execute(delete(GeocodeCache).where(GeocodeCache.location_hash.in_(drops)))
+    return len(moves) + len(drops)
+
+
+def rehash_locations(session_factory=SessionLocal):
+    """Rehash signals and geocode_cache in one transaction."""
+    db: Session = session_factory()
+
+    try:
+        signal_groups = rehash_signals(db)
+        cache_rows = rehash_cache(db)
+        db.commit()
+        memory_cache.clear()
+        logger.info(f"✓ Rehash complete! {signal_groups} signal locations, {cache_rows} cache entries")
+        return signal_groups, cache_rows
+
+    except Exception as e:
+        logger.error(f"Rehash failed: {str(e)}")
+        db.rollback()
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    rehash_locations()
@@ -0,0 +1,225 @@
+"""
+Test script for the pooled Beacon browser.
+Tests recycling, health-check relaunch and concurrent page leasing with a fake
+Playwright driver, so no Chromium is needed.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+        self.context.open_pages -= 1
+
+
+class FakeContext:
+    def __init__(self, browser, page_delay):
+        self.browser = browser
+        self.page_delay = page_delay
+        self.open_pages = 0
+        self.peak_pages = 0
+
+    async def new_page(self):
+        await asyncio.sleep(self.page_delay)
+        if self.browser.closed:
+            raise RuntimeError("Target page, context or browser has been closed")
+        self.open_pages += 1
+        self.peak_pages = max(self.peak_pages, self.open_pages)
+        return FakePage(self)
+
+
+class FakeBrowser:
+    def __init__(self, page_delay):
+        self.page_delay = page_delay
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        context = FakeContext(self, self.page_delay)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self, page_delay):
+        self.page_delay = page_delay
+        self.browsers = []
+
+    async def launch(self, headless=True):
+        browser = FakeBrowser(self.page_delay)
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    """Stands in for the started async_playwright() driver."""
+
+    def __init__(self, page_delay=0.0):
+        self.chromium = FakeChromium(page_delay)
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+def make_pool(page_delay=0.0, **kwargs):
+    pool = BrowserPool(**kwargs)
+    pool._playwright = FakePlaywright(page_delay)
+    return pool
+
+
+def test_recycles_after_page_budget():
+    """Test that the browser is replaced once it has served recycle_after_pages pages."""
+    print("Testing browser recycling...")
+
+    async def run():
+        pool = make_pool(max_pages=1, recycle_after_pages=2)
+        for _ in range(5):
+            async with pool.page() as page:
+                assert not page.closed
+        browsers = pool._playwright.chromium.browsers
+        stats = pool.stats()
+        await pool.close()
+        return browsers, stats, pool._playwright
+
+    browsers, stats, playwright = asyncio.run(run())
+    assert stats["launch_count"] == 3, f"Expected 3 launches for 5 pages, got {stats['launch_count']}"
+    assert [browser.closed for browser in browsers] == [True, True, True], "Recycled browsers must be closed"
+    assert stats["active_pages"] == 0
+    assert playwright is None, "close() stops the driver"
+
+    print("  [OK] 5 pages served by 3 browsers, old ones closed")
+
+
+def test_relaunches_disconnected_browser():
+    """Test that a browser that lost its connection is replaced on the next page."""
+    print("\nTesting health-check relaunch...")
+
+    async def run():
+        pool = make_pool(max_pages=1, recycle_after_pages=50)
+        async with pool.page():
+            pass
+        pool._browser.connected = False
+        assert not pool.is_healthy()
+        async with pool.page():
+            pass
+        return pool
+
+    pool = asyncio.run(run())
+    browsers = pool._playwright.chromium.browsers
+    assert len(browsers) == 2 and browsers[0].closed
+    assert pool.is_healthy() and pool.stats()["launch_count"] == 2
+
+    print("  [OK] Disconnected browser relaunched transparently")
+
+
+def test_concurrent_pages_bounded():
+    """Test that at most max_pages pages are open at once."""
+    print("\nTesting concurrent page leasing...")
+
+    async def use_page(pool, results):
+        async with pool.page() as page:
+            await asyncio.sleep(0.01)
+            results.append(page)
+
+    async def run():
+        pool = make_pool(page_delay=0.005, max_pages=2, recycle_after_pages=50)
+        results = []
+        await asyncio.gather(*(use_page(pool, results) for _ in range(6)))
+        stats = pool.stats()
+        return pool, results, stats
+
+    pool, results, stats = asyncio.run(run())
+    (context,) = pool._playwright.chromium.browsers[0].contexts
+    assert len(results) == 6 and all(page.closed for page in results)
+    assert context.peak_pages == 2, f"Expected 2 pages open at most, saw {context.peak_pages}"
+    assert stats["active_pages"] == 0 and stats["pages_served"] == 6
+
+    print("  [OK] 6 callers shared 2 page slots")
+
+
+def test_no_recycle_while_page_is_opening():
+    """Test that a page still being opened counts as active, so nobody recycles its context."""
+    print("\nTesting recycle during new_page()...")
+
+    async def run():
+        pool = make_pool(page_delay=0.02, max_pages=3, recycle_after_pages=1)
+        release_holder = asyncio.Event()
+
+        async def holder():
+            async with pool.page():
+                await release_holder.wait()
+
+        holding = asyncio.ensure_future(holder())
+        await asyncio.sleep(0.03)
+        async with pool.page():
+            pass  # served 1 while holder is active: due for recycling, but not idle
+
+        opening_page = pool.page()
+        opening = asyncio.ensure_future(opening_page.__aenter__())
+        await asyncio.sleep(0.005)  # opening is now inside new_page()
+        release_holder.set()
+        await holding  # holder closed: the only counted page is the one still opening
+
+        async with pool.page():
+            pass
+        page = await opening
+        await opening_page.__aexit__(None, None, None)
+        return pool, page
+
+    pool, page = asyncio.run(run())
+    browsers = pool._playwright.chromium.browsers
+    assert not page.context.browser.closed, "The opening page's browser was recycled under it"
+    assert len(browsers) == 1, f"Unexpected relaunches: {len(browsers)}"
+    assert page.closed and pool.stats()["active_pages"] == 0
+
+    print("  [OK] Context kept while a page was being opened")
+
+
+def run_all_tests():
+    """Run all browser pool tests."""
+    print("=" * 60)
+    print("Browser Pool Tests")
+    print("=" * 60)
+
+    try:
+        test_recycles_after_page_budget()
+        test_relaunches_disconnected_browser()
+        test_concurrent_pages_bounded()
+        test_no_recycle_while_page_is_opening()
+
+        print("\n" + "=" * 60)
+        print("All tests passed!")
+        print("=" * 60)
+        return True
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
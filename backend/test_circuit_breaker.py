@@ -0,0 +1,282 @@
+"""
+Test script for circuit breakers and retry budgets.
+Tests breaker state changes, the scraper retry budget, fail-fast Beacon fetches
+and degraded geocoding during a geocoder outage, without external services.
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.models.schema import GeocodeCache, Signal
+from app.services import beacon_collector, collector_state, geocoding_service
+from app.services.beacon_collector import BeaconCollector, BeaconPayload
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError, RetryBudget
+from app.services.rate_limiter import RateLimiter
+from app.workers.geocoding_worker import process_pending_signals
+from scripts.mock_nominatim_server import serve_in_thread
+from testing_helpers import make_session
+
+
+class FlakyGeocoder(geocoding_service.GeocoderBackend):
+    """Raises GeocoderUnavailable while down, otherwise answers from a dict."""
+
+    name = "flaky"
+
+    def __init__(self, known=None):
+        self.known = known or {}
+        self.down = True
+        self.queries = []
+
+    def geocode(self, query):
+        self.queries.append(query)
+        if self.down:
+            raise geocoding_service.GeocoderUnavailable(f"down: {query}")
+        return self.known.get(query)
+
+
+def test_breaker_opens_and_probes():
+    """Test closed -> open -> half-open -> open -> half-open -> closed."""
+    print("Testing circuit breaker states...")
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout_seconds=0.05)
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "closed", "One failure is below the threshold"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow(), "Open circuit must fail fast"
+
+    time.sleep(0.06)
+    assert breaker.allow(), "First call after the reset timeout is a probe"
+    assert not breaker.allow(), "Only one probe at a time"
+    breaker.record_failure()
+    assert breaker.state == "open", "A failed probe reopens the circuit"
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() and breaker.allow()
+
+    print("  [OK] Opened at threshold, one probe when half-open, closed after a good probe")
+
+
+def test_retry_budget_caps_retries():
+    """Test that retries are limited to the floor plus a share of requests."""
+    print("\nTesting retry budget...")
+    budget = RetryBudget(ratio=0.5, min_retries=1, window_seconds=60)
+    for _ in range(4):
+        budget.record_request()
+
+    spent = sum(budget.try_spend_retry() for _ in range(10))
+    assert spent == 3, f"Expected 1 + 0.5 * 4 retries, got {spent}"
+
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend_retry(), "New requests earn new retries"
+    assert not budget.try_spend_retry()
+
+    print("  [OK] Retries capped at 1 + 50% of requests")
+
+
+def test_beacon_fetch_fails_fast_when_open():
+    """Test that failed fetches open the Beacon circuit and later polls skip rendering."""
+    print("\nTesting Beacon fetch circuit...")
+    original_breaker = beacon_collector.beacon_fetch_breaker
+    beacon_collector.beacon_fetch_breaker = CircuitBreaker(
+        "beacon_fetch", failure_threshold=2, reset_timeout_seconds=0.05
+    )
+    collector = BeaconCollector(db=None)
+    renders = []
+
+    async def failing_render(known_event_ids=None):
+        renders.append(known_event_ids)
+        raise RuntimeError("Beacon unreachable")
+
+    async def working_render(known_event_ids=None):
+        renders.append(known_event_ids)
+        return BeaconPayload(events=[{"id": "evt-1"}])
+
+    def fetch():
+        return asyncio.run(collector._fetch_beacon_payload())
+
+    try:
+        collector.render_beacon_page = failing_render
+        for _ in range(2):
+            try:
+                fetch()
+                assert False, "Render error should propagate"
+            except RuntimeError:
+                pass
+
+        try:
+            fetch()
+            assert False, "Open circuit should raise CircuitOpenError"
+        except CircuitOpenError:
+            pass
+        assert len(renders) == 2, "No render while the circuit is open"
+        assert collector.metrics.counters["fetch_circuit_open"] == 1
+
+        time.sleep(0.06)
+        collector.render_beacon_page = working_render
+        assert fetch().events == [{"id": "evt-1"}]
+        assert beacon_collector.beacon_fetch_breaker.state == "closed"
+    finally:
+        beacon_collector.beacon_fetch_breaker = original_breaker
+
+    print("  [OK] Two failures opened the circuit, probe after reset closed it")
+
+
+def test_cancelled_probe_frees_slot():
+    """Test that cancelling a half-open probe fetch lets the next call probe again."""
+    print("\nTesting cancelled probe...")
+    original_breaker = beacon_collector.beacon_fetch_breaker
+    breaker = CircuitBreaker("beacon_fetch", failure_threshold=1, reset_timeout_seconds=0.05)
+    beacon_collector.beacon_fetch_breaker = breaker
+    collector = BeaconCollector(db=None)
+
+    async def hanging_render(known_event_ids=None):
+        await asyncio.sleep(60)
+
+    async def cancel_probe():
+        task = asyncio.ensure_future(collector._fetch_beacon_payload())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+            assert False, "Probe should have been cancelled"
+        except asyncio.CancelledError:
+            pass
+
+    try:
+        breaker.record_failure()
+        time.sleep(0.06)
+        collector.render_beacon_page = hanging_render
+        asyncio.run(cancel_probe())
+
+        assert breaker.state == "half_open", "A cancelled probe is not a failure"
+        assert breaker.allow(), "The cancelled probe's slot must be free again"
+    finally:
+        beacon_collector.beacon_fetch_breaker = original_breaker
+
+    print("  [OK] Cancelled probe released its slot, circuit still half-open")
+
+
+def test_nominatim_errors_open_circuit():
+    """Test that Nominatim errors (not misses) open its circuit against the mock server."""
+    print("\nTesting Nominatim circuit with mock server...")
+    server, base_url = serve_in_thread(error_rate=1.0)
+    try:
+        nominatim = geocoding_service.NominatimBackend(
+            base_url=base_url,
+            rate_limiter=RateLimiter(interval_seconds=0.01),
+            breaker=CircuitBreaker("nominatim", failure_threshold=2, reset_timeout_seconds=60),
+        )
+        for i in range(5):
+            try:
+                nominatim.geocode(f"Place {i}, Kenya")
+                assert False, "Errors should raise GeocoderUnavailable"
+            except geocoding_service.GeocoderUnavailable:
+                pass
+        assert len(server.queries) == 2, f"Expected 2 calls before the circuit opened: {server.queries}"
+    finally:
+        server.shutdown()
+
+    server, base_url = serve_in_thread(not_found_rate=1.0)
+    try:
+        breaker = CircuitBreaker("nominatim", failure_threshold=2, reset_timeout_seconds=60)
+        nominatim = geocoding_service.NominatimBackend(
+            base_url=base_url, rate_limiter=RateLimiter(interval_seconds=0.01), breaker=breaker
+        )
+        assert [nominatim.geocode(f"Place {i}, Kenya") for i in range(3)] == [None] * 3
+        assert breaker.state == "closed", "Not-found answers are not failures"
+    finally:
+        server.shutdown()
+
+    print("  [OK] Circuit opened after 2 errors, misses left it closed")
+
+
+def test_geocoder_outage_degrades_to_country():
+    """Test that an outage gives country-level pending coordinates, uncached, refined later."""
+    print("\nTesting degraded geocoding...")
+    db = make_session()
+    flaky = FlakyGeocoder({"Malindi, Kenya": (-3.22, 40.12)})
+    original = geocoding_service.set_geocoder_backend(flaky)
+    try:
+        collector = BeaconCollector(db)
+        collector.defer_geocoding = True
+        event = {"id": "evt-1", "disease": "Cholera", "country": "Kenya", "location": "Malindi", "cases": 12}
+        assert collector._process_events([event]) == 1
+
+        stats = {}
+        results = geocoding_service.geocode_locations([("Kenya", "Malindi")], db=db, stats=stats)
+        degraded = results[("Kenya", "Malindi")]
+        assert degraded["geocode_source"] == "pending" and degraded["precision"] == "country"
+        assert stats["degraded"] == 1
+        assert db.query(GeocodeCache).count() == 0, "Degraded results must not be cached"
+
+        version = collector_state.get_state(db, collector_state.MAP_DATA_VERSION_KEY)
+        assert process_pending_signals(db) == 0, "Degraded signals are not counted as resolved"
+        db.expire_all()
+        signal = db.query(Signal).one()
+        assert signal.geocode_source == "pending" and signal.latitude is not None
+        assert collector_state.get_state(db, collector_state.MAP_DATA_VERSION_KEY) == version + 1
+
+        assert process_pending_signals(db) == 0
+        assert collector_state.get_state(db, collector_state.MAP_DATA_VERSION_KEY) == version + 1, \
+            "Re-degrading the same signal must not bump the map version"
+
+        newer = {"id": "evt-2", "disease": "Mpox", "country": "Uganda", "location": "Benchtown", "cases": 3}
+        assert collector._process_events([event, newer]) == 1
+        assert process_pending_signals(db, batch_size=1) == 0
+        db.expire_all()
+        placed = db.query(Signal).filter(Signal.beacon_event_id == "evt-2").one()
+        assert placed.latitude is not None, "A new signal must not wait behind older degraded ones"
+
+        flaky.down = False
+        assert process_pending_signals(db) == 2
+        db.expire_all()
+        signal = db.query(Signal).filter(Signal.beacon_event_id == "evt-1").one()
+        assert signal.geocode_source == "location"
+        assert (float(signal.latitude), float(signal.longitude)) == (-3.22, 40.12)
+    finally:
+        geocoding_service.set_geocoder_backend(original)
+
+    print("  [OK] Outage mapped signals at country level, newest first placed, refined after recovery")
+
+
+def run_all_tests():
+    """Run all circuit breaker tests."""
+    print("=" * 60)
+    print("Circuit Breaker Tests")
+    print("=" * 60)
+
+    try:
+        test_breaker_opens_and_probes()
+        test_retry_budget_caps_retries()
+        test_beacon_fetch_fails_fast_when_open()
+        test_cancelled_probe_frees_slot()
+        test_nominatim_errors_open_circuit()
+        test_geocoder_outage_degrades_to_country()
+
+        print("\n" + "=" * 60)
+        print("All tests passed!")
+        print("=" * 60)
+        return True
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
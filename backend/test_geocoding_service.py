@@ -0,0 +1,374 @@
+"""
+Test script for the geocoding service.
+Tests batching and caching without calling Nominatim.
+"""
+import datetime
+import hashlib
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import event
+
+from app.models.schema import GeocodeCache, Signal
+from app.services import geocoding_service
+from app.services.gazetteer import get_gazetteer
+from app.services.rate_limiter import RateLimiter
+from scripts.mock_nominatim_server import serve_in_thread
+from scripts.rehash_locations import rehash_locations
+from app.services.geocoding_service import calculate_location_hash, geocode_locations
+from testing_helpers import FakeNominatim, make_session
+
+
+def make_cache_entry(country, location, latitude, longitude, **overrides):
+    values = {
+        "location_hash": calculate_location_hash(country, location),
+        "country": country,
+        "location": location,
+        "latitude": latitude,
+        "longitude": longitude,
+        "geocode_source": "location",
+        "precision": "location",
+        "hit_count": 0,
+        "expires_at": datetime.datetime.utcnow() + datetime.timedelta(days=30),
+    }
+    values.update(overrides)
+    return GeocodeCache(**values)
+
+
+def with_fake_nominatim(fake, func):
+    original = geocoding_service.set_geocoder_backend(fake)
+    try:
+        return func()
+    finally:
+        geocoding_service.set_geocoder_backend(original)
+
+
+def test_geocode_locations_resolves_unique_keys_once():
+    """Test that repeated locations are geocoded once and fanned back out."""
+    print("Testing batched geocoding...")
+    db = make_session()
+    db.add(make_cache_entry("Yemen", "Zabid", 14.20, 43.32))
+    db.commit()
+
+    fake = FakeNominatim({"Malindi, Kenya": (-3.22, 40.12)})
+    keys = [("Kenya", "Malindi")] * 50 + [("Yemen", "Zabid")] * 10 + [("Kenya", None)]
+    results = with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+
+    assert fake.queries == ["Malindi, Kenya"], f"Unexpected Nominatim calls: {fake.queries}"
+    assert results[("Kenya", "Malindi")]["geocode_source"] == "location"
+    assert results[("Yemen", "Zabid")]["geocode_source"] == "cache"
+    assert results[("Kenya", None)]["geocode_source"] == "country"
+    assert len(results) == 3
+
+    print("  [OK] 61 events resolved with one API call and one cache query")
+
+
+def test_geocode_locations_merges_country_aliases():
+    """Test that pairs sharing a location hash are geocoded and cached once."""
+    print("\nTesting aliased country batch...")
+    db = make_session()
+    fake = FakeNominatim({"Fairview, United States": (39.1, -84.5)})
+    keys = [("USA", "Fairview"), ("United States", "Fairview"), ("United States", "fairview")]
+    results = with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+    db.commit()
+
+    assert len(fake.queries) == 1, f"Aliases should share one lookup: {fake.queries}"
+    assert db.query(GeocodeCache).count() == 1
+    assert len(results) == 3
+    assert {results[key]["location_hash"] for key in keys} == {calculate_location_hash("USA", "Fairview")}
+    assert all(results[key]["latitude"] == 39.1 for key in keys)
+
+    print("  [OK] Three spellings, one Nominatim call, one cache row")
+
+
+def test_rehash_moves_pre_canonical_hashes():
+    """Test that the rehash script moves cache rows and signals hashed before country canonicalization."""
+    print("\nTesting location rehash...")
+    db = make_session()
+    stale = hashlib.md5(b"usa|fairview").hexdigest()
+    stale_duplicate = hashlib.md5(b"us|fairview").hexdigest()
+    db.add(make_cache_entry("USA", "Fairview", 39.1, -84.5, location_hash=stale))
+    db.add(make_cache_entry("US", "Fairview", 39.1, -84.5, location_hash=stale_duplicate))
+    db.add(Signal(
+        beacon_event_id="evt-1", source_url="https://beaconbio.org/event/1", raw_data={}, disease="Cholera",
+        country="USA", location="Fairview", date_reported=datetime.date(2026, 1, 1), location_hash=stale,
+    ))
+    db.commit()
+
+    assert rehash_locations(session_factory=lambda: db) == (1, 2)
+    canonical = calculate_location_hash("United States", "Fairview")
+    assert [row.location_hash for row in db.query(GeocodeCache)] == [canonical], "One entry per canonical hash"
+    assert db.query(Signal).one().location_hash == canonical
+    assert rehash_locations(session_factory=lambda: db) == (0, 0), "A second run has nothing to do"
+
+    print("  [OK] Stale hashes moved, duplicate alias entry dropped")
+
+
+def test_cache_table_write_through_and_expiry():
+    """Test that results are written to geocode_cache and expired entries are refreshed."""
+    print("\nTesting geocode cache table...")
+    db = make_session()
+    db.add(make_cache_entry(
+        "Kenya", "Lamu", 0.0, 0.0,
+        expires_at=datetime.datetime.utcnow() - datetime.timedelta(days=1),
+    ))
+    db.commit()
+
+    fake = FakeNominatim({"Lamu, Kenya": (-2.27, 40.90), "Malindi, Kenya": (-3.22, 40.12)})
+    with_fake_nominatim(fake, lambda: geocode_locations([("Kenya", "Lamu"), ("Kenya", "Malindi")], db=db))
+    db.commit()
+
+    assert sorted(fake.queries) == ["Lamu, Kenya", "Malindi, Kenya"], f"Unexpected calls: {fake.queries}"
+    entries = {row.location: row for row in db.query(GeocodeCache).all()}
+    assert float(entries["Lamu"].latitude) == -2.27, "Expired entry should be refreshed"
+    assert entries["Malindi"].precision == "location"
+
+    geocoding_service.memory_cache.clear()
+    results = with_fake_nominatim(fake, lambda: geocode_locations([("Kenya", "Malindi")], db=db))
+    db.commit()
+    assert len(fake.queries) == 2, "Second lookup should be served from the cache"
+    assert results[("Kenya", "Malindi")]["geocode_source"] == "cache"
+    assert db.get(GeocodeCache, calculate_location_hash("Kenya", "Malindi")).hit_count == 1
+
+    print("  [OK] Results cached, expired entry refreshed, hit counted")
+
+
+def test_cache_write_error_keeps_caller_transaction():
+    """Test that a failed cache write rolls back to its savepoint, not the caller's pending work."""
+    print("\nTesting cache write failure isolation...")
+    db = make_session()
+    db.add(Signal(
+        beacon_event_id="evt-1", source_url="https://beaconbio.org/event/1", raw_data={}, disease="Cholera",
+        country="Kenya", location="Malindi", date_reported=datetime.date(2026, 1, 1),
+    ))
+    db.flush()
+
+    statements = []
+
+    def fail_cache_writes(conn, cursor, statement, *args):
+        statements.append(statement)
+        if statement.startswith("INSERT INTO geocode_cache"):
+            raise RuntimeError("simulated cache write failure")
+
+    event.listen(db.get_bind(), "before_cursor_execute", fail_cache_writes)
+    try:
+        result = {"latitude": -3.22, "longitude": 40.12, "geocode_source": "location", "precision": "location",
+                  "location_hash": calculate_location_hash("Kenya", "Malindi")}
+        assert geocoding_service.store_cached_coordinates_bulk([("Kenya", "Malindi", result)], db) == 0
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", fail_cache_writes)
+    db.commit()
+
+    assert any(statement.startswith("ROLLBACK TO SAVEPOINT") for statement in statements), statements
+    assert db.query(Signal).count() == 1, "The caller's insert must survive the failed cache write"
+    assert db.query(GeocodeCache).count() == 0
+
+    print("  [OK] Cache write failed inside a savepoint, caller's insert committed")
+
+
+def test_memory_cache_skips_database():
+    """Test that repeat lookups are answered from the in-process cache."""
+    print("\nTesting in-process geocode cache...")
+    db = make_session()
+    db.add(make_cache_entry("Yemen", "Zabid", 14.20, 43.32))
+    db.commit()
+
+    fake = FakeNominatim({"Malindi, Kenya": (-3.22, 40.12)})
+    keys = [("Yemen", "Zabid"), ("Kenya", "Malindi")]
+    with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+    db.commit()
+
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    results = with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+
+    assert statements == [], f"Expected no queries, got {statements}"
+    assert fake.queries == ["Malindi, Kenya"]
+    assert {r["geocode_source"] for r in results.values()} == {"cache"}
+    stats = geocoding_service.memory_cache.stats()
+    assert stats["hits"] == 2, f"Unexpected stats: {stats}"
+
+    print(f"  [OK] Second batch served from memory ({stats['hits']} hits, no queries)")
+
+
+def test_memory_cache_waits_for_commit():
+    """Test that cache entries reach the in-process cache only when the caller commits."""
+    print("\nTesting memory cache fill on commit...")
+    db = make_session()
+    fake = FakeNominatim({"Malindi, Kenya": (-3.22, 40.12)})
+    keys = [("Kenya", "Malindi")]
+
+    with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+    assert geocoding_service.memory_cache.stats()["entries"] == 0, "Nothing cached before the commit"
+    db.rollback()
+    assert geocoding_service.memory_cache.stats()["entries"] == 0, "A rolled-back write must not be cached"
+
+    with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+    db.commit()
+    assert geocoding_service.memory_cache.stats()["entries"] == 1
+
+    print("  [OK] Memory cache filled on commit, rolled-back entries dropped")
+
+
+def test_failed_lookups_are_negatively_cached():
+    """Test that unresolvable locations are retried once per negative TTL, within a budget."""
+    print("\nTesting negative caching...")
+    db = make_session()
+    fake = FakeNominatim()
+    keys = [("Atlantis", "Poseidonia"), ("Kenya", "Nairobbi")]
+    location_hash = calculate_location_hash("Atlantis", "Poseidonia")
+
+    results = with_fake_nominatim(fake, lambda: geocode_locations(keys * 20, db=db))
+    db.commit()
+    assert sorted(fake.queries) == ["Atlantis", "Nairobbi, Kenya", "Poseidonia, Atlantis"], f"Unexpected calls: {fake.queries}"
+    assert results[("Atlantis", "Poseidonia")]["geocode_source"] == "failed"
+    assert results[("Kenya", "Nairobbi")]["geocode_source"] == "country"
+
+    geocoding_service.memory_cache.clear()
+    results = with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+    assert len(fake.queries) == 3, "Negative entries should not be looked up again"
+    assert results[("Atlantis", "Poseidonia")]["geocode_source"] == "failed"
+    assert results[("Kenya", "Nairobbi")]["latitude"] is not None, "Country fallback should be served"
+
+    entry = db.get(GeocodeCache, location_hash)
+    assert entry.failure_count == 1
+    assert entry.expires_at - datetime.datetime.utcnow() <= geocoding_service.NEGATIVE_CACHE_TTL
+
+    # Once the retry budget is spent, the entry keeps the full TTL
+    entry.failure_count = geocoding_service.MAX_FAILED_ATTEMPTS - 1
+    entry.expires_at = datetime.datetime.utcnow() - datetime.timedelta(minutes=1)
+    db.commit()
+    geocoding_service.memory_cache.clear()
+    with_fake_nominatim(fake, lambda: geocode_locations(keys[:1], db=db))
+    db.commit()
+    db.expire_all()
+    entry = db.get(GeocodeCache, location_hash)
+    assert entry.failure_count == geocoding_service.MAX_FAILED_ATTEMPTS
+    assert entry.expires_at - datetime.datetime.utcnow() > geocoding_service.NEGATIVE_CACHE_TTL
+
+    print("  [OK] 40 failed lookups cost 3 API calls; retry budget extends expiry")
+
+
+def test_gazetteer_resolves_without_network_or_database():
+    """Test that known places resolve offline, by alias, diacritic-free spelling and designator."""
+    print("\nTesting offline gazetteer...")
+    gazetteer = get_gazetteer()
+    assert gazetteer.find("India", "Bombay").name == "Mumbai"
+    assert gazetteer.find("Colombia", "BOGOTA").name == "Bogotá"
+    assert gazetteer.find("Yemen", "Aden Governorate").name == "Aden"
+    assert gazetteer.find("Democratic Republic of the Congo", "Butembo, Nord-Kivu").name == "Butembo"
+    assert gazetteer.find("Pakistan", "Punjab").latitude == 31.17, "Places must match within the country"
+    assert gazetteer.find("Kenya", "Atlantis") is None
+    assert gazetteer.find("Mexico", "Mexico").kind == "country", "A location naming the country is the country"
+    assert gazetteer.find("Kuwait", "Kuwait").kind == "country"
+    assert gazetteer.find("Mexico", "Mexico City").name == "Mexico City"
+
+    db = make_session()
+    fake = FakeNominatim()
+    keys = [("Kenya", "Nairobi"), ("Nigeria", "Borno State"), ("Chad", None), ("Yemen", "Yemen")]
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    results = with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+
+    assert fake.queries == [] and statements == [], "Gazetteer hits need no API call or query"
+    assert results[("Kenya", "Nairobi")]["geocode_source"] == "gazetteer"
+    assert results[("Nigeria", "Borno State")]["precision"] == "location"
+    assert results[("Chad", None)]["geocode_source"] == "country"
+    assert results[("Yemen", "Yemen")]["precision"] == "country"
+
+    print(f"  [OK] {len(keys)} locations resolved offline ({len(gazetteer)} places loaded)")
+
+
+def test_country_aliases_and_iso_codes():
+    """Test that country aliases, ISO codes and spelling variants use the offline fallback."""
+    print("\nTesting country normalization...")
+    gazetteer = get_gazetteer()
+    variants = {
+        "Democratic Republic of the Congo": ["DRC", "COD", "CD", "Congo (Kinshasa)", "DR Congo"],
+        "United States": ["USA", "US", "U.S.A.", "united states "],
+        "Turkey": ["Türkiye", "Turkiye", "TUR"],
+        "Côte d'Ivoire": ["Ivory Coast", "Cote d'Ivoire", "CIV"],
+    }
+    for canonical, names in variants.items():
+        for name in names:
+            assert gazetteer.canonical_country(name) == canonical, f"{name!r} -> {gazetteer.canonical_country(name)}"
+    assert gazetteer.canonical_country("Atlantis") is None
+
+    db = make_session()
+    fake = FakeNominatim()
+    keys = [(name, None) for names in variants.values() for name in names] + [("DRC", "Goma")]
+    results = with_fake_nominatim(fake, lambda: geocode_locations(keys, db=db))
+
+    assert fake.queries == [], f"Unexpected Nominatim calls: {fake.queries}"
+    assert results[("DRC", None)]["latitude"] == geocoding_service.COUNTRY_COORDINATES["Democratic Republic of the Congo"][0]
+    assert results[("DRC", "Goma")]["geocode_source"] == "gazetteer"
+    assert results[("USA", None)]["location_hash"] == calculate_location_hash("United States", None)
+
+    print(f"  [OK] {len(keys)} country spellings resolved offline to canonical keys")
+
+
+def test_nominatim_backend_against_mock_server():
+    """Test the Nominatim backend and a gazetteer-first chain against the mock server."""
+    print("\nTesting geocoder backends with mock Nominatim...")
+    server, base_url = serve_in_thread(not_found_rate=0.5, seed=7)
+    try:
+        nominatim = geocoding_service.NominatimBackend(
+            base_url=base_url, rate_limiter=RateLimiter(interval_seconds=0.01)
+        )
+        results = [nominatim.geocode(f"Place {i}, Kenya") for i in range(10)]
+        assert len(server.queries) == 10
+        assert 0 < sum(r is None for r in results) < 10, f"Expected some misses: {results}"
+        found = next(r for r in results if r is not None)
+        assert all(isinstance(value, float) for value in found)
+
+        chained = geocoding_service.build_geocoder_backend("gazetteer,nominatim")
+        chained.backends[1] = nominatim
+        assert chained.geocode("Goma, DRC") == (-1.68, 29.23)
+        assert len(server.queries) == 10, "Gazetteer hits should not reach Nominatim"
+        chained.geocode("Place 0, Kenya")
+        assert server.queries[-1] == "Place 0, Kenya"
+    finally:
+        server.shutdown()
+
+    print(f"  [OK] {len(server.queries)} mock searches, chain served known places offline")
+
+
+def run_all_tests():
+    """Run all geocoding service tests."""
+    print("=" * 60)
+    print("Geocoding Service Tests")
+    print("=" * 60)
+
+    try:
+        test_geocode_locations_resolves_unique_keys_once()
+        test_geocode_locations_merges_country_aliases()
+        test_rehash_moves_pre_canonical_hashes()
+        test_cache_table_write_through_and_expiry()
+        test_cache_write_error_keeps_caller_transaction()
+        test_memory_cache_skips_database()
+        test_memory_cache_waits_for_commit()
+        test_failed_lookups_are_negatively_cached()
+        test_gazetteer_resolves_without_network_or_database()
+        test_country_aliases_and_iso_codes()
+        test_nominatim_backend_against_mock_server()
+
+        print("\n" + "=" * 60)
+        print("All tests passed!")
+        print("=" * 60)
+        return True
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,287 @@
+"""
+Test script for deferred geocoding.
+Tests pending signals, the geocoding worker, the map-data ETag and the
+backfill script without calling Nominatim.
+"""
+import datetime
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1 import signals
+from app.database import Base, get_db
+from app.models.schema import Signal
+from app.services import collector_state, geocoding_service, lease
+from app.services.beacon_collector import BeaconCollector
+from app.workers.geocoding_worker import WORKER_LEASE_NAME, process_pending_signals, run_leased_batch
+from scripts.backfill_geocoding import backfill_geocoding
+from testing_helpers import FakeNominatim, make_session
+
+
+EVENTS = [
+    {"id": "evt-1", "disease": "Cholera", "country": "Kenya", "location": "Malindi", "cases": 12},
+    {"id": "evt-2", "disease": "Mpox", "country": "Uganda", "cases": 3},
+]
+
+
+def map_version(db):
+    return collector_state.get_state(db, collector_state.MAP_DATA_VERSION_KEY, 0)
+
+
+def test_signals_stored_before_geocoding():
+    """Test that the collector stores signals as pending and the worker fills coordinates."""
+    print("Testing deferred geocoding...")
+    db = make_session()
+    fake = FakeNominatim({"Malindi, Kenya": (-3.22, 40.12)})
+    original = geocoding_service.set_geocoder_backend(fake)
+    try:
+        collector = BeaconCollector(db)
+        collector.defer_geocoding = True
+        assert collector._process_events(EVENTS) == 2
+
+        assert fake.queries == [], f"Collector should not call the geocoder: {fake.queries}"
+        malindi = db.query(Signal).filter(Signal.beacon_event_id == "evt-1").one()
+        uganda = db.query(Signal).filter(Signal.beacon_event_id == "evt-2").one()
+        assert malindi.geocode_source == "pending" and malindi.latitude is None
+        assert uganda.geocode_source == "country" and uganda.latitude is not None, "Offline hits resolve at once"
+        assert map_version(db) == 1
+
+        assert process_pending_signals(db) == 1
+        assert fake.queries == ["Malindi, Kenya"]
+        db.expire_all()
+        malindi = db.query(Signal).filter(Signal.beacon_event_id == "evt-1").one()
+        assert malindi.geocode_source == "location"
+        assert (float(malindi.latitude), float(malindi.longitude)) == (-3.22, 40.12)
+        assert map_version(db) == 2
+
+        assert process_pending_signals(db) == 0, "Nothing left to geocode"
+        assert map_version(db) == 2, "An empty batch must not bump the version"
+    finally:
+        geocoding_service.set_geocoder_backend(original)
+
+    print("  [OK] Signals stored as pending, worker geocoded them and bumped the map version")
+
+
+def test_map_data_etag():
+    """Test that /map-data answers 304 until the geocoding worker changes the map."""
+    print("\nTesting map-data ETag...")
+    db = make_session()
+    app = FastAPI()
+    app.include_router(signals.router, prefix="/api/v1/signals")
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    original = geocoding_service.set_geocoder_backend(FakeNominatim({"Malindi, Kenya": (-3.22, 40.12)}))
+    try:
+        collector = BeaconCollector(db)
+        collector.defer_geocoding = True
+        collector._process_events(EVENTS)
+
+        first = client.get("/api/v1/signals/map-data")
+        assert first.status_code == 200
+        assert first.json()["total_signals"] == 1, "Pending signals have no marker yet"
+        etag = first.headers["etag"]
+
+        cached = client.get("/api/v1/signals/map-data", headers={"If-None-Match": etag})
+        assert cached.status_code == 304, f"Expected 304, got {cached.status_code}"
+
+        process_pending_signals(db)
+        refreshed = client.get("/api/v1/signals/map-data", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["etag"] != etag
+        assert refreshed.json()["total_signals"] == 2
+    finally:
+        geocoding_service.set_geocoder_backend(original)
+
+    print("  [OK] 304 for an unchanged map, new ETag after the worker ran")
+
+
+def test_backfill_groups_by_location_and_resumes():
+    """Test that the backfill geocodes each location once and resumes after its checkpoint."""
+    print("\nTesting geocoding backfill...")
+    db = make_session()
+    for i, (country, location) in enumerate(
+        [
+            ("Kenya", "Malindi"), ("Kenya", "Malindi"), ("Kenya", "Malindi"),
+            ("Uganda", None), ("Uganda", ""), ("Yemen", "Zabid"),
+        ]
+    ):
+        db.add(Signal(
+            beacon_event_id=f"evt-{i}", source_url=f"https://beaconbio.org/event/{i}", raw_data={},
+            disease="Cholera", country=country, location=location, date_reported=datetime.date(2026, 1, 1),
+        ))
+    db.commit()
+
+    fake = FakeNominatim({"Malindi, Kenya": (-3.22, 40.12), "Zabid, Yemen": (14.20, 43.32)})
+    original = geocoding_service.set_geocoder_backend(fake)
+    checkpoint_path = os.path.join(tempfile.mkdtemp(), "backfill.json")
+    try:
+        # As if an earlier run stopped after the Kenya page
+        with open(checkpoint_path, "w", encoding="utf-8") as f:
+            json.dump({"after": ["Kenya", "Malindi"], "locations": 1, "signals": 3}, f)
+        backfill_geocoding(page_size=1, checkpoint_path=checkpoint_path, session_factory=lambda: db)
+
+        assert fake.queries == ["Zabid, Yemen"], f"Resume should skip Kenya: {fake.queries}"
+        assert not os.path.exists(checkpoint_path), "Checkpoint removed after a complete run"
+        assert db.query(Signal).filter(Signal.latitude.is_(None)).count() == 3
+        assert db.query(Signal).filter(Signal.country == "Uganda", Signal.latitude.is_(None)).count() == 0, \
+            "Empty and NULL locations share one page key and must both be written"
+
+        backfill_geocoding(page_size=1, checkpoint_path=checkpoint_path, session_factory=lambda: db)
+        assert fake.queries == ["Zabid, Yemen", "Malindi, Kenya"], f"Unexpected queries: {fake.queries}"
+        assert db.query(Signal).filter(Signal.latitude.is_(None)).count() == 0
+        sources = {row.geocode_source for row in db.query(Signal).filter(Signal.country == "Kenya")}
+        assert sources == {"location"}, f"Unexpected sources: {sources}"
+    finally:
+        geocoding_service.set_geocoder_backend(original)
+
+    print("  [OK] Three Malindi signals from one lookup, resumed run skipped the finished page")
+
+
+class BlockingNominatim(FakeNominatim):
+    """Holds the first lookup until released, so a second worker can run meanwhile."""
+
+    def __init__(self, known=None):
+        super().__init__(known)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def geocode(self, query):
+        self.started.set()
+        self.release.wait(timeout=10)
+        return super().geocode(query)
+
+
+def test_concurrent_workers_share_lease():
+    """Test that a second worker skips while another process is geocoding a batch."""
+    print("\nTesting concurrent geocoding workers...")
+    # Two sessions on a file database, as two worker processes would have
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'workers.db')}")
+    Base.metadata.create_all(bind=engine)
+    geocoding_service.memory_cache.clear()
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    collector = BeaconCollector(db)
+    collector.defer_geocoding = True
+    assert collector._process_events(EVENTS[:1]) == 1
+
+    fake = BlockingNominatim({"Malindi, Kenya": (-3.22, 40.12)})
+    original = geocoding_service.set_geocoder_backend(fake)
+    first_result = []
+    try:
+        first = threading.Thread(target=lambda: first_result.append(run_leased_batch(Session(), holder="worker-a")))
+        first.start()
+        assert fake.started.wait(timeout=5), "First worker never reached the geocoder"
+
+        assert run_leased_batch(Session(), holder="worker-b") == 0, "Second worker must skip while the lease is held"
+        fake.release.set()
+        first.join(timeout=10)
+    finally:
+        fake.release.set()
+        geocoding_service.set_geocoder_backend(original)
+
+    assert first_result == [1]
+    assert fake.queries == ["Malindi, Kenya"], f"Location looked up more than once: {fake.queries}"
+    assert lease.current_holder(db, WORKER_LEASE_NAME) is None, "Lease released after the batch"
+    assert run_leased_batch(Session(), holder="worker-b") == 0, "Nothing left once the first worker finished"
+
+    print("  [OK] One worker geocoded the batch, the other skipped")
+
+
+class RelocatingNominatim(FakeNominatim):
+    """Moves a signal to another location during the lookup, as a poll committing a revision would."""
+
+    def __init__(self, known, session_factory, beacon_event_id):
+        super().__init__(known)
+        self.session_factory = session_factory
+        self.beacon_event_id = beacon_event_id
+
+    def geocode(self, query):
+        if len(self.queries) == 0:
+            poll_db = self.session_factory()
+            signal = poll_db.query(Signal).filter(Signal.beacon_event_id == self.beacon_event_id).one()
+            signal.location = "Lamu"
+            signal.latitude = signal.longitude = signal.location_hash = None
+            signal.geocode_source = "pending"
+            poll_db.commit()
+            poll_db.close()
+        return super().geocode(query)
+
+
+def test_relocated_signal_not_overwritten():
+    """Test that a signal relocated while its batch is geocoded keeps pending for its new location."""
+    print("\nTesting relocation during geocoding...")
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'relocate.db')}")
+    Base.metadata.create_all(bind=engine)
+    geocoding_service.memory_cache.clear()
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    collector = BeaconCollector(db)
+    collector.defer_geocoding = True
+    assert collector._process_events(EVENTS[:1]) == 1
+
+    fake = RelocatingNominatim(
+        {"Malindi, Kenya": (-3.22, 40.12), "Lamu, Kenya": (-2.27, 40.90)}, Session, "evt-1"
+    )
+    original = geocoding_service.set_geocoder_backend(fake)
+    try:
+        process_pending_signals(db)
+        db.expire_all()
+        signal = db.query(Signal).one()
+        assert signal.location == "Lamu"
+        assert signal.geocode_source == "pending" and signal.latitude is None, \
+            "Malindi coordinates must not land on the relocated signal"
+
+        assert process_pending_signals(db) == 1
+        db.expire_all()
+        signal = db.query(Signal).one()
+        assert signal.geocode_source == "location"
+        assert (float(signal.latitude), float(signal.longitude)) == (-2.27, 40.90)
+    finally:
+        geocoding_service.set_geocoder_backend(original)
+
+    assert fake.queries == ["Malindi, Kenya", "Lamu, Kenya"], f"Unexpected queries: {fake.queries}"
+    print("  [OK] Stale result skipped, next batch geocoded the new location")
+
+
+def run_all_tests():
+    """Run all geocoding worker tests."""
+    print("=" * 60)
+    print("Geocoding Worker Tests")
+    print("=" * 60)
+
+    try:
+        test_signals_stored_before_geocoding()
+        test_map_data_etag()
+        test_backfill_groups_by_location_and_resumes()
+        test_concurrent_workers_share_lease()
+        test_relocated_signal_not_overwritten()
+
+        print("\n" + "=" * 60)
+        print("All tests passed!")
+        print("=" * 60)
+        return True
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
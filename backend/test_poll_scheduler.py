@@ -0,0 +1,97 @@
+"""
+Test script for the adaptive Beacon poll scheduler.
+Tests interval adaptation, error backoff and loop survival without polling Beacon.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.workers.poll_scheduler import PollScheduler, run_poll_loop
+
+
+def make_scheduler():
+    # Minutes expressed as seconds: start 15, floor 5, idle cap 60, backoff cap 120
+    return PollScheduler(
+        interval_seconds=15, min_interval_seconds=5, max_interval_seconds=60, max_backoff_seconds=120
+    )
+
+
+def test_interval_follows_change_rate():
+    """Test that busy polls shorten the interval and quiet polls stretch it, within bounds."""
+    print("Testing adaptive poll interval...")
+    scheduler = make_scheduler()
+
+    scheduler.record_success(4)
+    assert scheduler.next_delay() == 7.5
+    scheduler.record_success(1)
+    assert scheduler.next_delay() == 5, "Interval never drops below the minimum"
+
+    for _ in range(10):
+        scheduler.record_success(0)
+    assert scheduler.next_delay() == 60, "Interval never exceeds the maximum"
+
+    scheduler.record_success(None)
+    assert scheduler.next_delay() == 60, "A skipped poll leaves the interval alone"
+
+    print("  [OK] Interval halved on changes, stretched when idle, clamped to 5-60")
+
+
+def test_errors_back_off_and_loop_survives():
+    """Test that failed polls back off exponentially and the loop keeps polling."""
+    print("\nTesting error backoff...")
+    scheduler = make_scheduler()
+    outcomes = [RuntimeError("Beacon down"), RuntimeError("Beacon down"), RuntimeError("Beacon down"), 2]
+    delays = []
+
+    async def poll():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def sleep(seconds):
+        delays.append(seconds)
+        if not outcomes:
+            raise asyncio.CancelledError
+
+    try:
+        asyncio.run(run_poll_loop(scheduler, poll=poll, sleep=sleep))
+    except asyncio.CancelledError:
+        pass
+
+    assert delays == [30, 60, 120, 7.5], f"Unexpected delays: {delays}"
+    assert scheduler.consecutive_errors == 0
+
+    print("  [OK] Waits doubled per failure up to the cap, reset after a successful poll")
+
+
+def run_all_tests():
+    """Run all poll scheduler tests."""
+    print("=" * 60)
+    print("Poll Scheduler Tests")
+    print("=" * 60)
+
+    try:
+        test_interval_follows_change_rate()
+        test_errors_back_off_and_loop_survives()
+
+        print("\n" + "=" * 60)
+        print("All tests passed!")
+        print("=" * 60)
+        return True
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
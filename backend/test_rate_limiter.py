@@ -0,0 +1,106 @@
+"""
+Test script for the shared rate limiter.
+Tests slot spacing across threads, processes and the event loop.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.rate_limiter import RateLimiter
+
+
+def test_concurrent_threads_get_distinct_slots():
+    """Test that concurrent callers queue behind each other instead of colliding."""
+    print("Testing rate limiter across threads...")
+    limiter = RateLimiter(interval_seconds=0.05)
+    started = []
+    lock = threading.Lock()
+
+    def call():
+        limiter.acquire()
+        with lock:
+            started.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    started.sort()
+    gaps = [b - a for a, b in zip(started, started[1:])]
+    assert min(gaps) >= 0.04, f"Calls closer than the interval: {gaps}"
+    assert started[-1] - started[0] < 0.5, "Callers should not wait more than their slot"
+
+    print(f"  [OK] 6 calls spaced at least {min(gaps):.3f}s apart")
+
+
+def test_state_file_shared_between_limiters():
+    """Test that limiters sharing a state file (as separate processes would) share the limit."""
+    print("\nTesting rate limiter state file...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "nominatim.rate")
+        first = RateLimiter(interval_seconds=10, state_path=path)
+        second = RateLimiter(interval_seconds=10, state_path=path)
+
+        assert first.reserve() == 0
+        delay = second.reserve()
+        assert 9 < delay <= 10, f"Second limiter should wait for the next slot, got {delay}"
+        assert 19 < first.reserve() <= 20
+
+    print("  [OK] Slots reserved through the shared state file")
+
+
+def test_burst_and_async_acquire():
+    """Test burst allowance and the event-loop variant."""
+    print("\nTesting burst and async acquire...")
+    limiter = RateLimiter(interval_seconds=10, burst=3)
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve() > 9
+
+    limiter = RateLimiter(interval_seconds=0.05)
+
+    async def acquire_many():
+        return await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+
+    waited = sorted(asyncio.run(acquire_many()))
+    assert waited[0] == 0 and 0.08 <= waited[-1] <= 0.1, f"Unexpected waits: {waited}"
+
+    print("  [OK] Burst of 3 allowed, async callers spaced")
+
+
+def run_all_tests():
+    """Run all rate limiter tests."""
+    print("=" * 60)
+    print("Rate Limiter Tests")
+    print("=" * 60)
+
+    try:
+        test_concurrent_threads_get_distinct_slots()
+        test_state_file_shared_between_limiters()
+        test_burst_and_async_acquire()
+
+        print("\n" + "=" * 60)
+        print("All tests passed!")
+        print("=" * 60)
+        return True
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,169 @@
+"""
+Test script for the Beacon render profile.
+Tests resource-type and URL-pattern blocking and the request log summary with
+a fake page, so no browser is needed.
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.render_profile import RenderProfile
+
+PROFILE_ENV = ("BEACON_RENDER_PROFILE", "BEACON_BLOCK_RESOURCE_TYPES", "BEACON_BLOCK_URL_PATTERNS")
+
+
+def profile_from_env(**env):
+    """Build RenderProfile.from_env() with only the given profile variables set."""
+    saved = {name: os.environ.pop(name, None) for name in PROFILE_ENV}
+    os.environ.update(env)
+    try:
+        return RenderProfile.from_env()
+    finally:
+        for name in PROFILE_ENV:
+            os.environ.pop(name, None)
+            if saved[name] is not None:
+                os.environ[name] = saved[name]
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, response_end=-1):
+        self.url = url
+        self.resource_type = resource_type
+        self.timing = {"responseEnd": response_end}
+
+
+class FakeRoute:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+class FakePage:
+    """Records the route handler and event listeners a profile installs."""
+
+    def __init__(self):
+        self.route_handler = None
+        self.listeners = {}
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    def on(self, event, handler):
+        self.listeners[event] = handler
+
+    async def load(self, request, failed=False):
+        """Play one request through routing and, unless aborted, the finished/failed event."""
+        if self.route_handler is not None:
+            route = FakeRoute(request)
+            await self.route_handler(route)
+            if route.outcome == "aborted":
+                # Playwright reports aborted requests as failed too
+                self.listeners["requestfailed"](request)
+                return
+        self.listeners["requestfailed" if failed else "requestfinished"](request)
+
+
+def test_default_profile_blocks_resources_and_trackers():
+    """Test the lean profile's resource-type and URL-pattern rules."""
+    print("Testing default blocking rules...")
+    profile = profile_from_env()
+
+    for resource_type in ("image", "media", "font", "stylesheet"):
+        assert profile.should_block(resource_type, "https://beaconbio.org/asset"), resource_type
+    for resource_type in ("document", "script", "xhr", "fetch"):
+        assert not profile.should_block(resource_type, "https://beaconbio.org/api/events"), resource_type
+
+    assert profile.should_block("script", "https://www.googletagmanager.com/gtm.js")
+    assert profile.should_block("xhr", "https://A.TILE.OPENSTREETMAP.ORG/3/4/2.png"), "Patterns ignore case"
+    assert profile.should_block("fetch", "https://beaconbio.org/tiles/3/4/2.pbf")
+    assert not profile.should_block("fetch", "https://beaconbio.org/api/tilesets-info"), "Only /tile/ paths"
+
+    print("  [OK] Static resources, analytics and map tiles blocked; documents and API calls kept")
+
+
+def test_profile_environment_overrides():
+    """Test the full profile and custom block lists from the environment."""
+    print("\nTesting profile overrides...")
+    full = profile_from_env(BEACON_RENDER_PROFILE="full")
+    assert not full.blocks_anything
+    assert not full.should_block("image", "https://www.google-analytics.com/collect")
+
+    custom = profile_from_env(BEACON_BLOCK_RESOURCE_TYPES="Image, font", BEACON_BLOCK_URL_PATTERNS=r"cdn\.example\.org")
+    assert custom.should_block("image", "https://beaconbio.org/logo.png"), "Configured types are case-insensitive"
+    assert not custom.should_block("stylesheet", "https://beaconbio.org/site.css")
+    assert custom.should_block("script", "https://cdn.example.org/lib.js")
+    assert not custom.should_block("script", "https://www.googletagmanager.com/gtm.js"), "Custom list replaces defaults"
+
+    types_only = profile_from_env(BEACON_BLOCK_URL_PATTERNS="")
+    assert types_only.blocked_url_re is None and types_only.should_block("font", "https://beaconbio.org/f.woff2")
+
+    print("  [OK] 'full' blocks nothing, custom lists replace the defaults")
+
+
+def test_request_log_summary_counts():
+    """Test that blocked requests are counted apart from real requests and failures."""
+    print("\nTesting request log summary...")
+    page = FakePage()
+    request_log = asyncio.run(profile_from_env().apply(page))
+
+    async def load_page():
+        await page.load(FakeRequest("https://beaconbio.org/en/events", "document", response_end=120.04))
+        await page.load(FakeRequest("https://beaconbio.org/api/events", "xhr", response_end=480.0))
+        await page.load(FakeRequest("https://beaconbio.org/api/slow", "fetch", response_end=900.0))
+        await page.load(FakeRequest("https://beaconbio.org/api/broken", "fetch"), failed=True)
+        await page.load(FakeRequest("https://beaconbio.org/logo.png", "image", response_end=50.0))
+        await page.load(FakeRequest("https://www.google-analytics.com/collect", "xhr", response_end=70.0))
+
+    asyncio.run(load_page())
+    summary = request_log.summary(slowest=2)
+
+    assert summary["requests"] == 4, f"Blocked requests must not be logged: {summary}"
+    assert summary["blocked"] == 2
+    assert summary["failed"] == 1, "Aborted requests are not failures"
+    assert summary["total_request_ms"] == 1500.0
+    assert [entry["url"] for entry in summary["slowest"]] == [
+        "https://beaconbio.org/api/slow", "https://beaconbio.org/api/events",
+    ]
+    assert request_log.entries[0]["duration_ms"] == 120.0
+
+    print("  [OK] 4 requests, 2 blocked, 1 failed, slowest first")
+
+
+def run_all_tests():
+    """Run all render profile tests."""
+    print("=" * 60)
+    print("Render Profile Tests")
+    print("=" * 60)
+
+    try:
+        test_default_profile_blocks_resources_and_trackers()
+        test_profile_environment_overrides()
+        test_request_log_summary_counts()
+
+        print("\n" + "=" * 60)
+        print("All tests passed!")
+        print("=" * 60)
+        return True
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,39 @@
+"""
+Shared helpers for the backend test scripts.
+
+Usage:
+    from testing_helpers import FakeNominatim, make_session
+
+    db = make_session()
+    fake = FakeNominatim({"Malindi, Kenya": (-3.22, 40.12)})
+"""
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.services import geocoding_service
+
+
+def make_session():
+    """Create an isolated in-memory database session with an empty geocode memory cache."""
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    geocoding_service.memory_cache.clear()
+    return sessionmaker(bind=engine)()
+
+
+class FakeNominatim(geocoding_service.GeocoderBackend):
+    """Records queries instead of calling the Nominatim API."""
+
+    name = "fake"
+
+    def __init__(self, known=None):
+        self.known = known or {}
+        self.queries = []
+
+    def geocode(self, query):
+        self.queries.append(query)
+        return self.known.get(query)